@@ -1,3 +1,26 @@
-from stl.obj.signal import Signal
-from stl.obj.stl import STL
-import stl.obj.util as util
\ No newline at end of file
+# the public objects are imported on first access (PEP 562), thus "import stl" does not import the parser
+import importlib
+
+lazy_attributes = {"Signal": ("stl.obj.signal", "Signal"),
+                   "STL": ("stl.obj.stl", "STL"),
+                   "Spec_Set": ("stl.obj.spec_set", "Spec_Set"),
+                   "util": ("stl.obj.util", None)}
+
+__all__ = list(lazy_attributes)
+
+
+def __getattr__(name):
+    if name not in lazy_attributes:
+        raise AttributeError("module \"stl\" has no attribute \"" + name + "\"")
+
+    module_name, attribute_name = lazy_attributes[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute_name is None else getattr(module, attribute_name)
+
+    # cache the attribute in the module, later accesses do not call __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,13 @@
+# Mon Oct 19 01:20:44 EDT 2026
+# benchmark suite of the lexer, the parser, the signal and the evaluation of the STL operators
+#
+# Usage:
+#     $ python3 -m stl.bench                                  # run, print the results
+#     $ python3 -m stl.bench --max-size 10000000              # signal lengths from 10^2 to 10^7
+#     $ python3 -m stl.bench --output results.json            # machine-readable results
+#     $ python3 -m stl.bench --save-baseline                  # store the results as the baseline
+#     $ python3 -m stl.bench --baseline --threshold 0.1       # fail on a regression of more than 10%
+
+from stl.bench.runner import Benchmark, Benchmark_Result, Comparison, measure, run, compare, \
+    dump_results, load_results
+from stl.bench.suite import benchmarks
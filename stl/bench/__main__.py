@@ -0,0 +1,82 @@
+# Mon Oct 19 01:20:44 EDT 2026
+# command line entry point of the benchmark suite, see stl/bench/__init__.py
+
+import argparse
+import os
+import sys
+
+import stl.tool as tool
+from stl.bench.runner import run, compare, dump_results, load_results, format_result, format_comparisons
+from stl.bench.suite import benchmarks, SIZES
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def parse_args(argv=None):
+    arg_parser = argparse.ArgumentParser(prog="stlbench", description="benchmark suite of STL API")
+    arg_parser.add_argument("-k", "--filter", help="only run the benchmarks whose names contain the pattern")
+    arg_parser.add_argument("--sizes", type=lambda sizes: [int(size) for size in sizes.split(",")],
+                            help="comma-separated sizes, overrides --max-size")
+    arg_parser.add_argument("--max-size", type=int, default=10 ** 5,
+                            help="largest signal length among 10^2 to 10^7 (default: 10^5)")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="number of repetitions (default: 5)")
+    arg_parser.add_argument("--min-time", type=float, default=0.05,
+                            help="minimum time of a repetition in seconds (default: 0.05)")
+    arg_parser.add_argument("-o", "--output", help="write the results to a JSON file")
+    arg_parser.add_argument("--save-baseline", action="store_true",
+                            help="write the results to the stored baseline (" + DEFAULT_BASELINE + ")")
+    arg_parser.add_argument("--baseline", nargs="?", const=DEFAULT_BASELINE,
+                            help="compare against the baseline results (the stored baseline by default)")
+    arg_parser.add_argument("--threshold", type=float, default=0.1,
+                            help="relative slowdown reported as a regression (default: 0.1)")
+    arg_parser.add_argument("--list", action="store_true", help="list the benchmarks")
+
+    return arg_parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """run the benchmarks, return 1 when a benchmark regressed against the baseline, 2 when the baseline does
+    not exist"""
+    args = parse_args(argv)
+
+    if args.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+
+    if args.baseline is not None and not os.path.isfile(args.baseline):
+        if args.baseline == DEFAULT_BASELINE:
+            tool.print_error("No stored baseline, run with --save-baseline first")
+        else:
+            tool.print_error("Baseline " + args.baseline + " does not exist")
+        return 2
+
+    sizes = args.sizes if args.sizes is not None else [size for size in SIZES if size <= args.max_size]
+    baseline = load_results(args.baseline) if args.baseline is not None else None
+
+    print("{:<36} {:>10} {:>14} {:>14}".format("benchmark", "size", "best", "median"))
+    results = run(benchmarks, sizes, args.repeat, args.min_time, args.filter,
+                  callback=lambda result: print(format_result(result), flush=True))
+
+    for path in [args.output] + [DEFAULT_BASELINE] * args.save_baseline:
+        if path is not None:
+            dump_results(results, path)
+
+    if baseline is not None:
+        comparisons = compare(results, baseline, args.threshold)
+        print()
+        print(format_comparisons(comparisons))
+
+        regressions = [comparison for comparison in comparisons if comparison.regression]
+        if regressions:
+            tool.print_error(str(len(regressions)) + " benchmark(s) regressed by more than " +
+                             str(round(100 * args.threshold)) + "%")
+            return 1
+
+        tool.print_success("No regression against the baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+# Mon Oct 19 01:20:44 EDT 2026
+# time the benchmarks, store the results as JSON and compare them against a baseline
+
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Optional
+
+import stl.error as error
+from stl.tool import String_Builder
+
+RESULT_VERSION = 1
+
+
+class Benchmark:
+    """a benchmark, timed for every size (signal length or expression size)
+
+    Attributes:
+        name: unique name of the benchmark, e.g. "eval.G[numpy]"
+        setup: build the input of the given size (not timed), return the function to be timed
+        max_size: the largest size the benchmark is run with (None for no limit)
+
+    Usage:
+        >>> Benchmark("signal.lookup", lambda size: lambda: build_signal(size).lookup("x"))
+    """
+
+    def __init__(self, name: str, setup: Callable[[int], Callable[[], Any]], max_size: Optional[int] = None):
+        self.name = name
+        self.setup = setup
+        self.max_size = max_size
+
+
+class Benchmark_Result:
+    """timing of a benchmark for one size
+
+    Attributes:
+        name: name of the benchmark
+        size: signal length or expression size
+        number: number of calls per timing
+        times: time per call in seconds, for each repetition
+    """
+
+    def __init__(self, name: str, size: int, number: int, times: list[float]):
+        self.name = name
+        self.size = size
+        self.number = number
+        self.times = times
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return self.name, self.size
+
+    @property
+    def best(self) -> float:
+        """the fastest repetition, the least disturbed by the other processes"""
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "size": self.size, "number": self.number, "best": self.best,
+                "median": self.median, "times": self.times}
+
+    @staticmethod
+    def from_dict(result: dict) -> "Benchmark_Result":
+        return Benchmark_Result(result["name"], result["size"], result["number"], result["times"])
+
+
+class Comparison:
+    """timing of a benchmark against the baseline, ratio > 1 means slower than the baseline"""
+
+    def __init__(self, result: Benchmark_Result, baseline: Optional[Benchmark_Result], threshold: float):
+        self.result = result
+        self.baseline = baseline
+        self.threshold = threshold
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline is None:
+            return None
+        return self.result.best / self.baseline.best
+
+    @property
+    def regression(self) -> bool:
+        return self.ratio is not None and self.ratio > 1 + self.threshold
+
+    @property
+    def improvement(self) -> bool:
+        return self.ratio is not None and self.ratio < 1 / (1 + self.threshold)
+
+
+def measure(function: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> tuple[int, list[float]]:
+    """time the function, return the number of calls per repetition and the time per call of each repetition
+
+    the first call (not counted) calibrates the number of calls, such that each repetition takes at least
+    min_time seconds. functions slower than min_time are called once per repetition.
+    """
+    begin_time = time.perf_counter()
+    function()
+    elapsed_time = time.perf_counter() - begin_time
+
+    number = max(1, int(min_time / elapsed_time)) if elapsed_time > 0 else 1000
+    times = list()
+
+    for _ in range(repeat):
+        begin_time = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - begin_time) / number)
+
+    return number, times
+
+
+def run(benchmarks: list[Benchmark], sizes: list[int], repeat: int = 5, min_time: float = 0.05,
+        pattern: Optional[str] = None, callback: Optional[Callable[[Benchmark_Result], None]] = None) \
+        -> list[Benchmark_Result]:
+    """run the benchmarks for every size, the benchmarks are selected by the substring pattern of their names
+
+    Args:
+        callback: called with each result as soon as it is measured (e.g. to print the progress)
+    """
+    results = list()
+
+    for benchmark in benchmarks:
+        if pattern is not None and pattern not in benchmark.name:
+            continue
+
+        for size in sizes:
+            if benchmark.max_size is not None and size > benchmark.max_size:
+                continue
+
+            number, times = measure(benchmark.setup(size), repeat, min_time)
+            result = Benchmark_Result(benchmark.name, size, number, times)
+            results.append(result)
+
+            if callback is not None:
+                callback(result)
+
+    return results
+
+
+def compare(results: list[Benchmark_Result], baseline: list[Benchmark_Result], threshold: float) \
+        -> list[Comparison]:
+    """compare the results with the baseline results of the same benchmark and size
+
+    Args:
+        threshold: relative slowdown tolerated, e.g. 0.1 for 10%
+    """
+    baseline_results = {result.key: result for result in baseline}
+    return [Comparison(result, baseline_results.get(result.key), threshold) for result in results]
+
+
+def dump_results(results: list[Benchmark_Result], path: str) -> None:
+    """write the results to a JSON file, along with the versions of the interpreter and the platform"""
+    with open(path, "w") as file:
+        json.dump({"version": RESULT_VERSION,
+                   "python": sys.version.split()[0],
+                   "platform": platform.platform(),
+                   "results": [result.to_dict() for result in results]}, file, indent=2)
+        file.write("\n")
+
+
+def load_results(path: str) -> list[Benchmark_Result]:
+    with open(path, "r") as file:
+        content = json.load(file)
+
+    if content.get("version") != RESULT_VERSION:
+        raise error.STL_Error("Benchmark results " + path + " have an unsupported version " +
+                              str(content.get("version")))
+
+    return [Benchmark_Result.from_dict(result) for result in content["results"]]
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return "{:.3f} {}".format(seconds / scale, unit)
+    return "{:.1f} ns".format(seconds / 1e-9)
+
+
+def format_result(result: Benchmark_Result) -> str:
+    return "{:<36} {:>10} {:>14} {:>14}".format(result.name, result.size, format_time(result.best),
+                                                format_time(result.median))
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    sb = String_Builder()
+    sb.append("{:<36} {:>10} {:>14} {:>14} {:>8}".format("benchmark", "size", "baseline", "best", "ratio"))
+
+    for comparison in comparisons:
+        if comparison.baseline is None:
+            baseline, ratio, status = "-", "-", "new"
+        else:
+            baseline, ratio = format_time(comparison.baseline.best), "{:.2f}".format(comparison.ratio)
+            status = "REGRESSION" if comparison.regression else "faster" if comparison.improvement else ""
+
+        sb.append("\n")
+        sb.append("{:<36} {:>10} {:>14} {:>14} {:>8}  {}".format(
+            comparison.result.name, comparison.result.size, baseline, format_time(comparison.result.best),
+            ratio, status).rstrip())
+
+    return str(sb)
@@ -0,0 +1,125 @@
+# Mon Oct 19 01:20:44 EDT 2026
+# the benchmarks: lexer, parser, signal construction, lookup, slicing, JSON serialization and the evaluation of
+# G, F, X, chain comparison, logic and arithmetic expressions by every engine
+
+import functools
+
+from stl.bench.runner import Benchmark
+from stl.obj.signal import Signal
+from stl.obj.stl import STL
+from stl.obj.spec_set import Spec_Set
+from stl.parsing.lexer import get_lexer
+from stl.parsing.parser import get_parser
+
+# signal lengths, the operators are evaluated over the entire signal
+SIZES = [10 ** exponent for exponent in range(2, 8)]
+
+# STL expressions of the operator benchmarks, {end} is the last index of the signal
+OPERATOR_EXPRS = {"G": "G[0, {end}](x > -5)",
+                  "F": "F[0, {end}](x > 5)",
+                  "X": "X[{before_end}](x > 0)",
+                  "chain": "G[0, {end}](0 <= y < 5)",
+                  "logic": "G[0, {end}]((x > -5) && (y < 5))",
+                  "arith": "G[0, {end}]((x + y * 2) > -5)"}
+
+ENGINES = ("reference", "numpy", "compiled")
+
+# number of STL expressions of the batch benchmark
+SPEC_SET_SIZE = 100
+
+# the lexer and parser benchmarks are sized by the number of comparisons of the expression
+EXPR_MAX_SIZE = 10 ** 4
+
+
+@functools.lru_cache(maxsize=2)
+def build_py_dict(size: int) -> dict:
+    """signal of the given length in the dictionary layout, shared by the benchmarks (never modified)"""
+    return {str(i): {"content": {"x": i % 7 - 3, "y": i % 5}} for i in range(size)}
+
+
+@functools.lru_cache(maxsize=4)
+def build_signal(size: int, storage: str = "dict") -> Signal:
+    return Signal(py_dict=build_py_dict(size), storage=storage)
+
+
+def build_expr(size: int) -> str:
+    """conjunction of the given number of comparisons"""
+    return " && ".join("(x" + str(i) + " > " + str(i) + ")" for i in range(size))
+
+
+def setup_lex(size: int):
+    lexer = get_lexer()
+    expr = build_expr(size)
+
+    # the token stream of rply is lazy, thus it is consumed
+    return lambda: sum(1 for _ in lexer.lex(expr))
+
+
+def setup_parse(size: int):
+    lexer, parser = get_lexer(), get_parser()
+    tokens = list(lexer.lex(build_expr(size)))
+
+    return lambda: parser.parse(iter(tokens))
+
+
+def setup_construct(storage: str):
+    def setup(size: int):
+        py_dict = build_py_dict(size)
+        return lambda: Signal(py_dict=py_dict, storage=storage)
+
+    return setup
+
+
+def setup_lookup(size: int):
+    signal = build_signal(size)
+    return lambda: signal.lookup("x")
+
+
+def setup_get(size: int):
+    signal = build_signal(size)
+    return lambda: signal.get(0, size // 2)
+
+
+def setup_json(size: int):
+    signal = build_signal(size)
+    return lambda: str(signal)
+
+
+def setup_eval(operator: str, engine: str):
+    def setup(size: int):
+        signal = build_signal(size)
+        stl_expr = STL(OPERATOR_EXPRS[operator].format(end=size - 1, before_end=size - 2))
+
+        if engine == "compiled":
+            compiled_stl = stl_expr.compile()
+            return lambda: compiled_stl.eval(0, signal)
+
+        return lambda: stl_expr.eval(0, signal, engine=engine)
+
+    return setup
+
+
+def setup_spec_set(size: int):
+    signal = build_signal(size)
+    spec_set = Spec_Set()
+
+    # the operator expressions, with windows covering 10% to 100% of the signal
+    for i in range(SPEC_SET_SIZE):
+        operator = list(OPERATOR_EXPRS)[i % len(OPERATOR_EXPRS)]
+        end = max(1, (size - 1) * (i % 10 + 1) // 10)
+        spec_set.add(OPERATOR_EXPRS[operator].format(end=end, before_end=end - 1))
+
+    return lambda: spec_set.eval(0, signal)
+
+
+benchmarks: list[Benchmark] = [
+    Benchmark("lexer.lex", setup_lex, max_size=EXPR_MAX_SIZE),
+    Benchmark("parser.parse", setup_parse, max_size=EXPR_MAX_SIZE),
+    Benchmark("signal.construct[dict]", setup_construct("dict")),
+    Benchmark("signal.construct[columnar]", setup_construct("columnar")),
+    Benchmark("signal.lookup", setup_lookup),
+    Benchmark("signal.get", setup_get),
+    Benchmark("signal.json", setup_json),
+] + [Benchmark("eval." + operator + "[" + engine + "]", setup_eval(operator, engine))
+     for operator in OPERATOR_EXPRS for engine in ENGINES] + [
+    Benchmark("eval.spec_set", setup_spec_set)]
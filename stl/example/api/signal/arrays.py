@@ -0,0 +1,64 @@
+# Sun Oct 18 21:58:03 EDT 2026
+
+import numpy as np
+
+from stl import Signal, STL
+
+# sample Python program to demonstrate building signals from NumPy arrays (and data frames)
+
+x = np.array([1.0, 2.0, 3.0])
+z = np.array([2, 1, 0])
+
+signal = Signal.from_arrays({"y.z": z}, x=x)
+signal_dict = Signal(py_dict={"0": {"content": {"y": {"z": 2}, "x": 1.0}},
+                              "1": {"content": {"y": {"z": 1}, "x": 2.0}},
+                              "2": {"content": {"y": {"z": 0}, "x": 3.0}}})
+
+assert signal.storage.name == "columnar"
+assert signal.json == signal_dict.json
+assert signal.lookup("y") == [{"z": 2}, {"z": 1}, {"z": 0}]
+
+# the arrays are wrapped without copying
+assert np.shares_memory(signal.storage.columns["x"], x)
+assert np.shares_memory(signal.column("x"), x)
+
+# STL expressions are evaluated the same way
+stl_spec = STL("G[0, 1](x > y.z)")
+assert stl_spec.robustness(1, signal) == stl_spec.robustness(1, signal_dict) == 1.0
+
+# to_arrays returns (read-only) views of the columns
+arrays = signal.to_arrays()
+assert np.shares_memory(arrays["x"], x) and not arrays["x"].flags.writeable
+assert arrays["y.z"].tolist() == [2, 1, 0]
+assert Signal.from_arrays(signal_dict.to_arrays()).json == signal_dict.json
+
+# appending copies the arrays first
+signal.append(py_dict={"x": 4.0, "y": {"z": -1}})
+assert signal.lookup("x") == [1.0, 2.0, 3.0, 4.0]
+assert x.tolist() == [1.0, 2.0, 3.0]
+
+# masked entries are missing entries (and vice versa)
+signal_masked = Signal.from_arrays(x=np.ma.MaskedArray([1.0, 2.0, 3.0], mask=[False, True, False]))
+assert signal_masked.lookup("x") == [1.0, None, 3.0]
+signal_masked.append(py_dict={"y": 0})
+assert signal_masked.to_arrays()["x"].mask.tolist() == [False, True, False, True]
+
+# arrays must be one-dimensional and have the same length
+for invalid_arrays in [{"x": np.zeros((2, 2))}, {"x": np.zeros(2), "y": np.zeros(3)}]:
+    try:
+        Signal.from_arrays(invalid_arrays)
+        raise AssertionError("building a signal from invalid arrays should fail")
+    except Exception as e:
+        assert type(e).__name__ == "Signal_Error"
+
+# data frames are duck typed (columns attribute and column access by name)
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+if pandas is not None:
+    dataframe = pandas.DataFrame({"x": x, "y": z})
+    signal_dataframe = Signal.from_dataframe(dataframe)
+    assert signal_dataframe.lookup("y") == [2, 1, 0]
+    assert np.shares_memory(signal_dataframe.storage.columns["x"], dataframe["x"].to_numpy())
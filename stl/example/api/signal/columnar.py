@@ -0,0 +1,50 @@
+# Sun Oct 18 10:21:37 EDT 2026
+
+from stl import Signal, STL
+
+# sample Python program to demonstrate the columnar storage engine of the Signal api
+# note that the columnar signal supports the same api as the default (dictionary) signal
+
+py_dict = {"0": {"content": {"x": 1, "y": {"z": 2}}},
+           "1": {"content": {"x": 2, "y": {"z": 1}}}}
+
+signal_dict = Signal(py_dict=py_dict)
+signal_columnar = Signal(py_dict=py_dict, storage="columnar")
+
+assert signal_columnar.storage.name == "columnar"
+assert len(signal_columnar) == len(signal_dict)
+assert signal_columnar.json == signal_dict.json
+assert signal_columnar.lookup("y.z") == signal_dict.lookup("y.z") == [2, 1]
+assert signal_columnar.lookup("y") == [{"z": 2}, {"z": 1}]
+assert signal_columnar.get(1, 1).json == signal_dict.get(1, 1).json
+
+# appending new elements
+signal_dict.append(json_str='{"x": 3, "y": {"z": 0}}')
+signal_columnar.append(json_str='{"x": 3, "y": {"z": 0}}')
+assert signal_columnar.json == signal_dict.json
+assert signal_columnar.lookup("x", begin_time=1, end_time=2) == [2, 3]
+
+# samples missing a key are recorded in the validity mask
+signal_columnar.append(py_dict={"x": 4})
+assert signal_columnar.lookup("y.z") == [2, 1, 0, None]
+assert signal_columnar.get_quantifiable_keys() == ["x"]
+
+# booleans mixed with numbers are not stored as 0 and 1
+for py_dict_mixed in [{"0": {"content": {"v": 1}}, "1": {"content": {"v": True}}},
+                      {"0": {"content": {"v": False}}, "1": {"content": {"v": 2}}},
+                      {"0": {"content": {"v": 0.5}}, "1": {"content": {"v": True}}}]:
+    signal_mixed = Signal(py_dict=py_dict_mixed, storage="columnar")
+    assert [type(value) for value in signal_mixed.lookup("v")] == \
+           [type(value) for value in Signal(py_dict=py_dict_mixed).lookup("v")]
+    assert signal_mixed.json == Signal(py_dict=py_dict_mixed).json
+
+# 8 bytes per sample for each numeric key (arrays are over-allocated by at most 2x while appending)
+signal_long = Signal(storage="columnar")
+for i in range(1000):
+    signal_long.append(py_dict={"x": i, "y": 0.5 * i})
+assert signal_long.storage.nbytes <= 2 * (8 + 8) * len(signal_long)
+
+# STL expressions are evaluated the same way
+stl_spec = STL("G[0, 1](x < y.z)")
+assert stl_spec.satisfy(0, signal_columnar) == stl_spec.satisfy(0, Signal(py_dict=py_dict))
+assert stl_spec.robustness(0, signal_columnar) == -1.0
@@ -0,0 +1,61 @@
+# Sun Oct 18 20:31:12 EDT 2026
+
+import os
+import tempfile
+
+from stl import Signal, STL
+
+# sample Python program to demonstrate the binary signal file format of the Signal api
+
+py_dict = {"0": {"content": {"x": 1, "y": {"z": 2.5}, "ok": True, "mode": "on"}},
+           "1": {"content": {"x": 2, "y": {"z": 1.5}, "ok": False, "mode": "off"}},
+           "2": {"content": {"x": 3, "ok": True, "mode": "on"}}}
+
+signal = Signal(py_dict=py_dict)
+
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "signal.stlsig")
+
+    # both storage engines are saved to the same columnar layout
+    signal.save(path)
+    Signal(py_dict=py_dict, storage="columnar").save(path)
+
+    for mmap in [True, False]:
+        signal_opened = Signal.open(path, mmap=mmap)
+
+        assert signal_opened.storage.name == "columnar"
+        assert len(signal_opened) == 3
+        assert signal_opened.json == signal.json
+        assert signal_opened.lookup("y.z") == [2.5, 1.5, None]
+        assert signal_opened.lookup("x", begin_time=1, end_time=2) == [2, 3]
+        assert signal_opened.lookup("mode") == ["on", "off", "on"]
+
+        # STL expressions are evaluated the same way
+        stl_spec = STL("G[0, 1](x > 0)")
+        assert stl_spec.robustness(0, signal_opened) == stl_spec.robustness(0, signal) == 1.0
+
+        # appending copies the memory-mapped columns, the file is left untouched
+        signal_opened.append(py_dict={"x": 4, "y": {"z": 0.5}, "ok": False, "mode": "idle"})
+        assert signal_opened.lookup("x") == [1, 2, 3, 4]
+        assert signal_opened.lookup("mode") == ["on", "off", "on", "idle"]
+        assert len(Signal.open(path, mmap=mmap)) == 3
+        del signal_opened
+
+    # a long signal, only the pages holding the looked up range are read
+    signal_long = Signal(storage="columnar")
+    for i in range(100000):
+        signal_long.append(py_dict={"x": i, "y": 0.5 * i})
+    signal_long.save(path)
+
+    signal_mapped = Signal.open(path)
+    assert signal_mapped.lookup("x", begin_time=70000, end_time=70002) == [70000, 70001, 70002]
+    assert signal_mapped.lookup("y", begin_time=99999, end_time=99999) == [49999.5]
+    assert STL("F[0, 3](x > 99997)").satisfy(99995, signal_mapped)
+    del signal_mapped
+
+    # entries other than numbers, booleans and strings cannot be saved
+    try:
+        Signal(py_dict={"0": {"content": {"x": [1, 2]}}}).save(path)
+        raise AssertionError("saving a list entry should fail")
+    except Exception as e:
+        assert type(e).__name__ == "Signal_Error"
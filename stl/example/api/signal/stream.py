@@ -0,0 +1,73 @@
+# Sun Oct 18 21:24:50 EDT 2026
+
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+
+from stl import Signal
+
+# sample Python program to demonstrate the streaming ingestion of the Signal api
+
+py_dict = {"0": {"content": {"x": 1, "y": {"z": 2}}},
+           "1": {"content": {"x": 2, "y": {"z": 1}}},
+           "2": {"content": {"x": 3, "y": {"z": 0}}}}
+signal = Signal(py_dict=py_dict)
+
+# newline-delimited JSON, from an iterable of lines (blank lines are skipped)
+ndjson_lines = ['{"x": 1, "y": {"z": 2}}', '', '{"x": 2, "y": {"z": 1}}\n', b'{"x": 3, "y": {"z": 0}}']
+assert Signal.from_ndjson(ndjson_lines).json == signal.json
+assert Signal.from_ndjson(ndjson_lines, storage="columnar").lookup("y.z") == [2, 1, 0]
+
+# the {"0": {"content": ...}} layout, read incrementally (even with chunks smaller than a sample)
+for chunk_size in [1, 7, 1 << 16]:
+    signal_read = Signal.from_json(io.StringIO(json.dumps(py_dict, indent=4)), chunk_size=chunk_size)
+    assert signal_read.json == signal.json
+
+assert len(Signal.from_json(io.StringIO(" { } "))) == 0
+
+# binary streams are decoded incrementally, the multibyte characters may straddle two chunks
+py_dict_utf8 = {"0": {"content": {"x": 1, "é": "café"}}, "1": {"content": {"x": 2, "é": "crème brûlée"}}}
+for chunk_size in [1, 2, 3, 5]:
+    signal_read = Signal.from_json(io.BytesIO(json.dumps(py_dict_utf8, ensure_ascii=False).encode("utf-8")),
+                                   chunk_size=chunk_size)
+    assert signal_read.json == Signal(py_dict=py_dict_utf8).json
+
+# extend appends the elements of any iterable
+signal_extended = Signal(storage="columnar")
+signal_extended.extend({"x": i} for i in range(5))
+assert signal_extended.lookup("x") == [0, 1, 2, 3, 4]
+
+# the indices must be continuous and in order
+for invalid_json in ['{"1": {"content": {"x": 0}}}', '{"0": {"content": {"x": 0}}, "2": {"content": {"x": 0}}}',
+                     '{"0": {"content": {"x": 0}}', '{"0": {"x": 0}}']:
+    try:
+        Signal.from_json(io.StringIO(invalid_json))
+        raise AssertionError("reading an invalid signal should fail")
+    except Exception as e:
+        assert type(e).__name__ == "Signal_Error"
+
+# a long signal from files, the dictionary tree is never held in memory at once
+length = 20000
+with tempfile.TemporaryDirectory() as directory:
+    json_path = os.path.join(directory, "signal.json")
+    ndjson_path = os.path.join(directory, "signal.ndjson")
+
+    with open(json_path, "w") as json_file:
+        json.dump({str(i): {"content": {"x": i, "y": {"z": 0.5 * i}}} for i in range(length)}, json_file)
+
+    with open(ndjson_path, "w") as ndjson_file:
+        for i in range(length):
+            ndjson_file.write(json.dumps({"x": i, "y": {"z": 0.5 * i}}) + "\n")
+
+    for read_signal in [lambda: Signal.from_json(json_path, storage="columnar"),
+                        lambda: Signal.from_ndjson(ndjson_path, storage="columnar")]:
+        tracemalloc.start()
+        signal_long = read_signal()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert len(signal_long) == length
+        assert signal_long.lookup("y.z", begin_time=length - 1) == [0.5 * (length - 1)]
+        assert peak_memory < 3 * signal_long.storage.nbytes
@@ -0,0 +1,79 @@
+# Sun Oct 18 22:47:19 EDT 2026
+
+import io
+import os
+import tempfile
+
+import numpy as np
+
+from stl import Signal, STL
+
+# sample Python program to demonstrate timestamped (non-uniformly sampled) signals
+# the times of lookups and of the time intervals of STL expressions are timestamps
+
+timestamps = [0.0, 0.4, 1.1, 1.5, 2.0, 3.7, 4.0]
+x = [1, 2, -1, 3, 4, 5, 0]
+
+py_dict = {str(i): {"timestamp": timestamp, "content": {"x": value}}
+           for i, (timestamp, value) in enumerate(zip(timestamps, x))}
+signal = Signal(py_dict=py_dict)
+
+assert signal.timestamps == timestamps
+assert Signal(py_dict={str(i): {"content": {"x": value}} for i, value in enumerate(x)},
+              timestamps=timestamps).json == signal.json
+
+# time ranges are resolved to index ranges by binary search
+assert signal.index_range(0.5, 2.0) == (2, 4)
+assert signal.lookup("x", begin_time=0.5, end_time=2.0) == [-1, 3, 4]
+assert signal.lookup("x", begin_time=3.0) == [5, 0]
+assert signal.get(0.4, 1.5).timestamps == [0.4, 1.1, 1.5]
+
+# G[0, 1] at time 0.4 covers the elements within [0.4, 1.4]
+stl_spec = STL("G[0, 1](x > 0)")
+assert stl_spec.robustness(0.4, signal) == -1.0
+assert stl_spec.robustness(2.0, signal) == 4.0
+assert STL("F[0.3, 1.0](x > 3)").robustness(0.4, signal) == -4.0
+
+# (x > 0) U[0.5, 2] (x > 2) at time 2.0, x = 5 at time 3.7 is within [2.5, 4.0]
+until_spec = STL("(x > 0) U[0.5, 2] (x > 2)")
+assert until_spec.robustness(2.0, signal) == 3.0
+assert until_spec.robustness(0.0, signal) == -1.0
+
+# the compiled STL expressions give the same results
+for spec in [stl_spec, until_spec]:
+    for time in [0.0, 0.4, 2.0]:
+        assert spec.compile().robustness(time, signal) == spec.robustness(time, signal)
+
+# a time interval without any element cannot be evaluated
+try:
+    STL("G[0.3, 0.6](x > 0)").eval(2.0, signal)
+    raise AssertionError("evaluating an empty time interval should fail")
+except Exception as e:
+    assert type(e).__name__ == "Signal_Error"
+
+# appending requires strictly increasing timestamps
+signal.append(py_dict={"x": 9}, timestamp=5.0)
+assert signal.lookup("x", begin_time=4.5, end_time=10.0) == [9]
+
+for timestamp in [None, 5.0]:
+    try:
+        signal.append(py_dict={"x": 9}, timestamp=timestamp)
+        raise AssertionError("appending without a larger timestamp should fail")
+    except Exception as e:
+        assert type(e).__name__ == "Signal_Error"
+
+# timestamps from arrays (kept without copying), files and streams
+signal_arrays = Signal.from_arrays(x=np.array(x), timestamps=np.array(timestamps))
+assert signal_arrays.index_range(0.5, 2.0) == (2, 4)
+assert stl_spec.robustness(0.4, signal_arrays) == -1.0
+
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "signal.stlsig")
+    signal_arrays.save(path)
+    signal_mapped = Signal.open(path)
+    assert signal_mapped.timestamps.tolist() == timestamps
+    assert stl_spec.robustness(2.0, signal_mapped) == 4.0
+    del signal_mapped
+
+assert Signal.from_json(io.StringIO(signal.json)).json == signal.json
+assert Signal.from_ndjson(['{"t": 0.0, "x": 1}', '{"t": 0.5, "x": 2}'], timestamp_key="t").timestamps == [0.0, 0.5]
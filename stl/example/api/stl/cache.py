@@ -0,0 +1,41 @@
+# Sun Oct 18 19:40:12 EDT 2026
+
+from stl import STL, Signal
+
+# sample Python program to demonstrate the process-wide parse cache of STL expressions
+# note that STL objects created from the same expression text share the parsed and type checked AST
+
+signal = Signal(py_dict={"0": {"content": {"x": 0.5}}, "1": {"content": {"x": 2}}})
+
+STL.parse_cache.clear()
+
+stl_spec = STL("G[0, 1](0 < x < 1)")
+assert STL.parse_cache.misses == 1
+
+# whitespaces are normalized
+stl_spec_copy = STL("  G[0, 1](0 <  x < 1) ")
+assert STL.parse_cache.hits == 1
+assert stl_spec_copy.parsed_expr is stl_spec.parsed_expr
+assert stl_spec_copy.value == "  G[0, 1](0 <  x < 1) "
+
+# weakening does not modify the shared AST
+weakened_stl_spec = stl_spec.weaken("ap-range", 1, 2)
+assert weakened_stl_spec.satisfy(0, signal) == True
+assert STL("G[0, 1](0 < x < 1)").satisfy(0, signal) == False
+assert STL.parse_cache.hits == 2
+
+# the least recently used ASTs are evicted beyond the maximum size
+maxsize = STL.parse_cache.maxsize
+STL.parse_cache.maxsize = 1
+STL("F[0, 1](x > 1)")
+assert len(STL.parse_cache) == 1
+assert "G[0, 1](0 < x < 1)" not in STL.parse_cache
+STL.parse_cache.maxsize = maxsize
+
+# whitespaces within string literals are significant (a string literal spans the first to the last double quote
+# of a line, see the lexer)
+assert str(STL('"a  b" == "a  b"').eval(0, signal)) == '"a  b" == "a  b"'
+assert '"a b" == "a  b"' not in STL.parse_cache
+assert str(STL('"a b" == "a  b"').eval(0, signal)) == '"a b" == "a  b"'
+assert STL.parse_cache.normalize(' x  == "a  b"\n  ') == 'x == "a  b"'
+assert STL.parse_cache.normalize('"a"\n"b"') != STL.parse_cache.normalize('"a" "b"')
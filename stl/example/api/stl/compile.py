@@ -0,0 +1,40 @@
+# Sun Oct 18 18:47:02 EDT 2026
+
+from stl import STL, Signal
+
+# sample Python program to demonstrate the compilation of STL expressions to Python closures
+# note that compiled STL expressions return the same results as the reference interpreter
+
+content_list = [{"x": 1, "y": 2.5, "z": {"w": 0}}, {"x": -2, "y": 0.5, "z": {"w": 1}}, {"x": 3, "y": -1, "z": {"w": 1}},
+                {"x": 0, "y": 1.5, "z": {"w": 2}}, {"x": 2, "y": 0, "z": {"w": 0}}, {"x": -1, "y": 2, "z": {"w": 1}}]
+signal = Signal(py_dict={str(index): {"content": content} for index, content in enumerate(content_list)})
+
+stl_spec = STL("G[0, 1](x < y)")
+compiled_stl_spec = stl_spec.compile()
+assert compiled_stl_spec.compiled
+assert stl_spec.compile() is compiled_stl_spec  # compiled once
+
+stl_eval = compiled_stl_spec.eval(0, signal)
+print(stl_eval)
+assert stl_eval.satisfy == True
+assert stl_eval.robustness == 1.5
+assert compiled_stl_spec.robustness(1, signal) == -4.0
+
+# compare with the reference interpreter
+for stl_str in ["F[0, 2]((x * 2) > (y + 1))", "G[0, 2](0 <= x < (z.w + 2))", "X[1](x != y)",
+                "G[1, 2]((x > 0) || (!(y < 0)))", "(x > 0) U[0, 2] (y > 1)", "(x > 0) R[1, 2] (z.w == 1)",
+                "(x >= 0) W[0, 2] (y < 0)", "(y > 0) M[0, 2] (x > 0)"]:
+    stl_spec = STL(stl_str)
+    compiled_stl_spec = stl_spec.compile()
+    assert compiled_stl_spec.compiled
+
+    for time in range(3):
+        compiled_stl_eval = compiled_stl_spec.eval(time, signal)
+        stl_eval = stl_spec.eval(time, signal)
+        assert compiled_stl_eval.satisfy == stl_eval.satisfy
+        assert compiled_stl_eval.robustness == stl_eval.robustness
+
+# expressions without STL operators are evaluated by the reference interpreter
+compiled_stl_spec = STL("1 + 2").compile()
+assert not compiled_stl_spec.compiled
+assert compiled_stl_spec.eval(0, signal).value == 3
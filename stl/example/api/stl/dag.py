@@ -0,0 +1,65 @@
+# Mon Oct 19 03:47:26 EDT 2026
+
+from stl import Signal, STL
+import stl.parsing.dag as dag
+from stl.parsing.ast import Shared_Expr, Chain_Comp_Expr
+from stl.parsing.interpreter import Interpreter
+
+# sample Python program to demonstrate the common subexpression elimination of STL expressions
+# structurally identical subexpressions are merged into one node, evaluated once per time window
+
+x = [1, 3, -2, 4, 0, 5, 2, -1, 3, 6, 2, 1, -3, 4, 2, 0]
+signal = Signal(py_dict={str(i): {"content": {"x": value, "y": i % 4}} for i, value in enumerate(x)})
+
+stl_spec_list = ["G[0, 3](((x > 0) && (y < 3)) || (!((x > 0) && (y < 3))))",
+                 "((x > 0) && (y < 3)) U[0, 5] ((x > 0) && (y < 3))",
+                 "(x > -2) R[1, 4] ((x > -2) || (y >= 2))",
+                 "F[0, 6]((0 <= x < 3) && ((0 <= x < 3) || (y > 1)))"]
+
+for stl_str in stl_spec_list:
+    stl_expr = STL(stl_str)
+
+    # the shared subexpressions are wrapped into Shared_Expr nodes
+    shared_nodes = [node for node in dag.unique_nodes(stl_expr.parsed_expr) if isinstance(node, Shared_Expr)]
+    assert len(shared_nodes) > 0, stl_str
+
+    # the DAG is a copy of the AST as a tree
+    tree = dag.unshare(stl_expr.parsed_expr)
+    assert not any(isinstance(node, Shared_Expr) for node in dag.unique_nodes(tree))
+    assert str(tree) == str(stl_expr.parsed_expr)
+    assert len(dag.unique_nodes(tree)) > len(dag.unique_nodes(stl_expr.parsed_expr))
+
+    # sharing is idempotent
+    assert str(dag.share(stl_expr.parsed_expr)) == str(tree)
+
+    # same results as the tree, with every engine
+    Interpreter.type_check(tree)
+
+    for time_begin in [0, 4]:
+        tree_result = Interpreter(time_begin, signal).interpret(tree)
+
+        results = [stl_expr.eval(time_begin, signal, engine=engine) for engine in ["reference", "numpy"]] + \
+            [stl_expr.compile().eval(time_begin, signal)]
+
+        for result in results:
+            assert result.satisfy == tree_result.satisfy, stl_str
+            assert result.robustness == tree_result.robustness, stl_str
+
+# the shared subexpression is evaluated once for the window of G, and reused by the other parent
+profile = STL(stl_spec_list[0]).eval(0, signal, profile=True).profile
+shared_profile, = [p for p in profile.profiles if isinstance(p.node, Shared_Expr)]
+assert shared_profile.calls == 2
+assert profile.by_type()["Binary_Comp_Expr"]["calls"] == 2
+
+# the desugared form of a chained comparison is built once
+chain_comp = next(node for node in dag.unique_nodes(STL("G[0, 1](0 < x < 3)").parsed_expr)
+                  if isinstance(node, Chain_Comp_Expr))
+assert all(a is b for a, b in zip(chain_comp.desugar(), chain_comp.desugar()))
+
+# weakening modifies a copy of the AST, the DAG of the STL expression is left as is
+stl_expr = STL(stl_spec_list[0])
+parsed_expr_str = str(stl_expr.parsed_expr)
+weakened_stl_expr = stl_expr.weaken("time-range", 1, 1)
+assert str(stl_expr.parsed_expr) == parsed_expr_str
+assert str(weakened_stl_expr.parsed_expr) != str(stl_expr.parsed_expr)
+assert stl_expr.eval(0, signal).satisfy == STL(stl_spec_list[0]).eval(0, signal).satisfy
@@ -0,0 +1,64 @@
+# Sun Oct 18 11:40:26 EDT 2026
+
+import time
+
+from stl import STL, Signal
+
+# sample Python program to demonstrate the vectorized (NumPy) evaluation engine
+# note that both engines return the same evaluation results
+
+time_begin = 0
+signal = Signal(py_dict={"0": {"content": {"x": 1, "y": {"z": 2}}},
+                         "1": {"content": {"x": 2.5, "y": {"z": 1}}},
+                         "2": {"content": {"x": -1, "y": {"z": 0.5}}},
+                         "3": {"content": {"x": 0, "y": {"z": 3}}}})
+
+stl_spec_list = ["G[0, 1](x < y.z)",
+                 "F[0, 3](x > y.z)",
+                 "G[0, 2](0 < x < 3)",
+                 "G[0, 1]((x > 0) || (y.z >= 1))",
+                 "F[0, 2](!(x <= -1))",
+                 "G[0, 1]((x * 2 - y.z) > 0)",
+                 "X[1]((x * 2 - y.z) > 0)"]
+
+for stl_str in stl_spec_list:
+    for storage in ["dict", "columnar"]:
+        signal_storage = Signal(py_dict=signal.signal_data, storage=storage)
+        reference_eval = STL(stl_str).eval(time_begin, signal_storage)
+        numpy_eval = STL(stl_str).eval(time_begin, signal_storage, engine="numpy")
+
+        assert numpy_eval.satisfy == reference_eval.satisfy, stl_str
+        assert numpy_eval.robustness == reference_eval.robustness, stl_str
+
+# expressions without STL operators are evaluated over the entire signal, note that the time interval of the
+# STL expressions evaluated above must not leak to the following evaluations
+for stl_str, value in [("x > -2", True), ("x > 0", False), ("(x > -2) && (y.z > 0)", True)]:
+    assert STL("G[0, 1](x > 0)").eval(time_begin, signal).satisfy == True
+    assert STL(stl_str).eval(time_begin, signal).value == value, stl_str
+    assert STL(stl_str).eval(time_begin, signal, engine="numpy").value == value, stl_str
+
+# the vectorized engine also evaluates the robustness of implications embedded in STL expressions
+numpy_eval = STL("F[1, 3]((x == 0) => (y.z > 2))").eval(time_begin, signal, engine="numpy")
+assert numpy_eval.satisfy == True
+assert numpy_eval.robustness == 2.5
+
+assert STL("1 + 2.5").eval(time_begin, signal, engine="numpy").value == 3.5
+
+# the vectorized engine visits each AST node once per window instead of once per signal element
+signal_long = Signal(storage="columnar")
+for i in range(2000):
+    signal_long.append(py_dict={"x": i % 7, "y": 0.5 * (i % 11)})
+
+stl_spec = STL("G[0, 1000]((x >= 0) && (y < 5.5))")
+
+start = time.time()
+reference_eval = stl_spec.eval(time_begin, signal_long)
+reference_time = time.time() - start
+
+start = time.time()
+numpy_eval = stl_spec.eval(time_begin, signal_long, engine="numpy")
+numpy_time = time.time() - start
+
+print("reference: " + str(reference_time) + "s, numpy: " + str(numpy_time) + "s")
+assert numpy_eval.satisfy == reference_eval.satisfy == True
+assert numpy_eval.robustness == reference_eval.robustness == 0.0
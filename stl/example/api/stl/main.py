@@ -72,10 +72,9 @@ print()
 stl_spec = STL("F[0, 1](x > 1.0)")
 stl_eval = stl_spec.eval(time_begin, signal)
 print("satisfaction value: " + str(stl_eval.satisfy))
-#print("robustness value: " + str(stl_eval.robustness))
-print(stl_eval.satisfy)
+print("robustness value: " + str(stl_eval.robustness))
 assert stl_eval.satisfy == True
-#assert stl_eval.robustness == -2.0
+assert stl_eval.robustness == 1.0
 print()
 
 stl_spec = STL("X[0](x == 2)")
@@ -96,3 +95,17 @@ print(stl_eval)
 assert stl_spec.satisfy(time_begin, signal) == False
 assert stl_spec.robustness(time_begin, signal) == -1.0
 
+
+# the STL expression is type checked once upon creation, the type is cached on the AST
+# thus repeated evaluations against new signals skip the type checking
+stl_spec = STL("G[0, 1](x > 0)")
+assert stl_spec.parsed_expr.checked_type is not None
+
+for x in range(3):
+    signal = Signal(py_dict={"0": {"content": {"x": x}}, "1": {"content": {"x": x + 1}}})
+    assert stl_spec.robustness(time_begin, signal) == x
+
+# weakened STL expressions are type checked again
+weakened_stl_spec = stl_spec.weaken("ap-range", 1)
+assert weakened_stl_spec.parsed_expr.checked_type is not None
+assert weakened_stl_spec.robustness(time_begin, signal) == 3.0
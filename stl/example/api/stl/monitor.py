@@ -0,0 +1,49 @@
+# Sun Oct 18 17:20:45 EDT 2026
+
+from stl import STL, Signal
+
+# sample Python program to demonstrate the online monitor for streaming signals
+# note that the monitor returns the same results as the evaluation of the whole signal
+
+stl_spec = STL("G[0, 2](x > y)")
+monitor = stl_spec.monitor()
+
+# the evaluation result for begin time t is available once the element at t + 2 is appended
+assert len(monitor.append(py_dict={"x": 2, "y": 1})) == 0
+assert len(monitor.append(json_str='{"x": 3, "y": 1}')) == 0
+
+trace = monitor.append(py_dict={"x": 4, "y": 2})
+print(trace)
+assert trace.begin_time == 0
+assert trace[0].satisfy == True
+assert trace[0].robustness == 1.0
+
+# elements can be appended in small batches
+trace = monitor.extend([{"x": 1, "y": 1.5}, {"x": 5, "y": 0}])
+assert list(trace.time) == [1, 2]
+assert trace.satisfy == [False, False]
+assert trace.robustness == [-0.5, -0.5]
+
+assert len(monitor) == 5
+assert monitor.begin_time == 3
+assert monitor.eval_result.robustness == -0.5
+
+# compare with the evaluation of the whole signal
+content_list = [{"armed": 1, "landed": 0}, {"armed": 1, "landed": 0}, {"armed": 1, "landed": 1},
+                {"armed": 0, "landed": 1}, {"armed": 0, "landed": 0}, {"armed": 1, "landed": 0},
+                {"armed": 1, "landed": 0}, {"armed": 0, "landed": 1}]
+signal = Signal(py_dict={str(index): {"content": content} for index, content in enumerate(content_list)})
+
+for stl_str in ["F[1, 3](armed < landed)", "X[1](armed > 0)", "(armed > 0) U[0, 3] (landed > 0)",
+                "(landed > 0) R[1, 2] (armed > 0)", "G[0, 1]((armed > 0) || (landed > 0))"]:
+    monitor = STL(stl_str).monitor()
+    monitor_result_list = list()
+
+    for content in content_list:
+        trace = monitor.append(py_dict=content)
+        monitor_result_list.extend(trace[time] for time in trace.time)
+
+    for time, monitor_result in enumerate(monitor_result_list):
+        stl_eval = STL(stl_str).eval(time, signal)
+        assert monitor_result.satisfy == stl_eval.satisfy
+        assert monitor_result.robustness == stl_eval.robustness
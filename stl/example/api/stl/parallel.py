@@ -0,0 +1,88 @@
+# Mon Oct 19 04:40:18 EDT 2026
+
+import numpy as np
+
+from stl import Signal, STL, Spec_Set
+from stl.obj.parallel import Shared_Signals
+
+# sample Python program to demonstrate the evaluation of an STL expression over many signals (e.g. simulation
+# traces) by a pool of worker processes, the signals are passed to the workers through shared memory
+
+random = np.random.default_rng(0)
+signals = [Signal(py_dict={str(i): {"content": {"x": int(value), "y": {"z": i % 3}}}
+                           for i, value in enumerate(random.integers(-3, 10, size=12))})
+           for _ in range(40)]
+
+# a signal with missing entries and a column of strings, and a timestamped signal
+signals.append(Signal(py_dict={"0": {"content": {"x": 1, "y": {"z": 0}, "s": "a"}},
+                               "1": {"content": {"x": 2, "y": {"z": 1}}},
+                               "2": {"content": {"x": 3, "y": {"z": 2}, "s": "b"}},
+                               "3": {"content": {"x": 4, "y": {"z": 0}}}}))
+signals.append(Signal.from_arrays({"y.z": np.zeros(8)}, x=np.arange(8.0), timestamps=np.arange(8) * 0.5))
+
+stl_expr = STL("G[0, 3]((x > -2) && (y.z < 2))")
+expected_results = [stl_expr.eval(0, signal) for signal in signals]
+
+# same results as evaluating each signal, in the order of the signals, with the progress of the evaluation
+progress = list()
+results = stl_expr.eval_many(0, signals, workers=2, chunk_size=5, callback=lambda done, total: progress.append(done))
+
+assert [(result.satisfy, result.robustness) for result in results] == \
+       [(result.satisfy, result.robustness) for result in expected_results]
+assert progress == sorted(progress) and progress[-1] == len(signals)
+
+# the signals may be generated, a single worker evaluates them in this process
+results = stl_expr.eval_many(0, (signal for signal in signals), workers=1)
+assert [result.satisfy for result in results] == [result.satisfy for result in expected_results]
+
+# each signal is evaluated by all the expressions of a Spec_Set, in one batch
+spec_set = Spec_Set(["G[0, 3](x > -2)", "F[0, 2](y.z >= 2)"])
+assert [[result.satisfy for result in results] for results in spec_set.eval_many(0, signals[:-1], workers=2)] == \
+       [spec_set.satisfy(0, signal) for signal in signals[:-1]]
+
+# a weakened expression has no expression text for the workers, the signals are evaluated in this process
+weakened_stl_expr = STL("G[0, 3](x > 1)").weaken("ap-range", 1)
+assert weakened_stl_expr.value is None
+assert [result.satisfy for result in weakened_stl_expr.eval_many(0, signals[:-1], workers=2)] == \
+       [weakened_stl_expr.eval(0, signal).satisfy for signal in signals[:-1]]
+assert [results[0].satisfy for results in Spec_Set([weakened_stl_expr]).eval_many(0, signals[:-1], workers=2)] == \
+       [weakened_stl_expr.eval(0, signal).satisfy for signal in signals[:-1]]
+
+# the columns of numbers and the timestamps are copied into the shared memory block, the others are pickled
+shared_signals = Shared_Signals(signals[-2:])
+try:
+    assert shared_signals.layouts[0]["columns"]["x"][0] == "shared"
+    assert shared_signals.layouts[0]["columns"]["s"][0] == "copied"
+    assert shared_signals.layouts[1]["timestamps"][0] == "shared"
+
+    block, attached_signals = Shared_Signals.attach(shared_signals.name, shared_signals.layouts)
+    assert attached_signals[0].lookup("x") == signals[-2].lookup("x")
+    assert list(attached_signals[1].timestamps) == list(signals[-1].timestamps)
+
+    del attached_signals
+    block.close()
+finally:
+    shared_signals.release()
+
+# the begin times of a long signal are split into chunks evaluated in parallel, each chunk over its slice of
+# the signal extended by the horizon of the expression, the results are those of a single evaluation
+long_signal = Signal.from_arrays(x=random.integers(-5, 6, size=400).astype(float), y=random.random(400))
+
+for stl_str in ["G[0, 7](x > -4)", "(x > -3) U[1, 6] (y > 0.8)", "X[3]((x - y) >= 0)"]:
+    trace = STL(stl_str).eval_trace(long_signal)
+
+    for executor in ["process", "thread"]:
+        parallel_trace = STL(stl_str).eval_trace(long_signal, workers=2, chunk_size=45, executor=executor)
+
+        assert parallel_trace.begin_time == trace.begin_time and len(parallel_trace) == len(trace)
+        assert (parallel_trace.satisfy == trace.satisfy).all() and (parallel_trace.robustness == trace.robustness).all()
+
+trace = STL("F[2, 9]((x > 2) && (y < 0.5))").eval_trace(long_signal, begin=13, end=301)
+parallel_trace = STL("F[2, 9]((x > 2) && (y < 0.5))").eval_trace(long_signal, begin=13, end=301, workers=3,
+                                                                   executor="thread")
+assert parallel_trace.begin_time == 13 and (parallel_trace.robustness == trace.robustness).all()
+
+# a weakened expression is evaluated by threads rather than worker processes
+weakened_stl_expr = STL("G[0, 7](x > 1)").weaken("ap-range", 1)
+parallel_trace = weakened_stl_expr.eval_trace(long_signal, workers=2, chunk_size=45)
+assert (parallel_trace.robustness == weakened_stl_expr.eval_trace(long_signal).robustness).all()
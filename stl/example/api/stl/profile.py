@@ -0,0 +1,59 @@
+# Mon Oct 19 00:52:17 EDT 2026
+
+import json
+import threading
+
+from stl import Signal, STL
+from stl.parsing.ast_collection.stl_expr import G_Expr
+from stl.parsing.profiler import Profiler
+
+# sample Python program to demonstrate the per AST node profiling of the reference interpreter
+# every node of the AST reports the number of evaluations, the wall time (with and without its child nodes),
+# the number of signal elements read and the number of Val objects allocated
+
+signal = Signal(py_dict={str(i): {"content": {"x": i % 7 - 3, "y": i % 5}} for i in range(100)})
+
+stl_expr = STL("G[0, 10]((x > -5) && (y < 5))")
+result = stl_expr.eval(0, signal, profile=True)
+print(result.profile)
+
+# the profiling does not change the evaluation result
+assert result.satisfy == stl_expr.eval(0, signal).satisfy
+assert result.robustness == stl_expr.eval(0, signal).robustness
+assert stl_expr.eval(0, signal).profile is None
+
+# one entry per AST node, in pre-order
+profiles = result.profile.profiles
+assert [type(profile.node).__name__ for profile in profiles] == [
+    "G_Expr", "Int_Val", "Int_Val", "Binary_Logic_Expr",
+    "Binary_Comp_Expr", "Id_Val", "Unary_Arith_Expr", "Int_Val", "Binary_Comp_Expr", "Id_Val", "Int_Val"]
+assert [profile.depth for profile in profiles] == [0, 1, 1, 1, 2, 3, 3, 4, 2, 3, 3]
+assert all(profile.calls >= 1 for profile in profiles)
+
+# the identifiers read the 11 elements of the window [0, 10]
+by_type = result.profile.by_type()
+assert by_type["Id_Val"]["calls"] == 2
+assert by_type["Id_Val"]["elements_read"] == 2 * 11
+assert by_type["Id_Val"]["vals_allocated"] == 2 * 11
+assert sum(profile.elements_read for profile in profiles) == 2 * 11
+
+# the time of a node includes the time of its child nodes, the self time excludes it
+root = profiles[0]
+assert root.time >= sum(profile.time for profile in profiles if profile.depth == 1)
+assert abs(root.time - sum(profile.self_time for profile in profiles)) < 1e-6
+assert result.profile.time == root.time
+
+# the report can be dumped to JSON
+assert json.loads(json.dumps(result.profile.to_list()))[0]["name"] == "G_Expr (G)"
+
+# the eval methods are restored after profiling, also when the evaluation fails
+assert "eval" in G_Expr.__dict__ and G_Expr.eval.__qualname__ == "G_Expr.eval"
+assert not Profiler.lock.locked()
+
+# evaluations by other threads are not recorded
+profiler = Profiler(stl_expr.parsed_expr)
+with profiler:
+    thread = threading.Thread(target=stl_expr.eval, args=(0, signal))
+    thread.start()
+    thread.join()
+assert all(profile.calls == 0 for profile in profiler.report().profiles)
@@ -0,0 +1,167 @@
+# Sun Oct 18 23:48:52 EDT 2026
+
+import copy
+
+import numpy as np
+
+from stl import Signal, STL
+from stl.parsing.window import Segment_Tree, Sparse_Table
+
+# sample Python program to demonstrate the range minimum/maximum indices of G and F
+# the windows of G and F are answered in O(1) by sparse tables of their conditions, cached on the signal,
+# or in O(log n) by segment trees, which absorb appended and modified elements
+
+values = np.array([3, 1, 4, 1, 5, 9, 2, 6])
+minimum_table = Sparse_Table(values, np.minimum)
+maximum_table = Sparse_Table(values, np.maximum)
+
+for begin in range(len(values)):
+    for end in range(begin, len(values)):
+        assert minimum_table.query(begin, end) == values[begin:end + 1].min()
+        assert maximum_table.query(begin, end) == values[begin:end + 1].max()
+
+minimum_tree = Segment_Tree(values.tolist(), min, float("inf"))
+minimum_tree.update(1, 8)
+for value in [7, 0, 2]:
+    minimum_tree.append(value)
+assert [minimum_tree.query(begin, begin + 2) for begin in range(len(minimum_tree) - 2)] == \
+    [3, 1, 1, 1, 2, 2, 2, 0, 0]
+
+x = [1, 3, -2, 4, 0, 5, 2, -1, 3, 6, 2, 1]
+
+
+def py_dict():
+    # note that the dictionary storage engine keeps (and appends to) the given dictionary
+    return {str(i): {"content": {"x": value, "y": i % 3}} for i, value in enumerate(x)}
+
+
+signal = Signal(py_dict=py_dict())
+signal_indexed = Signal(py_dict=py_dict(), range_index=True)
+
+# same results as scanning every window
+for expr in ["G[0, 3](x > 0)", "F[1, 4](x > 0)", "G[0, 2]((x > 0) && (y < 2))", "F[0, 5](!(x >= 3))",
+             "G[2, 2](1 < x < 5)", "G[0, 3](1 > 0)"]:
+    stl_spec = STL(expr)
+    for time in range(len(x) - 6):
+        result = stl_spec.eval(time, signal)
+        result_indexed = stl_spec.eval(time, signal_indexed)
+        assert (result.satisfy, result.robustness) == (result_indexed.satisfy, result_indexed.robustness)
+
+# the index of a condition is shared by all the STL expressions with the same condition
+signal_indexed.range_index_cache.clear()
+for expr in ["G[0, 1](x > 0)", "G[0, 5](x > 0)", "F[2, 3](x > 0)"]:
+    STL(expr).eval(0, signal_indexed)
+assert len(signal_indexed.range_index_cache) == 1
+
+# appending invalidates the indices
+signal_indexed.append(py_dict={"x": -7, "y": 0})
+assert len(signal_indexed.range_index_cache) == 0
+assert STL("G[0, 3](x > 0)").robustness(9, signal_indexed) == -7.0
+
+# timestamped signals resolve the time interval to the indices of the window first
+signal_timestamped = Signal(py_dict=py_dict(), timestamps=[0.5 * i for i in range(len(x))], range_index=True)
+assert STL("F[0, 1](x > 4)").robustness(4.0, signal_timestamped) == 2.0
+
+# the index holds the values of the condition by element, not by time
+timestamps = [1.25, 4.25, 7.0, 9.0, 10.25, 12.0, 14.5]
+x_timestamped = [3, 2, -1, 4, 5, -2, 1]
+py_dict_timestamped = {str(i): {"content": {"x": value}} for i, value in enumerate(x_timestamped)}
+signal = Signal(py_dict=py_dict_timestamped, timestamps=timestamps)
+
+for storage in ["dict", "columnar"]:
+    signal_timestamped = Signal(py_dict=py_dict_timestamped, storage=storage, timestamps=timestamps, range_index=True)
+    for expr in ["G[3, 5](x > 0)", "F[0, 4](x > 3)", "G[0, 8]((x + 1) > 0)"]:
+        for time in [1.25, 4.25, 7.0, 9.0]:
+            result = STL(expr).eval(time, signal)
+            result_indexed = STL(expr).eval(time, signal_timestamped)
+            assert (result.satisfy, result.robustness) == (result_indexed.satisfy, result_indexed.robustness)
+
+assert STL("G[3, 5](x > 0)").robustness(4.25, signal_timestamped) == 4.0
+
+# segment trees are updated in place when elements are appended or modified
+signal = Signal(py_dict=py_dict())
+signal_dynamic = Signal(py_dict=py_dict(), storage="columnar", range_index="segment")
+stl_specs = [STL("G[0, 3](x > 0)"), STL("F[1, 4]((x > 0) && (y < 2))")]
+
+for index, value in [(2, 7), (11, -3), (0, -1)]:
+    for stl_spec in stl_specs:
+        stl_spec.eval(0, signal_dynamic)
+
+    signal.append(py_dict={"x": value, "y": 1})
+    signal_dynamic.append(py_dict={"x": value, "y": 1})
+    signal.set(index, py_dict={"x": -value, "y": 0})
+    signal_dynamic.set(index, py_dict={"x": -value, "y": 0})
+    assert len(signal_dynamic.range_index_cache) == 2
+
+    for stl_spec in stl_specs:
+        for time in range(len(signal) - 5):
+            result = stl_spec.eval(time, signal)
+            result_dynamic = stl_spec.eval(time, signal_dynamic)
+            assert (result.satisfy, result.robustness) == (result_dynamic.satisfy, result_dynamic.robustness)
+
+# elements the condition cannot be evaluated for (e.g. missing entries) out of the window do not fail G and F,
+# which evaluate their windows instead
+for storage in ["dict", "columnar"]:
+    signal_missing = Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"x": 2}}, "2": {"content": {"y": 3}}},
+                            storage=storage, range_index=True)
+    assert STL("G[0, 1](x > 0)").satisfy(0, signal_missing) is True
+    assert STL("F[0, 1](x > 1)").robustness(0, signal_missing) == 1.0
+
+    if storage == "dict":
+        assert signal_missing.get_range_index(STL("G[0, 1](x > 0)").parsed_expr.begin_condition) is None
+
+# appending (or setting) an element the condition of a segment tree cannot be evaluated for drops the tree
+signal_dynamic = Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"x": 2}}}, range_index="segment")
+assert STL("G[0, 1](x > 0)").satisfy(0, signal_dynamic) is True
+signal_dynamic.append(py_dict={"y": 1})
+assert len(signal_dynamic) == 3 and len(signal_dynamic.range_index_cache) == 0
+assert STL("G[0, 1](x > 0)").satisfy(0, signal_dynamic) is True
+
+signal_dynamic.append(py_dict={"x": 3})
+signal_dynamic.set(1, py_dict={"x": "a"})
+signal_dynamic.set(1, py_dict={"x": -2})
+assert len(signal_dynamic) == 4
+assert STL("G[0, 1](x > 0)").robustness(0, signal_dynamic) == -2.0
+
+signal_dynamic = Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"x": 2}}}, storage="columnar",
+                        range_index="segment")
+assert STL("F[0, 1](x > 1)").robustness(0, signal_dynamic) == 1.0
+signal_dynamic.set(0, py_dict={"x": "a"})
+signal_dynamic.append(py_dict={"x": 5})
+assert len(signal_dynamic) == 3
+assert STL("F[1, 2](x > 1)").robustness(0, signal_dynamic) == 4.0
+
+# the conditions without index are retried once the signal is modified
+signal_dynamic = Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"y": 2}}}, range_index="segment")
+condition = STL("G[0, 1](x > 0)").parsed_expr.begin_condition
+assert signal_dynamic.get_range_index(condition) is None
+signal_dynamic.set(1, py_dict={"x": 2})
+assert signal_dynamic.get_range_index(condition) is not None
+assert STL("G[0, 1](x > 0)").robustness(0, signal_dynamic) == 1.0
+
+# the elements of a timestamped signal are refreshed by position
+for storage in ["dict", "columnar"]:
+    # note that appending extends the given dictionary and list of timestamps
+    signal = Signal(py_dict=copy.deepcopy(py_dict_timestamped), timestamps=list(timestamps))
+    signal_dynamic = Signal(py_dict=copy.deepcopy(py_dict_timestamped), storage=storage, timestamps=list(timestamps),
+                            range_index="segment")
+    assert STL("G[3, 5](x > 0)").robustness(4.25, signal_dynamic) == 4.0
+
+    for target in [signal, signal_dynamic]:
+        target.append(py_dict={"x": -3}, timestamp=16.0)
+        target.set(2, py_dict={"x": 6})
+        target.set(3, py_dict={"x": 0.5})
+
+    for expr in ["G[3, 5](x > 0)", "F[0, 4](x > 3)", "G[1, 6](x > -5)"]:
+        for time in [1.25, 4.25, 7.0, 9.0]:
+            result = STL(expr).eval(time, signal)
+            result_dynamic = STL(expr).eval(time, signal_dynamic)
+            assert (result.satisfy, result.robustness) == (result_dynamic.satisfy, result_dynamic.robustness)
+
+# modifying a signal built from arrays copies the arrays first
+x_array = np.array(x, dtype=np.float64)
+signal_arrays = Signal.from_arrays(x=x_array)
+signal_arrays.range_index = "segment"
+assert STL("G[0, 1](x > 0)").robustness(0, signal_arrays) == 1.0
+signal_arrays.set(0, py_dict={"x": 10.0})
+assert signal_arrays.lookup("x", begin_time=0, end_time=1) == [10.0, 3.0] and x_array[0] == 1.0
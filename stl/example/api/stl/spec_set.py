@@ -0,0 +1,57 @@
+# Mon Oct 19 02:51:40 EDT 2026
+
+from stl import Signal, STL, Spec_Set
+from stl.parsing.batch import Batch_Evaluator
+
+# sample Python program to demonstrate the batch evaluation of many STL expressions against one signal
+# the expressions share the columns of the signal and their identical atomic predicates
+
+x = [1, 3, -2, 4, 0, 5, 2, -1, 3, 6, 2, 1, -3, 4, 2, 0]
+signal = Signal(py_dict={str(i): {"content": {"x": value, "y": {"z": i % 3}}} for i, value in enumerate(x)})
+
+stl_spec_list = ["G[0, 3](x > -3)",
+                 "F[2, 6](x > 4)",
+                 "G[0, 2]((x > -3) && (y.z < 2))",
+                 "F[0, 5](!(x > -3))",
+                 "X[4](0 <= x < 3)",
+                 "(x > 0) U[1, 4] (y.z >= 2)",
+                 "G[1, 8]((x * 2 - y.z) > -6)",
+                 "(x > 0) R[0, 3] (x > -3)"]
+
+# same results as evaluating each STL expression, in the same order
+spec_set = Spec_Set(stl_spec_list)
+assert len(spec_set) == len(stl_spec_list)
+
+for time_begin in [0, 3]:
+    results = spec_set.eval(time_begin, signal)
+
+    for stl_str, result in zip(stl_spec_list, results):
+        reference_result = STL(stl_str).eval(time_begin, signal)
+        assert result.satisfy == reference_result.satisfy, stl_str
+        assert result.robustness == reference_result.robustness, stl_str
+
+    assert spec_set.satisfy(time_begin, signal) == [result.satisfy for result in results]
+    assert spec_set.robustness(time_begin, signal) == [result.robustness for result in results]
+
+# STL objects and expression texts can be mixed
+assert Spec_Set([STL("G[0, 1](x > 0)"), "F[0, 2](x > 3)"]).satisfy(0, signal) == [True, False]
+
+# the batch evaluator loads each column and evaluates each distinct predicate once
+evaluator = Batch_Evaluator(signal, 0)
+for stl_expr in spec_set:
+    evaluator.interpret(stl_expr.parsed_expr)
+
+assert sorted(evaluator.columns) == ["x", "y.z"]
+assert len(evaluator.predicates) == 7   # x > -3 is shared by four expressions
+
+# the cached ranges grow to cover the windows of all the expressions
+begin_index, end_index, column = evaluator.columns["x"]
+assert begin_index == 0 and list(column) == x[begin_index:end_index + 1]
+
+# expressions without STL operators are evaluated over the entire signal
+assert [result.value for result in Spec_Set(["x > -4", "(x > -4) && (y.z > 0)"]).eval(0, signal)] == [True, False]
+
+# timestamped signals are evaluated expression by expression
+signal_timestamped = Signal(py_dict={str(i): {"content": {"x": value}} for i, value in enumerate(x)},
+                            timestamps=[0.5 * i for i in range(len(x))])
+assert Spec_Set(["G[0, 1.5](x > -3)", "F[0, 1](x > 3)"]).satisfy(0, signal_timestamped) == [True, False]
@@ -0,0 +1,34 @@
+# Sun Oct 18 13:48:10 EDT 2026
+
+from stl import STL, Signal
+
+# sample Python program to demonstrate the evaluation of STL expressions for every begin time
+# note that the trace agrees with the evaluation of the expression at each begin time
+
+signal = Signal(py_dict={"0": {"content": {"x": 1, "y": 2}},
+                         "1": {"content": {"x": 2, "y": 1}},
+                         "2": {"content": {"x": -1, "y": 0}},
+                         "3": {"content": {"x": 3, "y": 1.5}},
+                         "4": {"content": {"x": 0.5, "y": 1}}})
+
+stl_spec = STL("G[0, 1](x > 0)")
+trace = stl_spec.eval_trace(signal)
+print(trace)
+
+# by default, the trace ends at the last begin time for which the signal covers the time interval
+assert list(trace.time) == [0, 1, 2, 3]
+assert trace.satisfy.tolist() == [True, False, False, True]
+assert trace.robustness.tolist() == [1.0, -1.0, -1.0, 0.5]
+
+for time in trace.time:
+    assert trace[time].satisfy == stl_spec.eval(time, signal).satisfy
+    assert trace[time].robustness == stl_spec.eval(time, signal).robustness
+
+# the trace can be limited to a range of begin times
+trace = STL("F[1, 2](x < y)").eval_trace(signal, begin=1, end=2)
+assert list(trace.time) == [1, 2]
+assert trace.satisfy.tolist() == [True, True]
+assert trace.robustness.tolist() == [1.0, 0.5]
+
+trace = STL("X[0]((x - y) >= 0)").eval_trace(signal, begin=2)
+assert trace.robustness.tolist() == [1.5, -0.5]
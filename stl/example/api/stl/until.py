@@ -0,0 +1,58 @@
+# Sun Oct 18 15:02:33 EDT 2026
+
+from stl import STL, Signal
+
+# sample Python program to demonstrate the binary STL operators
+# U: Until, R: Release, W: Weak until, M: Strong release
+# note that the conditions of binary STL expressions must be enclosed by parentheses
+
+time_begin = 0
+signal = Signal(py_dict={"0": {"content": {"armed": 1, "landed": 0}},
+                         "1": {"content": {"armed": 1, "landed": 0}},
+                         "2": {"content": {"armed": 1, "landed": 1}},
+                         "3": {"content": {"armed": 0, "landed": 1}},
+                         "4": {"content": {"armed": 0, "landed": 0}}})
+
+# the drone stays armed until it has landed
+stl_spec = STL("(armed > 0) U[0, 3] (landed > 0)")
+stl_eval = stl_spec.eval(time_begin, signal)
+print(stl_spec.value)
+print(stl_eval)
+assert stl_eval.satisfy == True
+assert stl_eval.robustness == 1.0
+
+# from time 1, landed does not hold at time 4 (and the drone is no longer armed at time 3)
+stl_spec = STL("(armed > 0) U[3, 3] (landed >= 1)")
+assert stl_spec.satisfy(1, signal) == False
+assert stl_spec.robustness(1, signal) == -1.0
+
+# release: armed holds until it is released by landed (at time 2)
+stl_spec = STL("(landed > 0) R[0, 4] (armed > 0)")
+assert stl_spec.satisfy(time_begin, signal) == True
+assert stl_spec.robustness(time_begin, signal) == 1.0
+
+# armed is not released from time 3
+assert STL("(landed > 0) R[0, 1] (armed > 0)").satisfy(3, signal) == False
+
+# weak until also holds when armed holds throughout the time interval
+stl_spec = STL("(armed > 0) W[0, 2] (landed < 0)")
+assert stl_spec.satisfy(time_begin, signal) == True
+assert stl_spec.robustness(time_begin, signal) == 1.0
+
+# strong release requires both conditions to hold at the release
+stl_spec = STL("(landed > 0) M[0, 3] (armed > 0)")
+assert stl_spec.satisfy(time_begin, signal) == True
+assert stl_spec.robustness(time_begin, signal) == 1.0
+
+# both engines and the trace agree
+for stl_str in ["(armed > 0) U[1, 2] (landed > 0)", "(landed > 0) R[0, 2] (armed > 0)",
+                "(armed > 0) W[0, 2] (landed > 0)", "(landed > 0) M[0, 2] (armed > 0)"]:
+    stl_spec = STL(stl_str)
+    trace = stl_spec.eval_trace(signal)
+
+    for time in trace.time:
+        reference_eval = stl_spec.eval(time, signal)
+        numpy_eval = stl_spec.eval(time, signal, engine="numpy")
+
+        assert reference_eval.satisfy == numpy_eval.satisfy == trace[time].satisfy
+        assert reference_eval.robustness == numpy_eval.robustness == trace[time].robustness
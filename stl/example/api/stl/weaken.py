@@ -85,3 +85,31 @@ print("weakened time-range-1 STL: ")
 print(weakened_stl_spec_time_range_1)
 # TODO
 # - check validity of time bound
+
+# weakening never modifies the STL expression, only the nodes on the path to the weakened nodes are new, the
+# other nodes (and their cached data) are shared with the original expression
+import stl.parsing.dag as dag
+
+stl_spec = STL("G[0, 1](0 < x < 1)")
+stl_spec_str = str(stl_spec.parsed_expr)
+weakened_stl_spec = stl_spec.weaken("ap-range", 2, 3)
+
+assert str(stl_spec.parsed_expr) == stl_spec_str
+assert weakened_stl_spec.parsed_expr is not stl_spec.parsed_expr
+assert weakened_stl_spec.parsed_expr.begin_condition.opd2 is stl_spec.parsed_expr.begin_condition.opd2
+assert weakened_stl_spec.parsed_expr.begin_time is stl_spec.parsed_expr.begin_time
+
+assert stl_spec.satisfy(time_begin, signal) is False
+assert weakened_stl_spec.satisfy(time_begin, signal) is True
+assert weakened_stl_spec.robustness(time_begin, signal) == STL("G[0, 1]((0.0 - 2.0) < x < (1.0 + 3.0))").robustness(
+    time_begin, signal)
+
+weakened_stl_spec = stl_spec.weaken("time-range", 2, 3)
+assert weakened_stl_spec.parsed_expr.begin_condition is stl_spec.parsed_expr.begin_condition
+assert str(stl_spec.parsed_expr) == stl_spec_str
+
+# the untouched nodes (e.g. the identifier and the time bounds) are shared by the weakened expression
+stl_spec = STL("G[0, 1](x > 0)")
+original_nodes = {id(node) for node in dag.unique_nodes(stl_spec.parsed_expr)}
+weakened_nodes = {id(node) for node in dag.unique_nodes(stl_spec.weaken("ap-range", 1).parsed_expr)}
+assert len(weakened_nodes & original_nodes) > 0
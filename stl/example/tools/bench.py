@@ -0,0 +1,52 @@
+# Mon Oct 19 01:58:09 EDT 2026
+
+import json
+import os
+import tempfile
+
+from stl.bench import Benchmark, Benchmark_Result, benchmarks, run, compare, dump_results, load_results
+from stl.bench.__main__ import main
+
+# sample Python program to demonstrate the benchmark suite, shared by the performance work as a yardstick
+# run the full suite by bin/stlbench (or python3 -m stl.bench), e.g. bin/stlbench --max-size 10000000
+
+names = [benchmark.name for benchmark in benchmarks]
+for name in ["lexer.lex", "parser.parse", "signal.construct[dict]", "signal.lookup", "signal.get", "signal.json",
+             "eval.G[reference]", "eval.F[numpy]", "eval.X[compiled]", "eval.chain[reference]",
+             "eval.logic[reference]", "eval.arith[reference]"]:
+    assert name in names
+assert len(names) == len(set(names))
+
+# every benchmark runs on small inputs
+results = run(benchmarks, [10], repeat=1, min_time=0)
+assert [result.name for result in results] == names
+assert all(result.size == 10 and result.number >= 1 and result.best > 0 for result in results)
+
+# machine-readable results, compared against a baseline
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "results.json")
+    dump_results(results, path)
+
+    content = json.load(open(path))
+    assert content["version"] == 1 and len(content["results"]) == len(results)
+    assert [result.key for result in load_results(path)] == [result.key for result in results]
+
+    # the command line entry point returns 1 on a regression
+    assert main(["-k", "signal.lookup", "--sizes", "10", "--repeat", "1", "--baseline", path,
+                 "--threshold", "1000"]) == 0
+
+    # a missing baseline is reported before running the benchmarks
+    assert main(["-k", "signal.lookup", "--sizes", "10", "--baseline", os.path.join(directory, "missing.json")]) == 2
+
+slow = Benchmark_Result("eval.G[reference]", 100, 1, [2.0, 2.5])
+fast = Benchmark_Result("eval.G[reference]", 100, 1, [1.0, 1.2])
+new = Benchmark_Result("eval.F[reference]", 100, 1, [1.0])
+
+comparisons = compare([slow, new], [fast], threshold=0.1)
+assert comparisons[0].ratio == 2.0 and comparisons[0].regression
+assert comparisons[1].baseline is None and not comparisons[1].regression
+assert compare([fast], [slow], threshold=0.1)[0].improvement
+
+# a benchmark with a maximum size is skipped for larger sizes
+sized = Benchmark("sized", lambda size: lambda: None, max_size=100)
+assert [result.size for result in run([sized], [10, 100, 1000], repeat=1, min_time=0)] == [10, 100]
@@ -0,0 +1,368 @@
+# Sun Oct 18 09:40:02 EDT 2026
+# columnar (array-backed) storage engine for the Signal object
+
+import logging
+from typing import Any, Optional
+
+import numpy as np
+
+import stl.error as error
+from stl.obj.storage import Signal_Storage
+
+
+class Columnar_Storage(Signal_Storage):
+    """columnar storage engine, keeps one contiguous NumPy array per flattened key
+
+    Nested keys are flattened with "." (the separator used by identifiers in STL expressions),
+    thus {"y": {"z": 0}} is stored in the column "y.z". A validity mask records which samples
+    hold a value for the column; it is only allocated once some sample misses the key, so a
+    homogeneous signal of numbers costs 8 bytes per sample and key. Columns mixing integers and
+    floating-point numbers are widened to float64 (the interpreter converts signal entries to
+    floats anyway), other mixed columns fall back to the object dtype.
+
+    Attributes:
+        columns: {"flattened.key": np.ndarray, ...}, arrays are over-allocated, only the first
+            len(self) entries are valid
+        masks: {"flattened.key": Optional[np.ndarray], ...}, None when all entries are valid
+        shared: whether the columns share the memory of arrays owned by others (e.g. memory-mapped files,
+            see from_arrays), such columns are copied before they are modified
+
+    Usage:
+        >>> storage = Columnar_Storage()
+        >>> storage.append({"x": 1, "y": {"z": 0.5}})
+        >>> storage.append({"x": 2, "y": {"z": 1.5}})
+        >>> storage.lookup("y.z", 0, 1)
+        [0.5, 1.5]
+        >>> storage.column("x", 0, 1)
+        array([1, 2])
+    """
+
+    name = "columnar"
+
+    # capacity allocated upon the first append, doubled whenever the arrays are full
+    initial_capacity: int = 16
+
+    def __init__(self):
+        self.columns: dict[str, np.ndarray] = dict()
+        self.masks: dict[str, Optional[np.ndarray]] = dict()
+        self._length: int = 0
+        self._capacity: int = 0
+        self.shared: bool = False
+
+    @staticmethod
+    def from_arrays(arrays: dict) -> "Columnar_Storage":
+        """wrap one-dimensional arrays of the same length as columns, without copying them
+
+        masked arrays (np.ma.MaskedArray) mark their masked entries as missing. appending to the storage
+        copies the columns first, while the samples already stored share the memory of the given arrays
+        """
+        result = Columnar_Storage()
+        length = None
+
+        for key, array in arrays.items():
+            mask = None
+            if isinstance(array, np.ma.MaskedArray):
+                if np.ma.is_masked(array):
+                    mask = ~np.ma.getmaskarray(array)
+                array = array.data
+
+            array = np.asarray(array)
+
+            if array.ndim != 1:
+                raise error.Signal_Error("Array of \"" + key + "\" must be one-dimensional, got shape " +
+                                         str(array.shape))
+
+            if length is None:
+                length = len(array)
+            elif len(array) != length:
+                raise error.Signal_Error("Arrays of a signal must have the same length, \"" + key + "\" has " +
+                                         str(len(array)) + " entries instead of " + str(length))
+
+            result.columns[key] = array
+            result.masks[key] = mask
+
+        result._length = result._capacity = 0 if length is None else length
+        result.shared = True
+        return result
+
+    @staticmethod
+    def from_storage(storage: Signal_Storage) -> "Columnar_Storage":
+        """return the storage itself if it is columnar, otherwise copy its samples to a columnar storage"""
+        if isinstance(storage, Columnar_Storage):
+            return storage
+
+        result = Columnar_Storage()
+        for index in range(len(storage)):
+            result.append(storage.content(index))
+
+        return result
+
+    # ============ append ============
+    def append(self, content: dict) -> None:
+        flattened_content = Columnar_Storage.flatten(content)
+
+        if self._length == self._capacity:
+            self._grow(max(Columnar_Storage.initial_capacity, 2 * self._capacity))
+
+        index = self._length
+
+        for key, value in flattened_content.items():
+            column = self.columns.get(key)
+
+            if column is None:
+                column = self._add_column(key, value)
+            elif not Columnar_Storage._fits(column, value):
+                column = self._promote_column(key, value)
+
+            column[index] = value
+
+            mask = self.masks[key]
+            if mask is not None:
+                mask[index] = True
+
+        # mark the columns missing from the sample as invalid
+        if len(flattened_content) != len(self.columns):
+            for key in self.columns.keys() - flattened_content.keys():
+                self._invalidate(key, index)
+
+        self._length += 1
+
+    def set(self, index: int, content: dict) -> None:
+        flattened_content = Columnar_Storage.flatten(content)
+
+        if self.shared:
+            # copy the columns before modifying them
+            self._grow(self._capacity)
+
+        for key, value in flattened_content.items():
+            column = self.columns.get(key)
+
+            if column is None:
+                column = self._add_column(key, value)
+            elif not Columnar_Storage._fits(column, value):
+                column = self._promote_column(key, value)
+
+            column[index] = value
+
+            mask = self.masks[key]
+            if mask is not None:
+                mask[index] = True
+
+        for key in self.columns.keys() - flattened_content.keys():
+            self._invalidate(key, index)
+
+    def _grow(self, capacity: int) -> None:
+        """re-allocate all the arrays to the given capacity"""
+        for key, column in self.columns.items():
+            grown_column = np.empty(capacity, dtype=column.dtype)
+            grown_column[:self._length] = column[:self._length]
+            self.columns[key] = grown_column
+
+            mask = self.masks[key]
+            if mask is not None:
+                grown_mask = np.zeros(capacity, dtype=np.bool_)
+                grown_mask[:self._length] = mask[:self._length]
+                self.masks[key] = grown_mask
+
+        self._capacity = capacity
+        self.shared = False
+
+    def _add_column(self, key: str, value: Any) -> np.ndarray:
+        """add a new column for a key first seen at the current index"""
+        column = np.empty(self._capacity, dtype=Columnar_Storage.select_dtype(value))
+        self.columns[key] = column
+        self.masks[key] = None
+
+        if self._length > 0:
+            # samples before the current index do not hold the key
+            mask = np.zeros(self._capacity, dtype=np.bool_)
+            self.masks[key] = mask
+
+        return column
+
+    def _promote_column(self, key: str, value: Any) -> np.ndarray:
+        """widen the dtype of a column so that it is able to hold the value"""
+        column = self.columns[key]
+        value_dtype = Columnar_Storage.select_dtype(value)
+        dtype = np.result_type(column.dtype, value_dtype)
+
+        # booleans mixed with numbers stay Python objects, as in the dict storage (rather than 0 and 1)
+        if dtype == column.dtype or dtype.kind not in "bif" or (column.dtype.kind == "b") != (value_dtype.kind == "b"):
+            dtype = np.dtype(object)
+
+        promoted_column = np.empty(self._capacity, dtype=dtype)
+        promoted_column[:self._length] = column[:self._length]
+        self.columns[key] = promoted_column
+        return promoted_column
+
+    def _invalidate(self, key: str, index: int) -> None:
+        """mark the entry at the index of a column as missing"""
+        mask = self.masks[key]
+
+        if mask is None:
+            mask = np.zeros(self._capacity, dtype=np.bool_)
+            mask[:index] = True
+            self.masks[key] = mask
+
+        mask[index] = False
+
+    @staticmethod
+    def select_dtype(value: Any) -> np.dtype:
+        """select the narrowest dtype able to hold the Python object"""
+        if isinstance(value, np.generic) and value.dtype.kind in "bif":
+            return value.dtype
+        elif isinstance(value, bool):
+            return np.dtype(np.bool_)
+        elif isinstance(value, int) and -2 ** 63 <= value < 2 ** 63:
+            return np.dtype(np.int64)
+        elif isinstance(value, float):
+            return np.dtype(np.float64)
+        else:
+            return np.dtype(object)
+
+    @staticmethod
+    def _fits(column: np.ndarray, value: Any) -> bool:
+        """check whether the value can be stored in the column without loss"""
+        dtype = Columnar_Storage.select_dtype(value)
+        return column.dtype == dtype or column.dtype == object or (column.dtype.kind == "f" and dtype.kind == "i")
+
+    @staticmethod
+    def flatten(content: dict, prefix: str = "") -> dict[str, Any]:
+        """flatten the nested content of a sample to {"y.z": value, ...}"""
+        result = dict()
+
+        for key, value in content.items():
+            if isinstance(value, dict) and value:
+                result.update(Columnar_Storage.flatten(value, prefix + key + "."))
+            else:
+                result[prefix + key] = value
+
+        return result
+
+    # ============ queries ============
+    def content(self, index: int) -> dict:
+        result = dict()
+
+        for key, column in self.columns.items():
+            mask = self.masks[key]
+            if mask is not None and not mask[index]:
+                continue
+
+            # walk (and create) the nested dictionaries leading to the key
+            *parent_keys, last_key = key.split(".")
+            current_content = result
+            for parent_key in parent_keys:
+                current_content = current_content.setdefault(parent_key, dict())
+
+            current_content[last_key] = column[index:index + 1].tolist()[0]
+
+        return result
+
+    def lookup(self, id_name: str, begin_index: int, end_index: int) -> list:
+        column = self.columns.get(id_name)
+
+        if column is None:
+            # the identifier names a nested dictionary (or nothing), rebuild it from the contents
+            if not any(key.startswith(id_name + ".") for key in self.columns):
+                logging.error("Identifier \"" + id_name + "\" does not exist in the signal.")
+                return [None] * (end_index - begin_index + 1)
+
+            result = list()
+            for i in range(begin_index, end_index + 1):
+                current_signal_content = self.content(i)
+                for key in id_name.split("."):
+                    current_signal_content = current_signal_content.get(key)
+                result.append(current_signal_content)
+            return result
+
+        result = column[begin_index:end_index + 1].tolist()
+
+        mask = self.masks[id_name]
+        if mask is not None:
+            valid_list = mask[begin_index:end_index + 1].tolist()
+            result = [value if valid else None for value, valid in zip(result, valid_list)]
+
+        return result
+
+    def column(self, id_name: str, begin_index: int, end_index: int) -> np.ndarray:
+        """return the column of a flattened key between two indices (inclusive)
+
+        floating-point and boolean columns without missing entries are returned as read-only views,
+        integer columns are converted to floating-point numbers and missing entries to NaN
+        """
+        if id_name not in self.columns:
+            return super().column(id_name, begin_index, end_index)
+
+        result = self.columns[id_name][begin_index:end_index + 1]
+        mask = self.masks[id_name]
+
+        if result.dtype.kind in "iu" or (mask is not None and result.dtype.kind == "b"):
+            result = result.astype(np.float64)
+
+        if mask is not None and result.dtype.kind == "f":
+            result = np.where(mask[begin_index:end_index + 1], result, np.nan)
+
+        if result.base is not None:
+            result.flags.writeable = False
+
+        return result
+
+    def slice(self, begin_index: int, end_index: int) -> "Columnar_Storage":
+        result = Columnar_Storage()
+        result._length = result._capacity = end_index - begin_index + 1
+
+        for key, column in self.columns.items():
+            result.columns[key] = column[begin_index:end_index + 1].copy()
+
+            mask = self.masks[key]
+            if mask is not None:
+                mask = mask[begin_index:end_index + 1].copy()
+                if mask.all():
+                    mask = None
+            result.masks[key] = mask
+
+        return result
+
+    def get_quantifiable_keys(self) -> list[str]:
+        # a top-level key is common to all samples when each sample holds at least one of its columns
+        top_level_masks: dict[str, Optional[np.ndarray]] = dict()
+
+        for key, mask in self.masks.items():
+            top_level_key = key.split(".")[0]
+
+            if top_level_key in top_level_masks and top_level_masks[top_level_key] is None:
+                continue
+            elif mask is None:
+                top_level_masks[top_level_key] = None
+            elif top_level_key in top_level_masks:
+                top_level_masks[top_level_key] = top_level_masks[top_level_key] | mask[:self._length]
+            else:
+                top_level_masks[top_level_key] = mask[:self._length]
+
+        return [key for key, mask in top_level_masks.items() if mask is None or mask.all()]
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """return {"flattened.key": np.ndarray, ...} holding the valid entries of the columns, as read-only
+        views (columns missing some entries are returned as np.ma.MaskedArray)"""
+        result = dict()
+
+        for key, column in self.columns.items():
+            array = column[:self._length]
+            array.flags.writeable = False
+
+            mask = self.masks[key]
+            if mask is not None:
+                array = np.ma.MaskedArray(array, mask=~mask[:self._length])
+
+            result[key] = array
+
+        return result
+
+    @property
+    def nbytes(self) -> int:
+        """number of bytes allocated by the arrays"""
+        return sum(column.nbytes for column in self.columns.values()) + \
+            sum(mask.nbytes for mask in self.masks.values() if mask is not None)
+
+    def __len__(self) -> int:
+        return self._length
@@ -0,0 +1,58 @@
+# Sun Oct 18 18:31:15 EDT 2026
+# STL expressions compiled to Python closures
+
+from typing import Optional
+
+from stl.obj.signal import Signal
+from stl.obj.result import Eval_Result
+from stl.parsing.interpreter import Interpreter
+import stl.parsing.compiler as compiler
+
+
+class Compiled_STL:
+    """STL expression lowered once to a tree of specialized Python closures (see compiler.py)
+
+    the dispatch on the node and operator types is resolved at compile time, thus each evaluation
+    only runs the closures over the signal. expressions that cannot be compiled (e.g. expressions
+    without STL operators, which are evaluated over the entire signal) are evaluated by the reference
+    interpreter instead, with the same results. so are the binary STL expressions (U, R, W and M) on
+    timestamped signals.
+
+    Usage:
+        >>> compiled_stl = STL("G[0, 1](x > 0)").compile()
+        >>> signal = Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"x": 2}}})
+        >>> compiled_stl.robustness(0, signal)
+        1.0
+        >>> compiled_stl.compiled   # False when the reference interpreter is used
+        True
+    """
+
+    def __init__(self, stl_expr):
+        self.stl_expr = stl_expr
+        self.compiled_expr: Optional[compiler.Compiled_Expr] = compiler.compile_expr(stl_expr.parsed_expr)
+
+    def eval(self, time_begin: int, signal: Signal) -> Eval_Result:
+        """evaluate the compiled STL expression with respect to the signal
+
+        Args:
+            time_begin (int): global begin time
+            signal (Signal): signal to be evaluated
+        """
+        if self.compiled_expr is None or (signal.timestamps is not None and self.compiled_expr.fixed_window):
+            return Interpreter(time_begin, signal).interpret(self.stl_expr.parsed_expr)
+
+        return self.compiled_expr.eval(time_begin, signal)
+
+    def satisfy(self, time_begin: int, signal: Signal) -> bool:
+        return self.eval(time_begin, signal).satisfy
+
+    def robustness(self, time_begin: int, signal: Signal) -> float:
+        return self.eval(time_begin, signal).robustness
+
+    def __str__(self):
+        return str(self.stl_expr)
+
+    @property
+    def compiled(self) -> bool:
+        """whether the expression is compiled (otherwise it is evaluated by the reference interpreter)"""
+        return self.compiled_expr is not None
@@ -0,0 +1,92 @@
+# Sun Oct 18 16:52:07 EDT 2026
+# online monitor of STL expressions for streaming signals
+
+import json
+from typing import Optional
+
+import stl.error as error
+import stl.parsing.online as online
+from stl.obj.result import STL_Expr_Eval_Result, Trace_Eval_Result
+
+
+class Monitor:
+    """online monitor, evaluates an STL expression incrementally as the signal elements arrive
+
+    Every node of the AST keeps its own incremental state (e.g. sliding minimum/maximum deques for G
+    and F), so the cost per signal element is amortized O(1) regardless of the length of the signal
+    and the time intervals. The evaluation result for the begin time t is available once the signal
+    element at t + horizon of the expression has been appended.
+
+    Usage:
+        >>> monitor = STL("G[0, 1](x > 0)").monitor()
+        >>> len(monitor.append(py_dict={"x": 1}))   # no result yet
+        0
+        >>> print(monitor.append(py_dict={"x": 2}))
+        time = 0, satisfy = True, robustness = 1.0
+        >>> print(monitor.extend([{"x": -1}, {"x": 3}]))
+        time = 1, satisfy = False, robustness = -1.0
+        time = 2, satisfy = False, robustness = -1.0
+        >>> monitor.begin_time                     # begin time of the next evaluation result
+        3
+    """
+
+    def __init__(self, parsed_expr):
+        self.parsed_expr = parsed_expr
+        self.stream = online.build_stream(parsed_expr)
+
+        self.length_val = 0       # number of signal elements appended
+        self.begin_time_val = 0   # begin time of the next evaluation result
+        self.eval_result_val: Optional[STL_Expr_Eval_Result] = None
+
+    def append(self, json_str=None, py_dict=None) -> Trace_Eval_Result:
+        """append an element to the monitored signal, return the evaluation results that became available"""
+
+        # case when both parameters are not given
+        if not json_str and not py_dict:
+            raise error.Signal_Error("No signal content data is supplied! Signal is not appended.")
+
+        # case when both parameters are supplied
+        elif json_str and py_dict:
+            raise error.Signal_Error("Ambiguity when adding to Signal. Both json_str and py_dict are supplied.")
+
+        # if json_str is supplied, convert it to Python dictionary
+        if json_str:
+            py_dict = json.loads(json_str)
+
+        return self.extend([py_dict])
+
+    def extend(self, py_dict_list: list) -> Trace_Eval_Result:
+        """append a batch of elements to the monitored signal, return the evaluation results that became available"""
+        begin_time = self.begin_time_val
+        satisfy_list = list()
+        robustness_list = list()
+
+        for py_dict in py_dict_list:
+            for satisfy, robustness in self.stream.update(py_dict):
+                satisfy_list.append(bool(satisfy))
+                robustness_list.append(None if robustness is None else float(robustness))
+
+            self.length_val += 1
+
+        if satisfy_list:
+            self.begin_time_val += len(satisfy_list)
+            self.eval_result_val = STL_Expr_Eval_Result(satisfy=satisfy_list[-1], robustness=robustness_list[-1])
+
+        # robustness is not defined for expressions that are not quantifiable
+        if None in robustness_list:
+            robustness_list = None
+
+        return Trace_Eval_Result(begin_time, satisfy_list, robustness_list)
+
+    def __len__(self) -> int:
+        return self.length_val
+
+    @property
+    def begin_time(self) -> int:
+        """begin time of the next evaluation result"""
+        return self.begin_time_val
+
+    @property
+    def eval_result(self) -> Optional[STL_Expr_Eval_Result]:
+        """the latest evaluation result (for the begin time self.begin_time - 1)"""
+        return self.eval_result_val
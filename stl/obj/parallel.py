@@ -0,0 +1,362 @@
+# Mon Oct 19 04:12:55 EDT 2026
+# parallel evaluation of STL expressions, over many signals or over the time chunks of a long signal
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import numpy as np
+
+import stl.error as error
+
+# offsets of the arrays within a shared memory block are multiples of the alignment (in bytes)
+ALIGNMENT = 64
+
+# evaluation function of the worker process, built once by init_worker
+worker_evaluate: Optional[Callable] = None
+
+
+class Shared_Signals:
+    """the columns of a chunk of signals, copied into one shared memory block
+
+    the signals are converted to columns (see Signal.to_arrays), the columns of numbers and booleans, their
+    validity masks and the timestamps are copied into the block, thus only their layout (dtype, offset and
+    length) is pickled to the worker processes, which wrap the memory of the block without copying it. the
+    other columns (e.g. strings) are pickled as arrays.
+
+    Usage:
+        >>> shared_signals = Shared_Signals([signal_1, signal_2])
+        >>> Shared_Signals.attach(shared_signals.name, shared_signals.layouts)   # in the worker process
+        >>> shared_signals.release()   # in the parent process, once the chunk is evaluated
+    """
+
+    def __init__(self, signals: list):
+        arrays = list()   # [(offset in the block, array to copy), ...]
+        self.layouts: list[dict] = list()
+        size = 0
+
+        def add(array: np.ndarray) -> tuple:
+            nonlocal size
+            offset = size
+            arrays.append((offset, array))
+            size += (array.nbytes + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+            return array.dtype.str, offset, len(array)
+
+        for signal in signals:
+            columns = dict()
+
+            for key, array in signal.to_arrays().items():
+                mask = None
+                if isinstance(array, np.ma.MaskedArray):
+                    mask = np.ma.getmaskarray(array)
+                    array = array.data
+
+                if array.dtype.kind in "biuf":
+                    columns[key] = ("shared", add(array), None if mask is None else add(mask))
+                else:
+                    columns[key] = ("copied", array if mask is None else np.ma.MaskedArray(array, mask=mask))
+
+            timestamps = signal.timestamps
+            if timestamps is not None:
+                timestamps = np.asarray(timestamps)
+                timestamps = ("shared", add(timestamps), None) if timestamps.dtype.kind in "iuf" else \
+                    ("copied", timestamps)
+
+            self.layouts.append({"columns": columns, "timestamps": timestamps})
+
+        self.block = shared_memory.SharedMemory(create=True, size=max(1, size))
+        self.name: str = self.block.name
+
+        for offset, array in arrays:
+            np.ndarray(len(array), dtype=array.dtype, buffer=self.block.buf, offset=offset)[:] = array
+
+    def release(self) -> None:
+        """close and remove the shared memory block (the worker processes may still map it)"""
+        self.block.close()
+        self.block.unlink()
+
+    @staticmethod
+    def attach(name: str, layouts: list[dict]) -> tuple[shared_memory.SharedMemory, list]:
+        """map the shared memory block, return it with the signals wrapping its memory (read-only)"""
+        from stl.obj.signal import Signal
+
+        block = shared_memory.SharedMemory(name=name)
+
+        def load(entry) -> Any:
+            if entry[0] == "copied":
+                return entry[1]
+
+            (dtype, offset, length), mask_layout = entry[1], entry[2]
+            array = np.ndarray(length, dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+            array.flags.writeable = False
+
+            if mask_layout is not None:
+                array = np.ma.MaskedArray(array, mask=load(("shared", mask_layout, None)))
+
+            return array
+
+        signals = [Signal.from_arrays({key: load(entry) for key, entry in layout["columns"].items()},
+                                      timestamps=None if layout["timestamps"] is None else load(layout["timestamps"]))
+                   for layout in layouts]
+
+        return block, signals
+
+
+class Parallel_Evaluator:
+    """pool of worker processes evaluating the same STL expression (or Spec_Set) over many signals
+
+    the expression texts are sent to each worker process once, when it starts, and each worker parses (and
+    compiles) them once. the signals are sent by chunks, each chunk in one shared memory block (see
+    Shared_Signals) rather than pickled. the results are returned in the order of the signals, as soon as
+    the preceding chunks are evaluated, while the progress callback reports every evaluated chunk.
+
+    the signals may be a generator (e.g. traces loaded from files one by one), at most two chunks per worker
+    are loaded at any time. the workers evaluate columnar copies of the signals, thus the storage engine and
+    the range indices of the given signals do not apply.
+
+    the ASTs are not picklable, thus STL objects without expression text (e.g. the results of STL.weaken)
+    cannot be sent to the workers, the signals are then evaluated in the calling process.
+
+    Attributes:
+        engine: "compiled" (default), "reference" or "numpy" for one STL expression, "batch" for a Spec_Set,
+            "trace" to evaluate one STL expression for every begin time of the signals (see eval_trace)
+        workers: number of worker processes (os.cpu_count() by default), a single worker evaluates the
+            signals in the calling process instead
+
+    Usage:
+        >>> with Parallel_Evaluator(["G[0, 10](x > 0)"], workers=8) as evaluator:
+        ...     results = list(evaluator.imap(0, signals, callback=lambda done, total: print(done, "/", total)))
+    """
+
+    def __init__(self, stl_exprs: list, engine: str = "compiled", workers: Optional[int] = None):
+        if engine not in ("compiled", "reference", "numpy", "batch", "trace"):
+            raise error.STL_Error("Evaluation engine \"" + str(engine) + "\" is not recognized. " +
+                                  "Supported engines are compiled, reference, numpy, batch, trace")
+
+        # expression texts, or STL objects (their texts are sent to the workers)
+        self.stl_exprs = list(stl_exprs)
+        self.stl_texts: list = [stl_expr if isinstance(stl_expr, str) else stl_expr.value
+                                for stl_expr in self.stl_exprs]
+        self.engine = engine
+        self.workers: int = (os.cpu_count() or 1) if workers is None else max(1, workers)
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.evaluate: Optional[Callable] = None   # evaluation function of the calling process
+
+        if any(stl_text is None for stl_text in self.stl_texts):
+            self.workers = 1
+
+        if self.workers > 1:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=init_worker,
+                                            initargs=(self.stl_texts, self.engine))
+        else:
+            self.evaluate = build_evaluate(self.stl_exprs, self.engine)
+
+    def __enter__(self) -> "Parallel_Evaluator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """shut the worker processes down"""
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    def imap(self, time_begin: int, signals: Iterable, chunk_size: Optional[int] = None,
+             callback: Optional[Callable[[int, Optional[int]], None]] = None) -> Iterator:
+        """evaluate the signals, yield the results in the order of the signals
+
+        Args:
+            time_begin (int): global begin time
+            signals: iterable of Signal objects
+            chunk_size (int): number of signals sent to a worker at once, by default about a quarter of the
+                signals per worker (at most 256) when the number of signals is known, 16 otherwise
+            callback: called with (number of evaluated signals, number of signals or None) after each chunk
+        """
+        total = len(signals) if hasattr(signals, "__len__") else None
+
+        if chunk_size is None:
+            chunk_size = 16 if total is None else max(1, min(256, -(-total // (4 * self.workers))))
+
+        completed = 0
+        signals = iter(signals)
+
+        if self.pool is None:
+            for signal in signals:
+                yield self.evaluate(time_begin, signal)
+
+                completed += 1
+                if callback is not None and (completed % chunk_size == 0 or completed == total):
+                    callback(completed, total)
+            return
+
+        pending: deque = deque()   # [(future, Shared_Signals, chunk size), ...] in the order of the signals
+        reported = set()           # futures of the evaluated chunks reported to the callback
+
+        try:
+            while True:
+                # keep every worker busy, with one chunk ready for each of them
+                while len(pending) < 2 * self.workers:
+                    chunk = list(islice(signals, chunk_size))
+                    if not chunk:
+                        break
+
+                    shared_signals = Shared_Signals(chunk)
+                    pending.append((self.pool.submit(eval_chunk, time_begin, shared_signals.name,
+                                                     shared_signals.layouts), shared_signals, len(chunk)))
+
+                if not pending:
+                    break
+
+                # report the chunks evaluated while waiting for the first chunk, whose results are yielded first
+                future = pending[0][0]
+                while future not in reported:
+                    wait([entry[0] for entry in pending if entry[0] not in reported], return_when=FIRST_COMPLETED)
+
+                    for entry in pending:
+                        if entry[0].done() and entry[0] not in reported:
+                            reported.add(entry[0])
+                            completed += entry[2]
+                            if callback is not None:
+                                callback(completed, total)
+
+                future, shared_signals, _ = pending.popleft()
+                reported.discard(future)
+                shared_signals.release()
+
+                yield from future.result()
+
+        finally:
+            # the generator is closed or an evaluation failed
+            for future, shared_signals, _ in pending:
+                future.cancel()
+                shared_signals.release()
+
+
+def build_evaluate(stl_exprs: list, engine: str) -> Callable:
+    """return the function evaluating the STL expression (Spec_Set for the batch engine) over a signal, from
+    expression texts or STL objects"""
+    from stl.obj.stl import STL
+    from stl.obj.spec_set import Spec_Set
+
+    if engine == "batch":
+        return Spec_Set(stl_exprs).eval
+
+    stl_expr = STL(stl_exprs[0]) if isinstance(stl_exprs[0], str) else stl_exprs[0]
+    if engine == "compiled":
+        return stl_expr.compile().eval
+    elif engine == "trace":
+        return lambda time_begin, signal: stl_expr.eval_trace(signal, time_begin)
+
+    return lambda time_begin, signal: stl_expr.eval(time_begin, signal, engine=engine)
+
+
+def init_worker(stl_texts: list[str], engine: str) -> None:
+    global worker_evaluate
+    worker_evaluate = build_evaluate(stl_texts, engine)
+
+
+def eval_chunk(time_begin: int, name: str, layouts: list[dict]) -> list:
+    """evaluate a chunk of signals in a worker process"""
+    block, signals = Shared_Signals.attach(name, layouts)
+
+    try:
+        return [worker_evaluate(time_begin, signal) for signal in signals]
+    finally:
+        # the arrays must not reference the memory of the block once it is closed
+        del signals
+        block.close()
+
+
+def eval_many(stl_exprs: list, engine: str, time_begin: int, signals: Iterable, workers: Optional[int] = None,
+              chunk_size: Optional[int] = None, callback: Optional[Callable[[int, Optional[int]], None]] = None) -> list:
+    """evaluate the signals by a pool of worker processes, return the results in the order of the signals"""
+    with Parallel_Evaluator(stl_exprs, engine, workers) as evaluator:
+        return list(evaluator.imap(time_begin, signals, chunk_size, callback))
+
+
+def partition(begin: int, end: int, chunk_size: int) -> list[tuple[int, int]]:
+    """split the range of begin times [begin, end] into consecutive chunks of at most chunk_size begin times"""
+    return [(chunk_begin, min(end, chunk_begin + chunk_size - 1)) for chunk_begin in range(begin, end + 1, chunk_size)]
+
+
+def eval_trace(stl_expr, signal, begin: Optional[int] = None, end: Optional[int] = None, workers: Optional[int] = None,
+               chunk_size: Optional[int] = None, executor: str = "process",
+               callback: Optional[Callable[[int, Optional[int]], None]] = None):
+    """evaluate the STL expression for every begin time within [begin, end] (see STL.eval_trace), with the range
+    of begin times split into chunks evaluated in parallel
+
+    the result at a begin time only depends on the signal elements from the begin time to the begin time plus
+    the horizon of the expression (the bounds of its nested time intervals, see Vectorized_Evaluator.horizon),
+    thus the chunk of begin times [b, e] is evaluated over the slice [b, e + horizon] of the signal, and the
+    results of the chunks are concatenated, identical to the results of a single evaluation. the slices are
+    views of the columns of the signal, copied into shared memory for worker processes.
+
+    Args:
+        workers (int): number of workers, os.cpu_count() by default
+        chunk_size (int): number of begin times of a chunk, by default two chunks per worker
+        executor (str): "process" (default) or "thread", threads share the signal without copying it, but only
+            run in parallel while NumPy releases the global interpreter lock. STL objects without expression
+            text (e.g. the results of STL.weaken) are evaluated by threads
+        callback: progress, called with (number of evaluated chunks, number of chunks)
+    """
+    from stl.obj.result import Trace_Eval_Result
+    from stl.obj.signal import Signal
+    from stl.parsing.interpreter import Interpreter
+    from stl.parsing.vectorized import Vectorized_Evaluator
+
+    if executor not in ("process", "thread"):
+        raise error.STL_Error("Executor \"" + str(executor) + "\" is not recognized. Supported executors are " +
+                              "process, thread")
+    if executor == "process" and stl_expr.value is None:
+        # the AST cannot be sent to worker processes, the threads share it
+        executor = "thread"
+
+    begin = 0 if begin is None else begin
+    workers = (os.cpu_count() or 1) if workers is None else max(1, workers)
+    interpreter = Interpreter(begin, signal)
+
+    # timestamped signals, signals too short for the range, and expressions without identifiers are evaluated
+    # at once, which reports the errors
+    arrays = signal.to_arrays() if signal.timestamps is None else dict()
+    if not arrays or workers == 1:
+        return interpreter.interpret_trace(stl_expr.parsed_expr, end)
+
+    interpreter.type_check(stl_expr.parsed_expr)
+    horizon = Vectorized_Evaluator(signal, begin).horizon(stl_expr.parsed_expr)
+    end = len(signal) - 1 - horizon if end is None else end
+
+    if not 0 <= begin <= end <= len(signal) - 1 - horizon:
+        return interpreter.interpret_trace(stl_expr.parsed_expr, end)
+
+    chunks = partition(begin, end, chunk_size or max(1, -(-(end - begin + 1) // (2 * workers))))
+    if len(chunks) == 1:
+        return interpreter.interpret_trace(stl_expr.parsed_expr, end)
+
+    chunk_signals = [Signal.from_arrays({key: array[chunk_begin:chunk_end + horizon + 1]
+                                         for key, array in arrays.items()})
+                     for chunk_begin, chunk_end in chunks]
+
+    if executor == "process":
+        with Parallel_Evaluator([stl_expr.value], "trace", workers) as evaluator:
+            traces = list(evaluator.imap(0, chunk_signals, chunk_size=1, callback=callback))
+
+    else:
+        with ThreadPoolExecutor(workers) as thread_pool:
+            futures = [thread_pool.submit(Interpreter(0, chunk_signal).interpret_trace, stl_expr.parsed_expr)
+                       for chunk_signal in chunk_signals]
+
+            for completed, _ in enumerate(as_completed(futures), 1):
+                if callback is not None:
+                    callback(completed, len(futures))
+
+            traces = [future.result() for future in futures]
+
+    satisfy = np.concatenate([trace.satisfy for trace in traces])
+    robustness = None if traces[0].robustness is None else np.concatenate([trace.robustness for trace in traces])
+
+    return Trace_Eval_Result(begin, satisfy, robustness)
@@ -0,0 +1,169 @@
+# Sun Oct 18 23:20:36 EDT 2026
+# range minimum/maximum index of the conditions of STL expressions over a signal
+
+from typing import Optional
+
+import numpy as np
+
+from stl.parsing.window import Segment_Tree, Sparse_Table
+
+
+class Range_Index:
+    """satisfaction and robustness values of a condition over the entire signal, indexed by sparse tables
+
+    the minimum (G) and maximum (F) of the values within any window of the signal is answered in O(1).
+    the tables for the minimum and the maximum are built in O(n log n) upon their first query. the
+    index is static, it is rebuilt once the signal changes (see Dynamic_Range_Index).
+
+    Attributes:
+        condition: the condition of the STL expression (AST node)
+        satisfy: satisfaction (boolean) value of the condition for every index of the signal
+        robustness: robustness (float) value of the condition for every index of the signal
+
+    Usage:
+        >>> range_index = Range_Index.build(signal, STL("G[0, 1](x > 0)").parsed_expr.begin_condition)
+        >>> range_index.minimum(0, 1)   # (satisfy, robustness) of G over the indices [0, 1]
+        (True, 1.0)
+    """
+
+    # name used to select the range index in the Signal constructor
+    name = "sparse"
+
+    def __init__(self, condition, satisfy: np.ndarray, robustness: np.ndarray):
+        self.condition = condition
+        self.satisfy = satisfy
+        self.robustness = robustness
+        self.minimum_tables: Optional[tuple] = None
+        self.maximum_tables: Optional[tuple] = None
+
+    @classmethod
+    def build(cls, signal, condition) -> Optional["Range_Index"]:
+        """evaluate the condition for every index of the signal, return None if the condition is not
+        quantifiable, does not depend on the signal, or cannot be evaluated for some elements of the signal
+        (e.g. elements missing an identifier), in which case G and F evaluate their windows instead"""
+        try:
+            values = Range_Index.evaluate(signal, condition, 0, len(signal) - 1)
+        except Exception:
+            # the elements out of the queried windows must not fail the evaluation
+            return None
+
+        if values is None:
+            return None
+
+        return cls(condition, *values)
+
+    @staticmethod
+    def evaluate(signal, condition, begin_index: int, end_index: int) -> Optional[tuple]:
+        """evaluate the condition for the indices [begin_index, end_index] by the vectorized engine, return
+        the arrays of satisfaction and robustness values (None if the condition is not quantifiable)
+
+        the values are indexed by the positions of the elements, the times of a timestamped signal only
+        resolve the windows of the queries
+        """
+        from stl.parsing.vectorized import Vectorized_Evaluator
+
+        if signal.timestamps is not None:
+            signal = signal.element_view()
+
+        evaluator = Vectorized_Evaluator(signal, 0)
+        satisfy, robustness = Vectorized_Evaluator.as_pair(evaluator.eval(condition, begin_index, end_index))
+
+        if robustness is None or np.ndim(satisfy) != 1 or np.ndim(robustness) != 1:
+            return None
+
+        return np.asarray(satisfy, dtype=np.bool_), np.asarray(robustness, dtype=np.float64)
+
+    def minimum(self, begin_index: int, end_index: int) -> tuple[bool, float]:
+        """return the satisfaction and robustness values of G over the indices [begin_index, end_index]"""
+        if self.minimum_tables is None:
+            self.minimum_tables = (Sparse_Table(self.satisfy, np.minimum), Sparse_Table(self.robustness, np.minimum))
+
+        satisfy_table, robustness_table = self.minimum_tables
+        return satisfy_table.query(begin_index, end_index), robustness_table.query(begin_index, end_index)
+
+    def maximum(self, begin_index: int, end_index: int) -> tuple[bool, float]:
+        """return the satisfaction and robustness values of F over the indices [begin_index, end_index]"""
+        if self.maximum_tables is None:
+            self.maximum_tables = (Sparse_Table(self.satisfy, np.maximum), Sparse_Table(self.robustness, np.maximum))
+
+        satisfy_table, robustness_table = self.maximum_tables
+        return satisfy_table.query(begin_index, end_index), robustness_table.query(begin_index, end_index)
+
+
+class Dynamic_Range_Index(Range_Index):
+    """range index backed by segment trees, which absorbs appended and modified signal elements
+
+    appending and modifying an element re-evaluates the condition for that element only and updates the
+    trees in O(log n), the minimum and maximum of a window are answered in O(log n).
+
+    Usage:
+        >>> range_index = Dynamic_Range_Index.build(signal, condition)
+        >>> range_index.append(True, 2.0)          # values of the condition for the appended element
+        >>> range_index.update(0, False, -1.0)     # values of the condition for the modified element
+    """
+
+    name = "segment"
+
+    def __init__(self, condition, satisfy: np.ndarray, robustness: np.ndarray):
+        # the values are kept as Python objects, which are faster to access one at a time
+        super().__init__(condition, satisfy.tolist(), robustness.tolist())
+
+    def minimum(self, begin_index: int, end_index: int) -> tuple[bool, float]:
+        if self.minimum_tables is None:
+            self.minimum_tables = (Segment_Tree(self.satisfy, min, True),
+                                   Segment_Tree(self.robustness, min, float("inf")))
+
+        satisfy_tree, robustness_tree = self.minimum_tables
+        return satisfy_tree.query(begin_index, end_index), robustness_tree.query(begin_index, end_index)
+
+    def maximum(self, begin_index: int, end_index: int) -> tuple[bool, float]:
+        if self.maximum_tables is None:
+            self.maximum_tables = (Segment_Tree(self.satisfy, max, False),
+                                   Segment_Tree(self.robustness, max, float("-inf")))
+
+        satisfy_tree, robustness_tree = self.maximum_tables
+        return satisfy_tree.query(begin_index, end_index), robustness_tree.query(begin_index, end_index)
+
+    def append(self, satisfy: bool, robustness: float) -> None:
+        """append the values of the condition for an element appended to the signal"""
+        self.satisfy.append(satisfy)
+        self.robustness.append(robustness)
+
+        for trees in (self.minimum_tables, self.maximum_tables):
+            if trees is not None:
+                trees[0].append(satisfy)
+                trees[1].append(robustness)
+
+    def update(self, index: int, satisfy: bool, robustness: float) -> None:
+        """replace the values of the condition for a modified element of the signal"""
+        self.satisfy[index] = satisfy
+        self.robustness[index] = robustness
+
+        for trees in (self.minimum_tables, self.maximum_tables):
+            if trees is not None:
+                trees[0].update(index, satisfy)
+                trees[1].update(index, robustness)
+
+    def refresh(self, signal, index: int) -> bool:
+        """re-evaluate the condition for the element at the index, which has been appended or modified
+
+        return False if the condition cannot be evaluated for the element (e.g. the element misses an entry),
+        the index is then left unchanged (stale), to be dropped by the signal
+        """
+        try:
+            satisfy, robustness = Range_Index.evaluate(signal, self.condition, index, index)
+            satisfy, robustness = bool(satisfy[0]), float(robustness[0])
+        except Exception:
+            return False
+
+        if index > len(self.satisfy):
+            return False
+        elif index == len(self.satisfy):
+            self.append(satisfy, robustness)
+        else:
+            self.update(index, satisfy, robustness)
+
+        return True
+
+
+range_indices = {Range_Index.name: Range_Index, Dynamic_Range_Index.name: Dynamic_Range_Index}
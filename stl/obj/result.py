@@ -26,6 +26,7 @@ class Eval_Result(metaclass=ABCMeta):
         self.satisfy_val = satisfy
         self.robustness_val = robustness
         self.probability_val = probability
+        self.profile_val = None  # per AST node evaluation statistics, only set when profiling
 
     @abstractmethod
     def __str__(self):
@@ -72,6 +73,15 @@ class Eval_Result(metaclass=ABCMeta):
     def probability(self, probability: Union[float, int]):
         self.probability_val = probability
 
+    @property
+    def profile(self):
+        """per AST node evaluation statistics (see stl.parsing.profiler.Profile_Report), None when not profiled"""
+        return self.profile_val
+
+    @profile.setter
+    def profile(self, profile):
+        self.profile_val = profile
+
 
 class Val_Eval_Result(Eval_Result, ABC):
     """wrapper class for the low-level Val object"""
@@ -138,6 +148,73 @@ class STL_Expr_Eval_Result(Eval_Result, ABC):
         return str(sb)
 
 
+class Trace_Eval_Result(Eval_Result, ABC):
+    """stores the evaluation results of an STL expression for consecutive begin times
+
+    satisfy and robustness are arrays indexed by the begin time minus begin_time, robustness is None
+    when the expression is not quantifiable
+
+    Usage:
+        >>> signal = Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"x": 2}}, "2": {"content": {"x": -1}}})
+        >>> trace = STL("G[0, 1](x > 0)").eval_trace(signal)
+        >>> trace.satisfy
+        array([ True, False])
+        >>> trace.robustness
+        array([ 1., -1.])
+        >>> print(trace[1])
+        satisfy     : False
+        robustness  : -1.0
+    """
+
+    def __init__(self, begin_time: int, satisfy, robustness=None):
+        super().__init__(satisfy=satisfy, robustness=robustness)
+        self.begin_time_val = begin_time
+
+    def __len__(self) -> int:
+        return len(self.satisfy_val)
+
+    def __getitem__(self, time: int) -> STL_Expr_Eval_Result:
+        """return the evaluation result for the begin time"""
+        if not self.begin_time <= time <= self.end_time:
+            raise error.Result_Error("begin time " + str(time) + " is not within the trace [" +
+                                     str(self.begin_time) + ", " + str(self.end_time) + "]")
+
+        index = time - self.begin_time
+        robustness = None if self.robustness_val is None else float(self.robustness_val[index])
+        return STL_Expr_Eval_Result(satisfy=bool(self.satisfy_val[index]), robustness=robustness)
+
+    def __str__(self):
+        sb = String_Builder()
+
+        for time in self.time:
+            if time != self.begin_time:
+                sb.append("\n")
+
+            sb.append("time = ")
+            sb.append(str(time))
+            sb.append(", satisfy = ")
+            sb.append(str(bool(self.satisfy_val[time - self.begin_time])))
+
+            if self.robustness_val is not None:
+                sb.append(", robustness = ")
+                sb.append(str(float(self.robustness_val[time - self.begin_time])))
+
+        return str(sb)
+
+    @property
+    def begin_time(self) -> int:
+        return self.begin_time_val
+
+    @property
+    def end_time(self) -> int:
+        return self.begin_time_val + len(self) - 1
+
+    @property
+    def time(self) -> range:
+        """begin times of the trace"""
+        return range(self.begin_time, self.end_time + 1)
+
+
 class Eval_Result_Transformer:
     """
     detect type of evaluation result and transform the low-level (parsing-level) evaluation result
@@ -6,11 +6,11 @@
 
 import json
 import stl.error as err
+from bisect import bisect_left, bisect_right
 
 from typing import Any
-from collections import OrderedDict
 import stl.obj.util as util
-import logging
+from stl.obj.storage import Signal_Storage, Dict_Storage, select_storage
 # JSON reference
 # json.loads(JSON str) -> dict (decode)
 # json.dumps(dict) -> JSON str (encode)
@@ -22,10 +22,17 @@ class Signal:
     """handles signal processing, conversion between JSON and Python dictionary
     internal representation
 
-    TODO: add timestamp entry to extend the capability of continous time evaluation
     Attributes:
-        data: a the python dictionary object that holds the signal
-        next_index: the index of the next signal to be inserted
+        storage: the storage engine that holds the signal, either the python dictionary
+            (default) or the columnar (NumPy array per key) storage engine
+        timestamps: optional strictly increasing timestamps of the elements (list or NumPy array). without
+            timestamps, the index of an element is its time. with timestamps, the times of lookups and of
+            the time intervals of STL expressions are timestamps, resolved to indices by binary search
+        range_index: whether the reference interpreter answers G and F with range minimum/maximum indices
+            of their conditions, built upon the first query of each condition and cached on the signal
+                False      : no range index (default)
+                "sparse"   : sparse tables (True), O(1) queries, rebuilt once an element is appended or set
+                "segment"  : segment trees, O(log n) queries, absorb appended and set elements in O(log n)
 
     Usage:
         constructor
@@ -35,12 +42,35 @@ class Signal:
         >>> sig_from_dict_nested = Signal(py_dict = {"0": {"content": {"x": 0, "y": {"z": 0}}}, "1": {"content": {"x": 0, "y": {"z": 2}}}})
         >>> sig_from_dict_nested.lookup("y.z")
         [0, 2]
+        columnar storage engine (one NumPy array per flattened key), same API
+        >>> sig_columnar = Signal(py_dict = {"0": {"content": {"x": 0, "y": 0}}}, storage = "columnar")
+        save to (and memory-map from) the binary signal file format
+        >>> sig_columnar.save("signal.stlsig")
+        >>> sig_mapped = Signal.open("signal.stlsig")
         append new elements to signal
         >>> sig.append(json_str = '{"x": 7, "y": 7}')
         >>> sig.append(py_dict = {"x": 7, "y": 7})
+        wrap NumPy arrays (or the columns of a data frame) without copying
+        >>> sig_from_arrays = Signal.from_arrays(x = np.arange(10.0), y = np.zeros(10))
+        >>> arrays = sig_from_arrays.to_arrays()
+        stream newline-delimited JSON (or a large JSON file) into the signal
+        >>> sig_from_ndjson = Signal.from_ndjson("signal.ndjson", storage = "columnar")
+        >>> sig_from_file = Signal.from_json("signal.json", storage = "columnar")
+        timestamped (non-uniformly sampled) signal, times are timestamps
+        >>> sig_timestamped = Signal(py_dict = {"0": {"timestamp": 0.0, "content": {"x": 0}}, "1": {"timestamp": 0.3, "content": {"x": 1}}})
+        >>> sig_timestamped = Signal(py_dict = {"0": {"content": {"x": 0}}, "1": {"content": {"x": 1}}}, timestamps = [0.0, 0.3])
+        >>> sig_timestamped.append(py_dict = {"x": 2}, timestamp = 1.2)
+        >>> sig_timestamped.lookup("x", begin_time = 0.1, end_time = 1.5)
+        [1, 2]
+        answer the windows of G and F in O(1) for repeated queries
+        >>> sig_indexed = Signal(py_dict = {"0": {"content": {"x": 0}}, "1": {"content": {"x": 1}}}, range_index = True)
+        modify an element, keep the range indices up to date for long-lived signals
+        >>> sig_dynamic = Signal(py_dict = {"0": {"content": {"x": 0}}, "1": {"content": {"x": 1}}}, range_index = "segment")
+        >>> sig_dynamic.set(0, py_dict = {"x": 5})
     """
 
-    def __init__(self, json_str: str = "", py_dict: dict[str, Any] = dict()) -> None:
+    def __init__(self, json_str: str = "", py_dict: dict[str, Any] = dict(), storage: str = "dict",
+                 timestamps=None, range_index=False) -> None:
         """initialize the Signal object
 
         Note:
@@ -49,20 +79,26 @@ class Signal:
         Args:
             json_str (str): optional JSON string
             py_dict (dict): optional Python dictionary object
+            storage (str): storage engine holding the samples, "dict" (default) or "columnar"
+            timestamps: optional strictly increasing timestamps of the elements (list or NumPy array),
+                alternatively given by the "timestamp" entry of every element of the signal
+            range_index: range minimum/maximum indices of the conditions of G and F, False (default),
+                "sparse" (or True) or "segment"
             
         
         Raises:
             Signal_Error: An error occurred when create or modify a signal
         """
 
+        # initialize empty data
+        self._storage: Signal_Storage = select_storage(storage)
+        self.timestamps_val = None
+        self.range_index_cache: dict = dict()  # {str(condition): Optional[Range_Index], ...}
+        self.range_index = range_index
+
         # case when both parameters are not given
         if not json_str and not py_dict:
-
-            # initialize empty data
-            self._signal_data: dict = dict()
-
-            # set the next index to be inserted (initialize to 0)
-            self._next_index: int = 0
+            pass
 
         # user supplied both JSON and Python dictionary data
         elif json_str and py_dict:
@@ -81,21 +117,25 @@ class Signal:
             is_verified, msg = Signal.static_verify_signal(py_dict)
 
             if is_verified:
-                self._signal_data = py_dict
+                self.signal_data = py_dict
             else:
                 raise err.Signal_Error("Signal specified is Invalid! " + msg)
 
-            self._next_index = len(self._signal_data)
+        if timestamps is not None:
+            self.timestamps = timestamps
 
     def is_empty(self) -> bool:
-        return len(self._signal_data) == 0
+        return len(self._storage) == 0
 
     def print_json(self) -> None:
         """print the json string"""
         print(self._get_json_str())
 
-    def append(self, json_str=None, py_dict=None) -> None:
-        """append an element to the signal"""
+    def append(self, json_str=None, py_dict=None, timestamp=None) -> None:
+        """append an element to the signal, the timestamp is required by (and only by) timestamped signals
+
+        an empty signal becomes timestamped when its first element is appended with a timestamp
+        """
 
         # case when both parameters are not given
         if not json_str and not py_dict:
@@ -111,27 +151,298 @@ class Signal:
             if json_str and not py_dict:
                 py_dict = json.loads(json_str)
 
-            # add the newly added signal content to the "content" field of the signal data
-            # initialize dictionary in the specific index
-            self._signal_data[str(self._next_index)] = dict()
-            self._signal_data[str(self._next_index)]["content"] = py_dict
+            self._append_element(py_dict, timestamp)
+
+    def _append_element(self, content: dict, timestamp=None) -> None:
+        """append the content of an element (and its timestamp) to the storage engine"""
+        if timestamp is not None:
+            if self.timestamps_val is None:
+                if len(self) > 0:
+                    raise err.Signal_Error("Cannot append a timestamped element to a signal without timestamps.")
+                self.timestamps_val = list()
+
+            elif len(self.timestamps_val) > 0 and not timestamp > self.timestamps_val[-1]:
+                raise err.Signal_Error("Timestamps of a signal must be strictly increasing! " +
+                                       "timestamp = " + str(timestamp) +
+                                       ", last timestamp = " + str(self.timestamps_val[-1]))
+
+            elif not isinstance(self.timestamps_val, list):
+                # timestamps wrapped from an array are copied upon the first append
+                self.timestamps_val = self.timestamps_val.tolist()
+
+            self.timestamps_val.append(timestamp)
+
+        elif self.timestamps_val is not None:
+            raise err.Signal_Error("Elements appended to a timestamped signal require a timestamp.")
+
+        # add the newly added signal content to the "content" field of the signal data
+        self._storage.append(content)
+        self._refresh_range_indices(len(self) - 1)
+
+    def set(self, index: int, json_str=None, py_dict=None) -> None:
+        """replace the content of the element at the index (the timestamp, if any, is kept)
+
+        Usage:
+            >>> sig = Signal(py_dict = {"0": {"content": {"x": 0}}, "1": {"content": {"x": 1}}})
+            >>> sig.set(1, py_dict = {"x": 7})
+            >>> sig.lookup("x")
+            [0, 7]
+        """
+        if not json_str and not py_dict:
+            raise err.Signal_Error("No signal content data is supplied! Signal is not modified.")
+
+        elif json_str and py_dict:
+            raise err.Signal_Error("Ambiguity when modifying Signal. Both json_str and py_dict are supplied.")
+
+        if not 0 <= index < len(self):
+            raise err.Signal_Error("Signal Index Out of Range! index = " + str(index) +
+                                   ", signal length = " + str(len(self)))
+
+        if json_str:
+            py_dict = json.loads(json_str)
+
+        self._storage.set(index, py_dict)
+        self._refresh_range_indices(index)
+
+    def _refresh_range_indices(self, index: int) -> None:
+        """update the range indices for the element at the index, which has been appended or modified"""
+        if self.range_index_val != "segment":
+            # static range indices are rebuilt upon their next query
+            self.range_index_cache.clear()
+            return
+
+        # the indices that cannot absorb the element are dropped, and rebuilt upon their next query (maintaining
+        # the indices never fails the modification of the signal). the conditions without index are retried as
+        # well, the element may have made them indexable (e.g. it replaced an element missing an entry)
+        for key, range_index in list(self.range_index_cache.items()):
+            if range_index is None or not range_index.refresh(self, index):
+                del self.range_index_cache[key]
+
+    def extend(self, py_dict_list) -> None:
+        """append the elements of an iterable (e.g. a generator) to the signal, one element at a time"""
+        for py_dict in py_dict_list:
+            self._append_element(py_dict)
+
+    @staticmethod
+    def from_ndjson(source, storage: str = "dict", timestamp_key: Optional[str] = None) -> 'Signal':
+        """read a signal from newline-delimited JSON (one {"x": 0, ...} element per line)
+
+        the lines are decoded into the storage engine one at a time, thus the whole dictionary tree of the
+        signal is never held in memory (use the columnar storage engine to keep the signal itself compact)
+
+        Args:
+            source: path of the file, file object or iterable of lines
+            storage (str): storage engine holding the samples, "dict" (default) or "columnar"
+            timestamp_key (str): optional (top-level) key of the timestamp of each element, which is
+                removed from the content of the element
+
+        Usage:
+            >>> sig = Signal.from_ndjson(['{"x": 0, "y": 1}', '{"x": 2, "y": 3}'], storage="columnar")
+            >>> sig.lookup("x")
+            [0, 2]
+        """
+        from stl.obj.signal_stream import read_ndjson
+
+        result = Signal(storage=storage)
+
+        if timestamp_key is None:
+            result.extend(read_ndjson(source))
+        else:
+            for py_dict in read_ndjson(source):
+                result._append_element(py_dict, py_dict.pop(timestamp_key))
+
+        return result
+
+    @staticmethod
+    def from_json(source, storage: str = "dict", chunk_size: int = 1 << 16) -> 'Signal':
+        """read a signal in the {"0": {"content": {...}}, ...} layout incrementally from a file
 
-            # increment the next index to be inserted
-            self._next_index += 1
+        unlike Signal(json_str=...), the text is read in chunks and decoded one element at a time
+
+        Args:
+            source: path of the file or file object
+            storage (str): storage engine holding the samples, "dict" (default) or "columnar"
+            chunk_size (int): number of characters read at once
+
+        Usage:
+            >>> sig = Signal.from_json("signal.json", storage="columnar")
+        """
+        from stl.obj.signal_stream import read_signal_json
+
+        result = Signal(storage=storage)
+
+        for signal_element in read_signal_json(source, chunk_size=chunk_size):
+            result._append_element(signal_element["content"], signal_element.get("timestamp"))
+
+        return result
+
+    @staticmethod
+    def from_arrays(arrays: Optional[dict] = None, timestamps=None, **columns) -> 'Signal':
+        """build a columnar signal from one-dimensional NumPy arrays (one per flattened key) of the same
+        length, without copying them
+
+        the signal shares the memory of the arrays, thus modifying an array modifies the signal (appending
+        to the signal copies the arrays first). entries masked by np.ma.MaskedArray are missing entries.
+
+        Args:
+            arrays (dict): optional {"flattened.key": array, ...}, for keys that are not Python identifiers
+            timestamps: optional strictly increasing timestamps of the elements, kept without copying
+            columns: arrays given as keyword arguments
+
+        Usage:
+            >>> sig = Signal.from_arrays(x=np.array([0.0, 1.0]), y=np.array([2, 3]))
+            >>> sig.lookup("y")
+            [2, 3]
+            >>> sig = Signal.from_arrays({"y.z": np.array([0.5, 1.5])})
+            >>> sig.lookup("y")
+            [{'z': 0.5}, {'z': 1.5}]
+        """
+        import numpy as np
+        from stl.obj.columnar import Columnar_Storage
+
+        result = Signal()
+        result._storage = Columnar_Storage.from_arrays({**(arrays or dict()), **columns})
+
+        if timestamps is not None:
+            result.timestamps = timestamps if isinstance(timestamps, list) else np.asarray(timestamps)
+
+        return result
+
+    @staticmethod
+    def from_dataframe(dataframe, timestamp_column: Optional[str] = None) -> 'Signal':
+        """build a columnar signal from the columns of a data frame (e.g. pandas.DataFrame), without copying
+        them whenever the data frame can expose a column as a NumPy array without copying
+
+        the data frame is duck typed, it needs the columns attribute and column access by name. the optional
+        timestamp column holds the timestamps of the elements instead of signal entries
+
+        Usage:
+            >>> sig = Signal.from_dataframe(pandas.DataFrame({"x": [0.0, 1.0], "y": [2, 3]}))
+            >>> sig.lookup("x")
+            [0.0, 1.0]
+        """
+        arrays = dict()
+
+        for column_name in dataframe.columns:
+            column = dataframe[column_name]
+            arrays[str(column_name)] = column.to_numpy() if hasattr(column, "to_numpy") else column
+
+        timestamps = None if timestamp_column is None else arrays.pop(str(timestamp_column))
+        return Signal.from_arrays(arrays, timestamps=timestamps)
+
+    def to_arrays(self) -> dict:
+        """return {"flattened.key": np.ndarray, ...} of the signal, i.e. the read-only columns of the columnar
+        storage engine without copying them (the samples of other storage engines are converted first)
+
+        columns missing some entries are returned as np.ma.MaskedArray
+
+        Usage:
+            >>> sig = Signal(py_dict = {"0": {"content": {"x": 0, "y": {"z": 0.5}}}, "1": {"content": {"x": 2, "y": {"z": 1.5}}}})
+            >>> sig.to_arrays()
+            {'x': array([0, 2]), 'y.z': array([0.5, 1.5])}
+        """
+        from stl.obj.columnar import Columnar_Storage
+        return Columnar_Storage.from_storage(self._storage).arrays()
+
+    def element_view(self) -> 'Signal':
+        """return a signal sharing the samples of the signal, without timestamps, i.e. the times of the view
+        are the indices of the elements (used by the range indices, which hold a value for every element)"""
+        result = Signal()
+        result._storage = self._storage
+        return result
 
     # =========== getter, setter, and deleter ==========
     @property
     def signal_data(self) -> dict[str, Any]:
-        return self._signal_data
+        """signal in the {"0": {"content": {...}}, ...} layout. note that the columnar storage engine
+        builds a new dictionary upon each access"""
+        return self._storage.to_py_dict()
 
     @signal_data.setter
     def signal_data(self, signal_data) -> None:
-        self._signal_data = signal_data
-        self._next_index = len(signal_data)
+        # replace the samples, keep the storage engine selected for the signal
+        self.timestamps_val = Signal.static_get_timestamps(signal_data)
+        self.range_index_cache.clear()
+
+        if isinstance(self._storage, Dict_Storage):
+            self._storage = Dict_Storage(signal_data)
+        else:
+            self._storage = select_storage(self._storage.name)
+            for signal_index in signal_data.keys():
+                self._storage.append(signal_data[signal_index]["content"])
 
     @signal_data.deleter
     def signal_data(self) -> None:
-        del self._signal_data
+        del self._storage
+
+    @property
+    def timestamps(self):
+        """timestamps of the elements, None when the index of an element is its time"""
+        return self.timestamps_val
+
+    @timestamps.setter
+    def timestamps(self, timestamps) -> None:
+        if timestamps is not None:
+            if len(timestamps) != len(self):
+                raise err.Signal_Error("Number of timestamps (" + str(len(timestamps)) + ") must match the " +
+                                       "length of the signal (" + str(len(self)) + ")")
+
+            if isinstance(timestamps, tuple):
+                timestamps = list(timestamps)
+
+            if isinstance(timestamps, list):
+                is_increasing = all(previous < current for previous, current in zip(timestamps, timestamps[1:]))
+            else:
+                # NumPy array, kept without copying
+                is_increasing = bool((timestamps[1:] > timestamps[:-1]).all())
+
+            if not is_increasing:
+                raise err.Signal_Error("Timestamps of a signal must be strictly increasing!")
+
+        self.timestamps_val = timestamps
+
+    @property
+    def range_index(self):
+        """the range minimum/maximum indices of the conditions of G and F (None, "sparse" or "segment")"""
+        return self.range_index_val
+
+    @range_index.setter
+    def range_index(self, range_index) -> None:
+        if range_index is True:
+            range_index = "sparse"
+        elif range_index is False:
+            range_index = None
+
+        if range_index not in (None, "sparse", "segment"):
+            raise err.Signal_Error("Range index \"" + str(range_index) + "\" is not recognized. " +
+                                   "Supported range indices are \"sparse\" and \"segment\"")
+
+        self.range_index_val = range_index
+        self.range_index_cache.clear()
+
+    def get_range_index(self, condition):
+        """return the (cached) range minimum/maximum index of the condition of an STL expression over the
+        signal, None if range indices are disabled or the condition is not quantifiable
+
+        the indices are keyed by the string representation of the condition, thus they are shared by all
+        the STL expressions with the same condition (regardless of their time intervals)
+        """
+        if not self.range_index_val or len(self) == 0:
+            return None
+
+        key = str(condition)
+
+        if key not in self.range_index_cache:
+            # numpy is only required by the range indices
+            from stl.obj.range_index import range_indices
+            self.range_index_cache[key] = range_indices[self.range_index_val].build(self, condition)
+
+        return self.range_index_cache[key]
+
+    @property
+    def storage(self) -> Signal_Storage:
+        """storage engine holding the samples of the signal"""
+        return self._storage
 
     @property
     def json(self) -> str:
@@ -141,12 +452,20 @@ class Signal:
         """return the sorted keys/indented string representation of the JSON
         
         Returns:
-            str: a formatted JSON string converted from the Python dictionary (self._signal_data
+            str: a formatted JSON string converted from the Python dictionary (self.signal_data)
         """
 
         # sort the signal_data by the int value of the index
-        # https://stackoverflow.com/questions/9001509/how-can-i-sort-a-dictionary-by-key
-        ordered_signal_data = OrderedDict(sorted(self._signal_data.items(), key=lambda item: int(item[0])))
+        ordered_signal_data = self._storage.to_json_dict()
+
+        if self.timestamps_val is not None:
+            timestamps = self.timestamps_val
+            if not isinstance(timestamps, list):
+                timestamps = timestamps.tolist()
+
+            for signal_index, timestamp in zip(ordered_signal_data.keys(), timestamps):
+                ordered_signal_data[signal_index] = {"timestamp": timestamp,
+                                                     "content": ordered_signal_data[signal_index]["content"]}
         # return json.dumps(self._signal_data, sort_keys=True, indent=4)
 
         return json.dumps(ordered_signal_data, indent=4)
@@ -154,7 +473,7 @@ class Signal:
     # =========== /getter, setter, and deleter ==========
 
     def verify_signal(self) -> tuple[bool, str]:
-        return Signal.static_verify_signal(self._signal_data)
+        return Signal.static_verify_signal(self.signal_data)
 
     @staticmethod
     def static_verify_signal(signal_data: dict[str, Any]) -> tuple[bool, str]:
@@ -178,32 +497,31 @@ class Signal:
         # if verifier has reached the end, return True for verification
         return True, ""
 
+    @staticmethod
+    def static_get_timestamps(signal_data: dict[str, Any]) -> Optional[list]:
+        """return the "timestamp" entries of the elements of the signal data, None if there are none
+
+        Raises:
+            Signal_Error: only some of the elements have a timestamp
+        """
+        timestamps = [signal_element.get("timestamp") for signal_element in signal_data.values()]
+
+        if all(timestamp is None for timestamp in timestamps):
+            return None
+
+        if any(timestamp is None for timestamp in timestamps):
+            raise err.Signal_Error("Signal specified is Invalid! Missing timestamps for signal")
+
+        return timestamps
+
     def get_quantifiable_keys(self) -> list[str]:
         # wrapper for get_quantifiable_keys for current object
-        return Signal.static_get_quantifiable_keys(self._signal_data)
+        return self._storage.get_quantifiable_keys()
 
     @staticmethod
     def static_get_quantifiable_keys(signal_data: dict) -> list[str]:
         """return all the common keys <union> throughout all signal contents that can be quantifiable"""
-        if len(signal_data) == 0:
-            # return empty list if self._signal_data is empty
-            return list()
-
-        elif len(signal_data) > 1:
-            # assume signal index start with 0
-            # note that set() extract a set of dictionary keys
-            signal_content_common_key_set = set(signal_data["0"]["content"])
-
-            # get the intersection of all signal elements keys
-            for signal_index in signal_data.keys():
-                signal_content_common_key_set = signal_content_common_key_set.intersection(
-                    set(signal_data[signal_index]["content"]))
-
-            return list(signal_content_common_key_set)
-
-        else:
-            # when there is only 1 element in the signal_data, return its keys
-            return signal_data["0"]["content"].keys()
+        return Signal_Storage.static_get_quantifiable_keys(signal_data)
 
     def __repr__(self) -> str:
         """representation of object, easy to debug on Python REPL"""
@@ -214,10 +532,40 @@ class Signal:
         return self._get_json_str()
 
     def __len__(self) -> int:
-        return len(self._signal_data)
+        return len(self._storage)
+
+    def save(self, path: str) -> None:
+        """save the signal to a binary (columnar) signal file, see stl/obj/signal_file.py for the layout
+
+        Raises:
+            Signal_Error: the signal holds entries other than numbers, booleans and strings
+        """
+        from stl.obj.signal_file import save_signal_file
+        save_signal_file(self._storage, path, self.timestamps_val)
+
+    @staticmethod
+    def open(path: str, mmap: bool = True) -> 'Signal':
+        """open a signal file saved by Signal.save, the signal uses the columnar storage engine
+
+        with mmap (default), the columns are memory-mapped read-only views of the file, thus lookups only
+        read the pages of the file holding the looked up range. appending to the signal copies the columns
+        to memory, the file is never modified.
+
+        Usage:
+            >>> sig = Signal(py_dict = {"0": {"content": {"x": 0}}, "1": {"content": {"x": 2}}})
+            >>> sig.save("signal.stlsig")
+            >>> Signal.open("signal.stlsig").lookup("x", begin_time=1, end_time=1)
+            [2]
+        """
+        from stl.obj.signal_file import open_signal_file
+
+        result = Signal()
+        result._storage, result.timestamps_val = open_signal_file(path, mmap=mmap)
+
+        return result
 
     def get(self, begin_time: int, end_time: int) -> 'Signal':
-        """get slice of signal by begin and end time
+        """get slice of signal by begin and end time, the slice of a timestamped signal keeps the timestamps
 
         Usage:
             >>> from stl.api import Signal
@@ -227,10 +575,15 @@ class Signal:
             >>> sig.get(1, 1)  # re-indexing occurs here. 1 is re-indexed to 0
             >>> Signal({"0": {"content": {"x": 0, "y": {"z": 2}}}})
         """
-        result = Signal()
-        for i in range(begin_time, end_time + 1):  # note that the end time will be included
-            curr_signal_element: dict = self._signal_data[str(i)]["content"]
-            result.append(py_dict=curr_signal_element)
+        begin_range, end_range = self.resolve_range(begin_time, end_time)
+
+        result = Signal(range_index=self.range_index_val)
+        result._storage = self._storage.slice(begin_range, end_range)  # note that the end time will be included
+
+        if self.timestamps_val is not None:
+            result.timestamps_val = self.timestamps_val[begin_range:end_range + 1]
+            if not isinstance(result.timestamps_val, list):
+                result.timestamps_val = result.timestamps_val.copy()
 
         return result
 
@@ -249,13 +602,77 @@ class Signal:
             >>> sig.lookup("y.z", ll=True)
             [<stl.parsing.ast_collection.val.Float_Val object at 0x108493d00>, <stl.parsing.ast_collection.val.Float_Val object at 0x108493cd0>]
         """
-        result = list()
-        id_name_split: list[str] = id_name.split(".")
+        begin_range, end_range = self.resolve_range(begin_time, end_time)
+
+        # note that the end time will be included
+        result = self._storage.lookup(id_name, begin_range, end_range)
+
+        if ll:
+            result = [util.py_obj_to_ll_obj(signal_content, int_to_float=True) for signal_content in result]
+
+        return result
+
+    def column(self, id_name: str, begin_time: Optional[int] = None, end_time: Optional[int] = None):
+        """
+        lookup groups of signals by identifiers name as a NumPy array, used by the vectorized interpreter
 
+        integers are converted to floating-point numbers (like the ll flag of lookup), missing entries
+        are converted to NaN
+
+        Usage:
+            >>> from stl.api import Signal
+            >>> sig = Signal(py_dict = {"0": {"content": {"x": 0, "y": {"z": 0}}}, "1": {"content": {"x": 0, "y": {"z": 2}}}})
+            >>> sig.column("y.z")
+            array([0., 2.])
+        """
+        begin_range, end_range = self.resolve_range(begin_time, end_time)
+        return self._storage.column(id_name, begin_range, end_range)
+
+    def index_range(self, begin_time, end_time) -> tuple[int, int]:
+        """return the (inclusive) index range of the elements within the time range [begin_time, end_time]
+
+        the times of a timestamped signal are resolved by binary search in O(log n), the range is empty
+        (begin index > end index) when no timestamp is within the time range. without timestamps, the times
+        are the indices.
+
+        Usage:
+            >>> sig = Signal(py_dict = {"0": {"content": {"x": 0}}, "1": {"content": {"x": 1}}}, timestamps = [0.0, 0.3])
+            >>> sig.index_range(0.1, 1.0)
+            (1, 1)
+        """
+        timestamps = self.timestamps_val
+
+        if timestamps is None:
+            return begin_time, end_time
+
+        elif isinstance(timestamps, list):
+            return bisect_left(timestamps, begin_time), bisect_right(timestamps, end_time) - 1
+
+        else:
+            # NumPy array
+            return int(timestamps.searchsorted(begin_time, "left")), int(timestamps.searchsorted(end_time, "right")) - 1
+
+    def resolve_range(self, begin_time: Optional[int], end_time: Optional[int]) -> tuple[int, int]:
+        """return the (inclusive) index range of the signal, ensure the range is within the bound"""
         # by default, begin and end range are the bound for the entire signal
         begin_range = 0
         end_range = len(self) - 1
 
+        if self.timestamps_val is not None and len(self) > 0 and (begin_time is not None or end_time is not None):
+            # times are resolved to indices by binary search
+            begin_time = self.timestamps_val[0] if begin_time is None else begin_time
+            end_time = self.timestamps_val[-1] if end_time is None else end_time
+
+            if begin_time <= end_time:
+                begin_index, end_index = self.index_range(begin_time, end_time)
+
+                if begin_index > end_index:
+                    raise error.Signal_Error("No signal element within the time range! " +
+                                             "begin_time = " + str(begin_time) +
+                                             ", end_time = " + str(end_time))
+
+                begin_time, end_time = begin_index, end_index
+
         if begin_time is not None:
             begin_range = begin_time
 
@@ -274,19 +691,4 @@ class Signal:
                                      ", end_range = " + str(end_range) +
                                      ", signal length = " + str(len(self)))
 
-        for i in range(begin_range, end_range + 1):  # note that the end time will be included
-            current_signal_content = self._signal_data[str(i)]["content"]
-
-            try:
-                for key in id_name_split:
-                    # print(key)
-                    current_signal_content = current_signal_content[key]
-            except Exception as e:
-                logging.exception(e)
-
-            if ll:
-                result.append(util.py_obj_to_ll_obj(current_signal_content, int_to_float=True))
-            else:
-                result.append(current_signal_content)
-
-        return result
+        return begin_range, end_range
@@ -0,0 +1,153 @@
+# Sun Oct 18 20:05:27 EDT 2026
+# binary columnar file format of signals, read through memory mapping
+
+"""
+Layout of a signal file (all integers are little-endian):
+
+    magic       8 bytes, b"STLSIGNL"
+    size        uint64, size of the header in bytes
+    header      JSON (UTF-8), {"version": 1, "length": number of samples,
+                               "columns": [{"key": "y.z", "dtype": "<f8", "offset": ..., "mask_offset": ...}, ...],
+                               "timestamps": null or {"dtype": "<f8", "offset": ...}}
+    padding     up to the next multiple of ALIGNMENT bytes, where the data section begins
+    data        one typed array per column (and per validity mask, if any) at the offset given by the header
+                (relative to the beginning of the data section), each array is aligned to ALIGNMENT bytes
+
+Masks (np.bool_) are only stored for the columns that miss some entries (see Columnar_Storage), timestamps
+are only stored for timestamped signals.
+"""
+
+import json
+import mmap as mmap_module
+
+import numpy as np
+
+import stl.error as error
+from stl.obj.columnar import Columnar_Storage
+from stl.obj.storage import Signal_Storage
+
+MAGIC = b"STLSIGNL"
+VERSION = 1
+ALIGNMENT = 64
+
+
+def save_signal_file(storage: Signal_Storage, path: str, timestamps=None) -> None:
+    """write the samples of the storage engine (and the optional timestamps) to a signal file
+
+    Raises:
+        Signal_Error: a column holds entries other than numbers, booleans and strings
+    """
+    storage = Columnar_Storage.from_storage(storage)
+    length = len(storage)
+    arrays = list()
+    column_headers = list()
+    offset = 0
+
+    for key, column in storage.columns.items():
+        column = as_typed_array(key, column[:length], storage.masks[key])
+        column_header = {"key": key, "dtype": column.dtype.str, "offset": offset, "mask_offset": None}
+        arrays.append(column)
+        offset = align(offset + column.nbytes)
+
+        mask = storage.masks[key]
+        if mask is not None:
+            column_header["mask_offset"] = offset
+            arrays.append(mask[:length])
+            offset = align(offset + length)
+
+        column_headers.append(column_header)
+
+    timestamps_header = None
+    if timestamps is not None:
+        timestamps = np.asarray(timestamps)
+        timestamps_header = {"dtype": timestamps.dtype.str, "offset": offset}
+        arrays.append(timestamps)
+
+    header = json.dumps({"version": VERSION, "length": length, "columns": column_headers,
+                         "timestamps": timestamps_header}).encode("utf-8")
+
+    with open(path, "wb") as signal_file:
+        signal_file.write(MAGIC)
+        signal_file.write(len(header).to_bytes(8, "little"))
+        signal_file.write(header)
+        signal_file.write(bytes(align(len(MAGIC) + 8 + len(header)) - (len(MAGIC) + 8 + len(header))))
+
+        data_offset = 0
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            signal_file.write(array.tobytes())
+            data_offset += array.nbytes
+            signal_file.write(bytes(align(data_offset) - data_offset))
+            data_offset = align(data_offset)
+
+
+def open_signal_file(path: str, mmap: bool = True) -> tuple:
+    """read a signal file, return the columnar storage engine and the timestamps (None if not stored)
+
+    with memory mapping, the columns are read-only views of the file, thus a lookup only reads the pages
+    holding the entries within the looked up range. appending to the signal copies the columns to memory.
+
+    Raises:
+        Signal_Error: the file is not a signal file, or its version is not supported
+    """
+    with open(path, "rb") as signal_file:
+        if signal_file.read(len(MAGIC)) != MAGIC:
+            raise error.Signal_Error("\"" + str(path) + "\" is not a signal file.")
+
+        header_size = int.from_bytes(signal_file.read(8), "little")
+        header = json.loads(signal_file.read(header_size).decode("utf-8"))
+
+        if header["version"] != VERSION:
+            raise error.Signal_Error("Signal file version " + str(header["version"]) + " is not supported.")
+
+        data_offset = align(len(MAGIC) + 8 + header_size)
+        length = header["length"]
+
+        if mmap:
+            buffer = mmap_module.mmap(signal_file.fileno(), 0, access=mmap_module.ACCESS_READ)
+
+            def read(dtype: np.dtype, offset: int) -> np.ndarray:
+                return np.frombuffer(buffer, dtype=dtype, count=length, offset=data_offset + offset)
+        else:
+            def read(dtype: np.dtype, offset: int) -> np.ndarray:
+                signal_file.seek(data_offset + offset)
+                return np.fromfile(signal_file, dtype=dtype, count=length)
+
+        storage = Columnar_Storage()
+        storage._length = storage._capacity = length
+        storage.shared = mmap
+
+        for column_header in header["columns"]:
+            key = column_header["key"]
+            storage.columns[key] = read(np.dtype(column_header["dtype"]), column_header["offset"])
+            storage.masks[key] = None
+
+            if column_header["mask_offset"] is not None:
+                storage.masks[key] = read(np.dtype(np.bool_), column_header["mask_offset"])
+
+        timestamps = None
+        if header["timestamps"] is not None:
+            timestamps = read(np.dtype(header["timestamps"]["dtype"]), header["timestamps"]["offset"])
+
+    return storage, timestamps
+
+
+def as_typed_array(key: str, column: np.ndarray, mask) -> np.ndarray:
+    """convert object columns of strings to fixed-size unicode arrays"""
+    if column.dtype != object:
+        return column
+
+    values = column.tolist()
+    if mask is not None:
+        values = [value if valid else "" for value, valid in zip(values, mask.tolist())]
+
+    if not all(isinstance(value, str) for value in values):
+        raise error.Signal_Error("Entries of \"" + key + "\" cannot be saved to a signal file. " +
+                                 "Only numbers, booleans and strings are supported.")
+
+    return np.array(values, dtype=np.str_)
+
+
+def align(offset: int) -> int:
+    """round the offset up to the next multiple of ALIGNMENT"""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
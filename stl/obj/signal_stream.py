@@ -0,0 +1,148 @@
+# Sun Oct 18 21:02:44 EDT 2026
+# streaming (incremental) readers of signals, decode one sample at a time
+
+import codecs
+import contextlib
+import json
+import os
+from typing import Iterator
+
+import stl.error as error
+
+# whitespaces allowed between JSON tokens
+JSON_WHITESPACE = " \t\n\r"
+
+
+def open_source(source):
+    """open the source if it is a path, otherwise use the source (file object, iterable of lines) as is"""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "r")
+    return contextlib.nullcontext(source)
+
+
+def read_ndjson(source) -> Iterator[dict]:
+    """yield the samples of newline-delimited JSON, i.e. one {"x": 0, ...} per line, blank lines are skipped
+
+    Args:
+        source: path of the file, file object or iterable of lines (str or bytes)
+    """
+    with open_source(source) as lines:
+        for line_number, line in enumerate(lines, 1):
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+
+            if not line.strip():
+                continue
+
+            content = json.loads(line)
+            if not isinstance(content, dict):
+                raise error.Signal_Error("Signal element on line " + str(line_number) +
+                                         " must be a JSON object, got " + line.strip())
+
+            yield content
+
+
+def read_signal_json(source, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """yield the elements ({"content": {...}} with an optional "timestamp") of a signal in the
+    {"0": {"content": {...}}, ...} layout
+
+    the text is read in chunks of chunk_size characters and decoded one sample at a time, so the whole
+    dictionary tree is never held in memory. like Signal.static_verify_signal, the indices must be
+    continuous, start with 0 and be in order.
+
+    Args:
+        source: path of the file or file object
+        chunk_size: number of characters read at once
+    """
+    with open_source(source) as stream:
+        reader = Json_Chunk_Reader(stream, chunk_size)
+
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+
+        index = 0
+        while True:
+            signal_index = reader.decode()
+            reader.expect(":")
+            signal_element = reader.decode()
+
+            if signal_index != str(index):
+                msg = "Missing index 0" if index == 0 else "Missing indices for signal"
+                raise error.Signal_Error("Signal specified is Invalid! " + msg)
+
+            if not isinstance(signal_element, dict) or "content" not in signal_element:
+                raise error.Signal_Error("Signal specified is Invalid! Missing content of index " + signal_index)
+
+            yield signal_element
+            index += 1
+
+            if reader.expect(",}") == "}":
+                return
+
+
+class Json_Chunk_Reader:
+    """decode JSON tokens and values from a text stream read in chunks, used by read_signal_json"""
+
+    def __init__(self, stream, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.utf8_decoder = codecs.getincrementaldecoder("utf-8")()  # for binary streams
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """read the next chunk into the buffer, return False at the end of the stream"""
+        if self.eof:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+        text = chunk
+        if isinstance(chunk, bytes):
+            # a multibyte character may straddle two chunks, the decoder keeps its first bytes until the next
+            # chunk (and reports a truncated character at the end of the stream)
+            text = self.utf8_decoder.decode(chunk, final=not chunk)
+
+        if not chunk:
+            self.eof = True
+            return False
+
+        # drop the consumed part of the buffer
+        self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """skip the whitespaces, return the next character (empty at the end of the stream)"""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in JSON_WHITESPACE:
+                self.position += 1
+
+            if self.position < len(self.buffer) or not self.fill():
+                return self.buffer[self.position:self.position + 1]
+
+    def expect(self, characters: str) -> str:
+        """consume the next character, which must be one of the given characters"""
+        character = self.peek()
+
+        if not character or character not in characters:
+            raise error.Signal_Error("Invalid signal JSON: expected one of " + repr(characters) +
+                                     ", got " + (repr(character) if character else "end of input"))
+
+        self.position += 1
+        return character
+
+    def decode(self):
+        """decode the next JSON value (the samples are objects and the indices are strings, so a value
+        that ends within the buffer is always complete)"""
+        self.peek()
+
+        while True:
+            try:
+                value, self.position = self.decoder.raw_decode(self.buffer, self.position)
+                return value
+            except json.JSONDecodeError as e:
+                if not self.fill():
+                    raise error.Signal_Error("Invalid signal JSON: " + str(e))
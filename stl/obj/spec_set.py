@@ -0,0 +1,85 @@
+# Mon Oct 19 02:24:37 EDT 2026
+# sets of STL expressions (requirements) evaluated together against one signal
+
+from typing import Callable, Iterable, Optional, Union
+
+from stl.obj.signal import Signal
+from stl.obj.stl import STL
+from stl.obj.result import Eval_Result
+from stl.parsing.interpreter import Interpreter
+import stl.error as error
+
+
+class Spec_Set:
+    """set of STL expressions evaluated in one batch against a signal
+
+    the expressions of the set share the signal scans: each identifier referenced by any expression is
+    loaded from the signal once, and identical atomic predicates (e.g. x > 0 in both G[0, 10](x > 0) and
+    F[5, 20](x > 0)) are evaluated once over the signal (see stl.parsing.batch). the results are those of
+    STL.eval for each expression, in the order of the set.
+
+    Usage:
+        >>> spec_set = Spec_Set(["G[0, 1](x > 0)", "F[0, 1](x > 1)", STL("G[0, 1]((x > 0) && (y < 3))")])
+        >>> signal = Signal(py_dict={"0": {"content": {"x": 1, "y": 2}}, "1": {"content": {"x": 2, "y": 1}}})
+        >>> spec_set.satisfy(0, signal)
+        [True, True, True]
+        >>> results = spec_set.eval(0, signal)   # list of Eval_Result
+        >>> results[1].robustness
+        1.0
+    """
+
+    def __init__(self, stl_exprs: Iterable[Union[STL, str]] = ()):
+        self.stl_exprs: list[STL] = list()
+        self.predicate_keys: dict = dict()  # keys of the atomic predicates of the ASTs, reused by every batch
+
+        for stl_expr in stl_exprs:
+            self.add(stl_expr)
+
+    def add(self, stl_expr: Union[STL, str]) -> None:
+        """add an STL expression (STL object or expression text) to the set"""
+        if isinstance(stl_expr, str):
+            stl_expr = STL(stl_expr)
+        elif not isinstance(stl_expr, STL):
+            raise error.STL_Error("Spec_Set only holds STL expressions, got " + type(stl_expr).__name__)
+
+        self.stl_exprs.append(stl_expr)
+
+    def eval(self, time_begin: int, signal: Signal) -> list[Eval_Result]:
+        """evaluate all the STL expressions with respect to the signal, in one batch
+
+        Args:
+            time_begin (int): global begin time
+            signal (Signal): signal to be evaluated
+        """
+        interpreter = Interpreter(time_begin, signal)
+        return interpreter.interpret_batch([stl_expr.parsed_expr for stl_expr in self.stl_exprs],
+                                           self.predicate_keys)
+
+    def eval_many(self, time_begin: int, signals: Iterable[Signal], workers: Optional[int] = None,
+                  chunk_size: Optional[int] = None,
+                  callback: Optional[Callable[[int, Optional[int]], None]] = None) -> list[list[Eval_Result]]:
+        """evaluate all the STL expressions with respect to many signals, by a pool of worker processes (see
+        STL.eval_many), return the results of eval for each signal, in the order of the signals. a set with STL
+        objects without expression text (e.g. the results of STL.weaken) is evaluated in this process"""
+        from stl.obj.parallel import eval_many
+
+        return eval_many(self.stl_exprs, "batch", time_begin, signals, workers,
+                         chunk_size, callback)
+
+    def satisfy(self, time_begin: int, signal: Signal) -> list[bool]:
+        return [result.satisfy for result in self.eval(time_begin, signal)]
+
+    def robustness(self, time_begin: int, signal: Signal) -> list[float]:
+        return [result.robustness for result in self.eval(time_begin, signal)]
+
+    def __len__(self) -> int:
+        return len(self.stl_exprs)
+
+    def __iter__(self):
+        return iter(self.stl_exprs)
+
+    def __getitem__(self, index: int) -> STL:
+        return self.stl_exprs[index]
+
+    def __str__(self):
+        return "\n".join(str(stl_expr.value) for stl_expr in self.stl_exprs)
@@ -1,14 +1,17 @@
 # Created by Simon Chu
 # contains all objects related to the evaluation of STL expressions
 
-from stl.parsing.lexer import Lexer
-from stl.parsing.parser import Parser
+from stl.parsing.lexer import get_lexer
+from stl.parsing.parser import get_parser
+from stl.parsing.cache import Parse_Cache
+import stl.parsing.dag as dag
 from stl.obj.signal import Signal
+from stl.obj.monitor import Monitor
+from stl.obj.compiled import Compiled_STL
 from stl.parsing.interpreter import Interpreter
-from stl.obj.result import Eval_Result
-from typing import Optional
+from stl.obj.result import Eval_Result, Trace_Eval_Result
+from typing import Callable, Iterable, Optional
 import stl.error as error
-import copy
 
 class STL:
     """stores STL expression, note that STL is an immutable object
@@ -25,36 +28,159 @@ class STL:
         False
     """
 
-    lexer = Lexer()
-    parser = Parser()
+    parse_cache = Parse_Cache()  # process-wide cache of the ASTs by expression text
+
+    def __init__(self, value: Optional[str], parsed_expr = None, share: bool = True):
+        """
+        Args:
+            value (str): STL expression text
+            parsed_expr: AST of the STL expression, parsed from the text by default
+            share (bool): merge the common subexpressions of the given AST (see dag.share), False for the ASTs
+                sharing nodes with other STL objects (e.g. weakened ASTs), which are never modified
+        """
 
-    def __init__(self, value: Optional[str], parsed_expr = None):
-        
         self.value_val = value  # do not evaluate when user has not passed in the time_begin and signal
 
-        if parsed_expr == None:
-            # lex and parse the token immediately upon creation of STL object
-            self.token_stream = self.lexer.lex(self.value)
-            self.parsed_expr = self.parser.parse(self.token_stream)
+        if parsed_expr is None:
+            # the AST of the same expression text is shared (see Parse_Cache), it is never modified in place
+            self.parsed_expr = self.parse_cache.lookup(self.value)
+
+            if self.parsed_expr is None:
+                # lex and parse the token immediately upon creation of STL object
+                # note that the lexer and parser are built on first use
+                self.token_stream = get_lexer().lex(self.value)
+                self.parsed_expr = get_parser().parse(self.token_stream)
+
+                # merge the common subexpressions, which are evaluated once per time window (see dag.py)
+                self.parsed_expr = dag.share(self.parsed_expr)
+
+                # only the ASTs that pass the type checking are cached
+                Interpreter.type_check(self.parsed_expr)
+                self.parse_cache.add(self.value, self.parsed_expr)
         else:
-            self.parsed_expr = parsed_expr
+            self.parsed_expr = dag.share(parsed_expr) if share else parsed_expr
+
+        # type check the AST once, evaluations of the STL object skip the type checking
+        Interpreter.type_check(self.parsed_expr)
 
         self.eval_result_cache_val = None
+        self.compiled_stl_val: Optional[Compiled_STL] = None
+
+    def eval(self, time_begin: int, signal: Signal, engine: str = "reference", profile: bool = False) -> Eval_Result:
+        """evaluate the STL expression with respect to the signal
+
+        Args:
+            time_begin (int): global begin time
+            signal (Signal): signal to be evaluated
+            engine (str): evaluation engine of the interpreter, "reference" or "numpy" (vectorized)
+            profile (bool): record the evaluation statistics of each AST node, see Eval_Result.profile
 
-    def eval(self, time_begin: int, signal: Signal) -> Eval_Result:
+        Usage:
+            >>> result = STL("G[0, 1](x > 0)").eval(0, signal, profile=True)
+            >>> print(result.profile)   # wall time, calls, signal elements read and Val objects allocated
+        """
         # interpreter = Interpreter(time_begin, signal, self.lexer, self.parser)
-        interpreter = Interpreter(time_begin, signal)
+        interpreter = Interpreter(time_begin, signal, engine=engine, profile=profile)
         # return interpreter.interpret(self.value)
         return interpreter.interpret(self.parsed_expr)
 
+    def eval_many(self, time_begin: int, signals: Iterable[Signal], workers: Optional[int] = None,
+                  engine: str = "compiled", chunk_size: Optional[int] = None,
+                  callback: Optional[Callable[[int, Optional[int]], None]] = None) -> list[Eval_Result]:
+        """evaluate the STL expression with respect to many signals, by a pool of worker processes
+
+        each worker parses (and compiles) the expression once, the signals are passed to the workers through
+        shared memory by chunks (see stl.obj.parallel). the results are in the order of the signals. the
+        ASTs cannot be sent to worker processes, thus STL objects without expression text (e.g. the results of
+        weaken) evaluate the signals in this process, as with workers=1.
+
+        Args:
+            time_begin (int): global begin time
+            signals: iterable of Signal objects (e.g. a generator loading them one by one)
+            workers (int): number of worker processes, os.cpu_count() by default, 1 evaluates in this process
+            engine (str): "compiled" (default), "reference" or "numpy"
+            chunk_size (int): number of signals sent to a worker at once
+            callback: progress, called with (number of evaluated signals, number of signals or None)
+
+        Usage:
+            >>> results = STL("G[0, 10](x > 0)").eval_many(0, signals, workers=8,
+            ...                                           callback=lambda done, total: print(done, "/", total))
+        """
+        from stl.obj.parallel import eval_many
+
+        return eval_many([self], engine, time_begin, signals, workers, chunk_size, callback)
+
+    def eval_trace(self, signal: Signal, begin: Optional[int] = None, end: Optional[int] = None,
+                   workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                   executor: str = "process") -> Trace_Eval_Result:
+        """evaluate the STL expression with respect to the signal for every begin time within [begin, end]
+
+        the expression is evaluated by the vectorized engine for all begin times at once, G and F use
+        sliding window minimum/maximum, thus the cost is linear to the length of the signal regardless of
+        the time intervals.
+
+        Args:
+            signal (Signal): signal to be evaluated
+            begin (int): first begin time, 0 by default
+            end (int): last begin time, by default the last begin time for which the signal covers the
+                time intervals of the expression
+            workers (int): split the begin times into chunks evaluated by the workers in parallel, with the
+                same results (see stl.obj.parallel.eval_trace). by default, the begin times are not split
+            chunk_size (int): number of begin times of a chunk, two chunks per worker by default
+            executor (str): "process" (worker processes, default) or "thread", threads for STL objects without
+                expression text (e.g. the results of weaken)
+
+        Usage:
+            >>> signal = Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"x": 2}}, "2": {"content": {"x": -1}}})
+            >>> trace = STL("G[0, 1](x > 0)").eval_trace(signal)
+            >>> print(trace)
+            time = 0, satisfy = True, robustness = 1.0
+            time = 1, satisfy = False, robustness = -1.0
+            >>> trace = STL("G[0, 100](x > 0)").eval_trace(long_signal, workers=64)
+        """
+        if workers is not None:
+            from stl.obj.parallel import eval_trace
+            return eval_trace(self, signal, begin, end, workers, chunk_size, executor)
+
+        interpreter = Interpreter(0 if begin is None else begin, signal)
+        return interpreter.interpret_trace(self.parsed_expr, end)
+
+    def monitor(self) -> Monitor:
+        """create an online monitor of the STL expression for streaming signals
+
+        Usage:
+            >>> monitor = STL("F[0, 2](x > 0)").monitor()
+            >>> trace = monitor.extend([{"x": -1}, {"x": 0}, {"x": 2}])
+            >>> print(trace)
+            time = 0, satisfy = True, robustness = 2.0
+        """
+        return Monitor(self.parsed_expr)
+
+    def compile(self) -> Compiled_STL:
+        """compile the STL expression to Python closures for repeated evaluations
+
+        the STL expression is compiled once, later calls return the same compiled STL expression
+
+        Usage:
+            >>> compiled_stl = STL("G[0, 1](x > 0)").compile()
+            >>> compiled_stl.eval(0, signal)
+        """
+        if self.compiled_stl_val is None:
+            self.compiled_stl_val = Compiled_STL(self)
+
+        return self.compiled_stl_val
+
     def weaken(self, option: str, *args) -> "STL": # return AST node of modified STL expression
         """weaken the STL formula, then """
 
-        # note that here use deep copy module
-        # https://www.educative.io/edpresso/how-to-make-a-deep-copy-in-python
-        copied_parsed_expr = copy.deepcopy(self.parsed_expr)
-        copied_parsed_expr.weaken(option, *args)
-        return STL(None, copied_parsed_expr)
+        # note that the AST may be shared by other STL objects (see Parse_Cache), thus weakening never modifies
+        # it: the nodes on the path to the weakened nodes are copied, the other subexpressions are shared by the
+        # weakened AST, which is already a DAG
+        weakened_parsed_expr = self.parsed_expr.weaken(option, *args)
+
+        # the type of the weakened AST is checked again by the STL object
+        weakened_parsed_expr.checked_type = None
+        return STL(None, weakened_parsed_expr, share=False)
 
     def satisfy(self, time_begin: Optional[int] = None, signal: Optional[Signal] = None) -> bool:
         if self.eval_result_cache is not None:
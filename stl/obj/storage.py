@@ -0,0 +1,185 @@
+# Sun Oct 18 09:12:40 EDT 2026
+# storage engines backing the Signal object
+
+import logging
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+import stl.error as error
+
+
+class Signal_Storage(metaclass=ABCMeta):
+    """super class for all the storage engines of a Signal
+
+    A storage engine holds the samples of a signal and answers the queries issued by the
+    Signal object. Indices handed to the storage engine are always valid, bound checking is
+    done by the Signal object.
+    """
+
+    # name used to select the storage engine in the Signal constructor
+    name: str = ""
+
+    @abstractmethod
+    def append(self, content: dict) -> None:
+        """append the content of a single sample"""
+        pass
+
+    @abstractmethod
+    def set(self, index: int, content: dict) -> None:
+        """replace the content of the sample at the index"""
+        pass
+
+    @abstractmethod
+    def content(self, index: int) -> dict:
+        """return the (nested) content dictionary of the sample at the index"""
+        pass
+
+    @abstractmethod
+    def lookup(self, id_name: str, begin_index: int, end_index: int) -> list:
+        """return the Python objects stored under id_name (dot separated) between two indices (inclusive)"""
+        pass
+
+    def column(self, id_name: str, begin_index: int, end_index: int):
+        """return the entries stored under id_name between two indices (inclusive) as a NumPy array
+
+        integers are converted to floating-point numbers, missing entries to NaN
+        """
+        # numpy is only required by the vectorized interpreter
+        import numpy as np
+
+        result = np.array(self.lookup(id_name, begin_index, end_index))
+
+        if result.dtype.kind in "iu":
+            result = result.astype(np.float64)
+        elif result.dtype.kind == "O":
+            # missing entries (None) among numbers
+            try:
+                result = result.astype(np.float64)
+            except (TypeError, ValueError):
+                pass
+
+        return result
+
+    @abstractmethod
+    def slice(self, begin_index: int, end_index: int) -> "Signal_Storage":
+        """return a new storage engine of the same kind holding the samples between two indices (inclusive)"""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def to_py_dict(self) -> dict[str, Any]:
+        """return the signal data in the {"0": {"content": {...}}, ...} layout"""
+        return {str(index): {"content": self.content(index)} for index in range(len(self))}
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """return the signal data ordered by the int value of the index, ready to be encoded as JSON"""
+        return self.to_py_dict()
+
+    def get_quantifiable_keys(self) -> list[str]:
+        """return the top-level keys that are common to all samples"""
+        return Signal_Storage.static_get_quantifiable_keys(self.to_py_dict())
+
+    @staticmethod
+    def static_get_quantifiable_keys(signal_data: dict) -> list[str]:
+        """return all the common keys <union> throughout all signal contents that can be quantifiable"""
+        if len(signal_data) == 0:
+            # return empty list if self._signal_data is empty
+            return list()
+
+        elif len(signal_data) > 1:
+            # assume signal index start with 0
+            # note that set() extract a set of dictionary keys
+            signal_content_common_key_set = set(signal_data["0"]["content"])
+
+            # get the intersection of all signal elements keys
+            for signal_index in signal_data.keys():
+                signal_content_common_key_set = signal_content_common_key_set.intersection(
+                    set(signal_data[signal_index]["content"]))
+
+            return list(signal_content_common_key_set)
+
+        else:
+            # when there is only 1 element in the signal_data, return its keys
+            return signal_data["0"]["content"].keys()
+
+
+class Dict_Storage(Signal_Storage):
+    """default storage engine, keeps the signal in the {"0": {"content": {...}}, ...} layout
+
+    Attributes:
+        signal_data: the Python dictionary holding the signal
+    """
+
+    name = "dict"
+
+    def __init__(self, signal_data: Optional[dict[str, Any]] = None):
+        self.signal_data = signal_data if signal_data is not None else dict()
+
+    def append(self, content: dict) -> None:
+        # add the newly added signal content to the "content" field of the signal data
+        self.signal_data[str(len(self.signal_data))] = {"content": content}
+
+    def set(self, index: int, content: dict) -> None:
+        # keep the other entries of the element (e.g. the timestamp)
+        self.signal_data[str(index)] = {**self.signal_data[str(index)], "content": content}
+
+    def content(self, index: int) -> dict:
+        return self.signal_data[str(index)]["content"]
+
+    def lookup(self, id_name: str, begin_index: int, end_index: int) -> list:
+        result = list()
+        id_name_split: list[str] = id_name.split(".")
+
+        for i in range(begin_index, end_index + 1):  # note that the end time will be included
+            current_signal_content = self.signal_data[str(i)]["content"]
+
+            try:
+                for key in id_name_split:
+                    current_signal_content = current_signal_content[key]
+            except Exception as e:
+                logging.exception(e)
+
+            result.append(current_signal_content)
+
+        return result
+
+    def slice(self, begin_index: int, end_index: int) -> "Dict_Storage":
+        result = Dict_Storage()
+        for i in range(begin_index, end_index + 1):  # note that the end time will be included
+            result.append(self.content(i))
+        return result
+
+    def to_py_dict(self) -> dict[str, Any]:
+        return self.signal_data
+
+    def get_quantifiable_keys(self) -> list[str]:
+        return Signal_Storage.static_get_quantifiable_keys(self.signal_data)
+
+    def to_json_dict(self) -> OrderedDict:
+        """return the signal data sorted by the int value of the index"""
+        # https://stackoverflow.com/questions/9001509/how-can-i-sort-a-dictionary-by-key
+        return OrderedDict(sorted(self.signal_data.items(), key=lambda item: int(item[0])))
+
+    def __len__(self) -> int:
+        return len(self.signal_data)
+
+
+def select_storage(storage: str) -> Signal_Storage:
+    """create an empty storage engine by its name
+
+    Raises:
+        Signal_Error: the storage engine name is not recognized
+    """
+    if storage == Dict_Storage.name:
+        return Dict_Storage()
+
+    elif storage == "columnar":
+        # numpy is only required by the columnar storage engine
+        from stl.obj.columnar import Columnar_Storage
+        return Columnar_Storage()
+
+    else:
+        raise error.Signal_Error("Signal storage engine \"" + str(storage) + "\" is not recognized.")
@@ -27,7 +27,7 @@ def py_obj_to_ll_obj(val: Union[int, float, bool, str], int_to_float: bool = Fal
     # return Float_Val(val)
 
     if isinstance(val, bool):
-        return Boolean_Val(py_obj=val)
+        return Boolean_Val.of(val)
 
     elif isinstance(val, str):
         return String_Val(py_obj=val)
@@ -37,7 +37,7 @@ def py_obj_to_ll_obj(val: Union[int, float, bool, str], int_to_float: bool = Fal
             return Float_Val(py_obj=float(val))  # convert Python int type to float type
     else:
         if isinstance(val, int):
-            return Int_Val(py_obj=val)
+            return Int_Val.of(val)
 
         elif isinstance(val, float):
             return Float_Val(py_obj=val)
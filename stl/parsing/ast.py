@@ -36,3 +36,7 @@ from stl.parsing.ast_collection.val import\
     String_Val,\
     Boolean_Val,\
     Id_Val
+
+
+from stl.parsing.ast_collection.shared_expr import\
+    Shared_Expr
@@ -12,6 +12,9 @@ class Node(metaclass=ABCMeta):  # metaclass=abc.ABCMeta support abstract method
 
     """super class for all nodes in the AST (abstract syntax tree)"""
 
+    # subclasses without __slots__ store their attributes in __dict__
+    __slots__ = ()
+
     @abstractmethod
     def eval(self, eval_context):
         pass
@@ -25,10 +28,26 @@ class Node(metaclass=ABCMeta):  # metaclass=abc.ABCMeta support abstract method
         """method to display the string representation of the AST for parser"""
         pass
 
+    def children(self) -> list:
+        """return the child nodes of the AST node (empty for leaf nodes)"""
+        return list()
+
+    # type of the AST rooted at the node, None until the AST is type checked by Interpreter.type_check.
+    # note that the cached type is stale once the AST is modified (e.g. the root copied by STL.weaken)
+    checked_type_val = None
+
+    @property
+    def checked_type(self):
+        return self.checked_type_val
+
+    @checked_type.setter
+    def checked_type(self, checked_type):
+        self.checked_type_val = checked_type
+
 
 class Expr(Node, ABC):
     """super class for expressions"""
-    pass
+    __slots__ = ()
 
 class Primitive_Expr(Expr, ABC):
     """super class for primitive expressions"""
@@ -38,11 +57,18 @@ class Primitive_Expr(Expr, ABC):
 
 
 class Val(Expr, ABC, metaclass=ABCMeta):
-    """super class for values, store primitive value types"""
+    """super class for values, store primitive value types
+
+    values are allocated for every element of the signal during the evaluation, thus the attributes
+    are stored in __slots__ instead of __dict__
+    """
+
+    __slots__ = ("value_val", "value_type_val", "checked_type_val")
 
     def __init__(self, value: Any, value_type: types.Type):
         self.value_val = value
         self.value_type_val = value_type  # note that type is a reserved word
+        self.checked_type_val = None
 
     @abstractmethod
     def to_py_obj(self) -> Any:
@@ -1,3 +1,4 @@
+import copy
 from abc import ABC
 
 from stl.parsing.ast_collection.core import Primitive_Expr, Expr, Val
@@ -8,6 +9,7 @@ import stl.tool as tool
 import stl.parsing.type as types
 from stl.obj.result import STL_Expr_Eval_Result
 from typing import Union, Tuple, Optional
+import operator as py_operator
 
 
 ##########################
@@ -24,6 +26,9 @@ class Non_Ternary_Expr(Expr, ABC):
         self.lhs_val = lhs
         self.rhs_val = rhs
 
+        # function of the operator, resolved from the operator type when the AST is type checked
+        self.satisfy_op_val = None
+
     #######################
     # getters and setters #
     #######################
@@ -60,6 +65,18 @@ class Non_Ternary_Expr(Expr, ABC):
     def rhs(self, rhs: Expr):
         self.rhs_val = rhs
 
+    @property
+    def satisfy_op(self):
+        return self.satisfy_op_val
+
+    @satisfy_op.setter
+    def satisfy_op(self, satisfy_op):
+        self.satisfy_op_val = satisfy_op
+
+    def children(self) -> list:
+        # unary expr does not have lhs_expr
+        return [child for child in (self.lhs, self.rhs) if child is not None]
+
 
 ######################
 # Ternary Expression #
@@ -140,6 +157,9 @@ class Ternary_Expr(Primitive_Expr, ABC):
     def opd3(self, opd):
         self.opd3_val = opd
 
+    def children(self) -> list:
+        return [self.opd1, self.opd2, self.opd3]
+
     def __str__(self):
         sb = String_Builder()
         sb.append("Ternary_Expr: ( ")
@@ -161,17 +181,22 @@ class Chain_Comp_Expr(Ternary_Expr, ABC):
                  op2: str, op2_type: str, opd1: Expr, opd2: Expr, opd3: Expr):
         super().__init__(op1, op1_type, op2, op2_type, opd1, opd2, opd3)
 
-    def weaken(self, option: str, *args):
+    def weaken(self, option: str, *args) -> "Chain_Comp_Expr":
+        """return the weakened copy of the expression, the expression is not modified (the middle operand is
+        shared by the copy)"""
         # print(len(args))
         # print(self.op1_type)
         # print(self.op2_type)
 
         # const </<= X </<= const, args = (x, y)
         if len(args) == 2 and option == "ap-range" and (self.op1_type == "LESS" or self.op1_type == "LESS_EQUAL") and (self.op2_type == "LESS" or self.op2_type == "LESS_EQUAL"):
-            self.opd1 = Binary_Arith_Expr(
+            result = copy.copy(self)
+            result.desugared_val = None  # the desugared expressions of the copy hold the weakened operands
+            result.opd1 = Binary_Arith_Expr(
                 "-", "MINUS", self.opd1.to_float(), Float_Val(py_obj=args[0]))
-            self.opd3 = Binary_Arith_Expr(
+            result.opd3 = Binary_Arith_Expr(
                 "+", "PLUS", self.opd3.to_float(), Float_Val(py_obj=args[1]))
+            return result
         
         else:
             raise RuntimeError("Not Implemented")
@@ -185,13 +210,39 @@ class Chain_Comp_Expr(Ternary_Expr, ABC):
         # result = (Binary_Logic_Expr("&&", "LOGICAL_AND", binary_expr_1[0], binary_expr_2[0]).eval(eval_context), 0)
 
         # ideal but doesn't work so freakin sophisticated
-        binary_expr_1 = Binary_Comp_Expr(
-            self.op1, self.op1_type, self.opd1, self.opd2)
-        binary_expr_2 = Binary_Comp_Expr(
-            self.op2, self.op2_type, self.opd2, self.opd3)
-        result = Binary_Logic_Expr(
-            "&&", "LOGICAL_AND", binary_expr_1, binary_expr_2).eval(eval_context, embedded)
-        return result
+        binary_expr_1, binary_expr_2, logic_expr = self.desugar()
+
+        if not embedded:
+            return logic_expr.eval(eval_context, embedded)
+
+        # fused evaluation: the shared operand is evaluated (looked up in the signal) only once
+        opd2 = self.opd2.eval(eval_context, embedded)
+        result_1 = binary_expr_1.compute_satisfaction_robustness(self.opd1.eval(eval_context, embedded), opd2)
+        result_2 = binary_expr_2.compute_satisfaction_robustness(opd2, self.opd3.eval(eval_context, embedded))
+        return logic_expr.compute_satisfaction_robustness(result_1, result_2)
+
+    # desugared expressions, see desugar
+    desugared_val = None
+
+    def desugar(self) -> tuple:
+        """return the two binary comparison expressions and their conjunction equivalent to the chain comparison
+
+        the expressions are built once and rebuilt only when the operators or operands are replaced (e.g. by
+        the hash-consing of the AST)
+        """
+        key = (self.op1, self.op1_type, self.op2, self.op2_type, id(self.opd1), id(self.opd2), id(self.opd3))
+
+        if self.desugared_val is None or self.desugared_val[0] != key:
+            binary_expr_1 = Binary_Comp_Expr(
+                self.op1, self.op1_type, self.opd1, self.opd2)
+            binary_expr_2 = Binary_Comp_Expr(
+                self.op2, self.op2_type, self.opd2, self.opd3)
+            logic_expr = Binary_Logic_Expr("&&", "LOGICAL_AND", binary_expr_1, binary_expr_2)
+
+            # note that the desugared expressions keep the operands alive, thus their ids are not reused
+            self.desugared_val = (key, (binary_expr_1, binary_expr_2, logic_expr))
+
+        return self.desugared_val[1]
 
     # def type_check_numeric(self, arg_type):
         # return arg_type == types.Int or arg_type
@@ -238,20 +289,37 @@ class Binary_Expr(Non_Ternary_Expr, ABC):
 class Binary_Comp_Expr(Binary_Expr):
     """expr super class for binary comparison expression"""
 
-    def weaken(self, option: str, *args):
+    # operator type -> function computing the satisfaction value of two Val
+    satisfy_ops = {"GREATER": py_operator.gt,
+                   "GREATER_EQUAL": py_operator.ge,
+                   "LESS": py_operator.lt,
+                   "LESS_EQUAL": py_operator.le,
+                   "EQUAL_EQUAL": py_operator.eq,
+                   "NOT_EQUAL": py_operator.ne}
+
+    def weaken(self, option: str, *args) -> "Binary_Comp_Expr":
+        """return the weakened copy of the expression, the expression is not modified (the left hand side is
+        shared by the copy)"""
+        result = copy.copy(self)
+
         # X </<= const, args = (x)
         if len(args) == 1 and option == "ap-range" and (self.op_type == "LESS" or self.op_type == "LESS_EQUAL"):
-            self.rhs = Binary_Arith_Expr("+", "PLUS", self.rhs.to_float(), Float_Val(py_obj=args[0]))
+            result.rhs = Binary_Arith_Expr("+", "PLUS", self.rhs.to_float(), Float_Val(py_obj=args[0]))
 
         # X >/>= const, args = (x)
         elif len(args) == 1 and option == "ap-range" and (self.op_type == "GREATER" or self.op_type == "GREATER_EQUAL"):
-            self.rhs = Binary_Arith_Expr("-", "MINUS", self.rhs.to_float(), Float_Val(py_obj=args[0]))
+            result.rhs = Binary_Arith_Expr("-", "MINUS", self.rhs.to_float(), Float_Val(py_obj=args[0]))
         
         else:
             raise RuntimeError("Not Implemented!")
+
+        return result
             
     def type_check(self, type_context):
         # note that list of values are type checked to the common types in the list
+        # resolve the operator once, instead of dispatching on the operator type for every element
+        self.satisfy_op = Binary_Comp_Expr.satisfy_ops.get(self.op_type)
+
         lhs_type = self.lhs.type_check(type_context)
         rhs_type = self.rhs.type_check(type_context)
 
@@ -292,9 +360,41 @@ class Binary_Comp_Expr(Binary_Expr):
 
         return result
 
+    def satisfy_from_robustness(self, robustness: Float_Val) -> Boolean_Val:
+        """derive the satisfaction value from the sign of the (atomic) robustness value
+
+        strict comparisons are satisfied by a positive robustness value, the other comparisons by a
+        non-negative one. note that "not robustness <= 0" (instead of "robustness > 0") keeps NaN
+        robustness values consistent with the satisfaction value of NOT_EQUAL.
+        """
+        if self.op_type == "GREATER" or self.op_type == "LESS":
+            result = robustness.value > 0
+        elif self.op_type == "GREATER_EQUAL" or self.op_type == "LESS_EQUAL" or self.op_type == "EQUAL_EQUAL":
+            result = robustness.value >= 0
+        elif self.op_type == "NOT_EQUAL":
+            result = not robustness.value <= 0
+        else:
+            raise error.AST_Error(
+                "Operator \"" + str(self.op_type) + "\" for Binary Comparison Expression is invalid.")
+
+        return Boolean_Val.of(result)
+
+    def satisfy_robustness(self, lhs, rhs) -> Tuple[Boolean_Val, Optional[Float_Val]]:
+        """for atomic calculation - compute the satisfaction and robustness values at once"""
+        robustness = self.robustness(lhs, rhs)
+
+        if robustness is None:
+            # comparison of Boolean_Val, robustness is not defined
+            return self.satisfy(lhs, rhs), None
+
+        return self.satisfy_from_robustness(robustness), robustness
+
     def satisfy(self, lhs, rhs):
         """for atomic calculation - both lhs and rhs have to be a Val"""
 
+        if self.satisfy_op is not None:
+            return self.satisfy_op(lhs, rhs)
+
         if self.op_type == "GREATER":
             result = lhs > rhs
         elif self.op_type == "GREATER_EQUAL":
@@ -414,24 +514,58 @@ class Binary_Comp_Expr(Binary_Expr):
 
         return robustness_list
 
+    def compute_satisfaction_robustness(self, lhs, rhs) -> tuple:
+        """fused evaluation, compute the satisfaction and robustness values in a single pass
+
+        unlike compute_satisfaction and compute_robustness, the atomic values are compared directly
+        instead of evaluating a new Binary_Comp_Expr for each of them
+        """
+        # lhs = [...]
+        # rhs = Val
+        if (isinstance(lhs, list)) and (not isinstance(rhs, list)):
+            pairs = ((lhs_expr, rhs) for lhs_expr in lhs)
+
+        # lhs = Val
+        # rhs = [...]
+        elif (not isinstance(lhs, list)) and (isinstance(rhs, list)):
+            pairs = ((lhs, rhs_expr) for rhs_expr in rhs)
+
+        # lhs = [...]
+        # rhs = [...]
+        elif (isinstance(lhs, list)) and (isinstance(rhs, list)):
+            if len(lhs) != len(rhs):
+                raise RuntimeError(
+                    "list values doesn't match! lhs = " + str(lhs) + " rhs = " + str(rhs))
+
+            pairs = zip(lhs, rhs)
+
+        # lhs = Val
+        # rhs = Val
+        else:
+            return self.satisfy_robustness(lhs, rhs)
+
+        satisfy_list = list()
+        robustness_list = list()
+
+        for lhs_val, rhs_val in pairs:
+            satisfy_val, robustness_val = self.satisfy_robustness(lhs_val, rhs_val)
+            satisfy_list.append(satisfy_val)
+            robustness_list.append(robustness_val)
+
+        return satisfy_list, robustness_list
+
     # embedded signals whether expression is embedded in STL Expr
-    def eval(self, eval_context, embedded=False) -> Union[Val, list]:
-        """note that satisfaction and robustness are separated"""
+    def eval(self, eval_context, embedded=False) -> Union[Val, list, tuple]:
+        """note that satisfaction and robustness are computed in a single pass when embedded in STL"""
         lhs = self.lhs.eval(eval_context, embedded)
         rhs = self.rhs.eval(eval_context, embedded)
 
-        satisfy_result: Union[Val, list] = self.compute_satisfaction(
-            lhs, rhs, eval_context, embedded)
-        robustness_result: Optional[Union[Float_Val, list]] = None
-
         if not embedded:
             # only return satisfaction when not embedded in STL
-            return satisfy_result
+            return self.compute_satisfaction(lhs, rhs, eval_context, embedded)
         else:
             # compute both satisfaction and robustness when evaluating STL expression
-            robustness_result = self.compute_robustness(
-                lhs, rhs, eval_context, embedded)
-            return satisfy_result, robustness_result
+            return self.compute_satisfaction_robustness(lhs, rhs)
 
     # def eval(self, eval_context) -> Tuple[Union[Boolean_Val, list[Boolean_Val]], Union[Float_Val, list[Float_Val]]]:
     #     """
@@ -496,9 +630,17 @@ class Binary_Comp_Expr(Binary_Expr):
 class Binary_Logic_Expr(Binary_Expr):
     """stores binary logic operation expressions AST"""
 
+    # operator type -> function computing the satisfaction value of two Boolean_Val
+    satisfy_ops = {"LOGICAL_AND": lambda lhs, rhs: lhs.logical_and(rhs),
+                   "LOGICAL_OR": lambda lhs, rhs: lhs.logical_or(rhs),
+                   "LOGICAL_IMPLIES": lambda lhs, rhs: lhs.logical_implies(rhs),
+                   "LOGICAL_EQUALS": lambda lhs, rhs: lhs.logical_equals(rhs)}
+
     def type_check(self, type_context):
         # TODO: make sure lhs and rhs are of consistent types
         # return the types.Boolean type
+        # resolve the operator once, instead of dispatching on the operator type for every element
+        self.satisfy_op = Binary_Logic_Expr.satisfy_ops.get(self.op_type)
 
         lhs_type = self.lhs.type_check(type_context)
         rhs_type = self.rhs.type_check(type_context)
@@ -515,6 +657,9 @@ class Binary_Logic_Expr(Binary_Expr):
             return types.Boolean()
 
     def satisfy(self, lhs, rhs):
+        if self.satisfy_op is not None:
+            return self.satisfy_op(lhs, rhs)
+
         if self.op_type == "LOGICAL_AND":
             result = lhs.logical_and(rhs)
 
@@ -651,23 +796,44 @@ class Binary_Logic_Expr(Binary_Expr):
 
         return robustness_list
 
+    def compute_satisfaction_robustness(self, lhs, rhs) -> tuple:
+        """fused evaluation, compute the satisfaction and robustness values in a single pass"""
+        lhs_satisfy, lhs_robustness = lhs if isinstance(lhs, tuple) else (lhs, lhs)
+        rhs_satisfy, rhs_robustness = rhs if isinstance(rhs, tuple) else (rhs, rhs)
+
+        # lhs = Val
+        # rhs = Val
+        if (not isinstance(lhs_satisfy, list)) and (not isinstance(rhs_satisfy, list)):
+            return self.satisfy(lhs_satisfy, rhs_satisfy), self.robustness(lhs_robustness, rhs_robustness)
+
+        elif (not isinstance(lhs_satisfy, list)) or (not isinstance(rhs_satisfy, list)):
+            raise RuntimeError("Form not allowed! lhs = " + str(lhs) + ", rhs = " + str(rhs))
+
+        elif len(lhs_satisfy) != len(rhs_satisfy):
+            raise RuntimeError(
+                "list values doesn't match! lhs = " + str(lhs_satisfy) + " rhs = " + str(rhs_satisfy))
+
+        satisfy_list = list()
+        robustness_list = list()
+
+        for index in range(len(lhs_satisfy)):
+            satisfy_list.append(self.satisfy(lhs_satisfy[index], rhs_satisfy[index]))
+            robustness_list.append(self.robustness(lhs_robustness[index], rhs_robustness[index]))
+
+        return satisfy_list, robustness_list
+
     def eval(self, eval_context, embedded=False):
         """support short-circuit evaluation? sure but under the premise that the type must be the same"""
 
         lhs = self.lhs.eval(eval_context, embedded)
         rhs = self.rhs.eval(eval_context, embedded)
 
-        satisfy_result: Union[Val, list] = self.compute_satisfaction(
-            lhs, rhs, eval_context, embedded)
-        robustness_result: Optional[Union[Float_Val, list]] = None
-
         if embedded and self.is_quantifiable_op():
-            robustness_result = self.compute_robustness(
-                lhs, rhs, eval_context, embedded)
-            return satisfy_result, robustness_result
+            # compute both satisfaction and robustness in a single pass when evaluating STL expression
+            return self.compute_satisfaction_robustness(lhs, rhs)
 
         else:
-            return satisfy_result
+            return self.compute_satisfaction(lhs, rhs, eval_context, embedded)
 
 
 class Binary_Arith_Expr(Binary_Expr):
@@ -892,22 +1058,35 @@ class Unary_Logic_Expr(Unary_Expr):
 
         return robustness_list
 
+    def compute_satisfaction_robustness(self, rhs) -> tuple:
+        """fused evaluation, compute the satisfaction and robustness values in a single pass"""
+        rhs_satisfy, rhs_robustness = rhs if isinstance(rhs, tuple) else (rhs, rhs)
+
+        # rhs = Val
+        if not isinstance(rhs_satisfy, list):
+            return self.satisfy(rhs_satisfy), self.robustness(rhs_robustness)
+
+        satisfy_list = list()
+        robustness_list = list()
+
+        # rhs = [...]
+        for index in range(len(rhs_satisfy)):
+            satisfy_list.append(self.satisfy(rhs_satisfy[index]))
+            robustness_list.append(self.robustness(rhs_robustness[index]))
+
+        return satisfy_list, robustness_list
+
     def eval(self, eval_context, embedded=False):
         # evaluate both left and right side expressions
         rhs = self.rhs.eval(eval_context, embedded)
 
-        # result = None
-
-        satisfy_result: Union[Val, list] = self.compute_satisfaction(rhs, eval_context, embedded)
-        robustness_result: Optional[Union[Float_Val, list]] = None
-
         if embedded and self.is_quantifiable_op():
-            robustness_result = self.compute_robustness(rhs, eval_context, embedded)
-            return satisfy_result, robustness_result
+            # compute both satisfaction and robustness in a single pass when evaluating STL expression
+            return self.compute_satisfaction_robustness(rhs)
 
         else:
             # case when the expression is not embedded in an STL expression
-            return satisfy_result
+            return self.compute_satisfaction(rhs, eval_context, embedded)
 
         # if self.op_type == "LOGICAL_NOT":
         #     if embedded and self
@@ -0,0 +1,72 @@
+# Mon Oct 19 03:20:12 EDT 2026
+
+from abc import ABC
+from typing import Optional
+
+from stl.parsing.ast_collection.core import Expr
+
+
+class Shared_Expr(Expr, ABC):
+    """subexpression referenced more than once in the AST (see stl.parsing.dag)
+
+    structurally identical subexpressions are merged into a single node by the hash-consing pass, which wraps
+    every node with multiple parents into a Shared_Expr, referenced by all of its parents. during one
+    evaluation, the result of the wrapped node is computed once per time window and reused by the other
+    parents (the memo of the evaluation frame, keyed by the node and the local time interval).
+
+    the shared expression is transparent otherwise: it type checks and prints like the wrapped node.
+
+    Usage:
+        >>> parsed_expr = dag.share(parser.parse(lexer.lex("((x > 0) && (y < 3)) U[0, 1] ((x > 0) && (y < 3))")))
+        >>> # both conditions of U are the same Shared_Expr node, evaluated once for the window [0, 1]
+    """
+
+    def __init__(self, expr: Expr):
+        self.expr_val = expr
+
+    @property
+    def expr(self) -> Expr:
+        return self.expr_val
+
+    @expr.setter
+    def expr(self, expr: Expr):
+        self.expr_val = expr
+
+    def children(self) -> list:
+        return [self.expr]
+
+    def __str__(self):
+        return str(self.expr)
+
+    def type_check(self, type_context):
+        return self.expr.type_check(type_context)
+
+    def weaken(self, option: str, *args) -> Expr:
+        """return the weakened copy of the wrapped node, which replaces this occurrence only (the other parents
+        keep the shared node)"""
+        return self.expr.weaken(option, *args)
+
+    def eval(self, eval_context, embedded=False):
+        memo = eval_context.memo
+        if memo is None:
+            memo = eval_context.memo = dict()
+
+        key = (id(self), embedded,
+               Shared_Expr.time_value(eval_context.local_begin_time), Shared_Expr.time_value(eval_context.local_end_time))
+        entry = memo.get(key)
+
+        if entry is None:
+            # STL expressions do not take the embedded flag (they are never embedded in other STL expressions)
+            result = self.expr.eval(eval_context, embedded) if embedded else self.expr.eval(eval_context)
+
+            # STL expressions set the local time interval of the frame, which is restored when the result is reused
+            entry = memo[key] = (result, eval_context.local_begin_time, eval_context.local_end_time)
+
+        else:
+            eval_context.local_begin_time, eval_context.local_end_time = entry[1], entry[2]
+
+        return entry[0]
+
+    @staticmethod
+    def time_value(time) -> Optional[float]:
+        return None if time is None else time.value
@@ -1,5 +1,6 @@
 # 2020-11-06 07:57:20
 
+import copy
 from stl.parsing.ast_collection.primitive_expr import Binary_Arith_Expr, Binary_Comp_Expr
 from stl.tool import String_Builder
 import stl.error as error
@@ -11,7 +12,7 @@ import stl.parsing.type as types
 from typing import Optional, Union
 from abc import ABC
 
-from stl.parsing.ast_collection.val import Id_Val, Int_Val
+from stl.parsing.ast_collection.val import Int_Val
 from stl.obj.result import STL_Expr_Eval_Result
 
 
@@ -73,17 +74,15 @@ class STL_Expr(Expr, ABC):
         # calculate local (actual) time for conditional expression signal slicing
         # add local_begin_time and local_end_time to the context for accessing from conditional expression evaluation
 
-        global_begin_time = eval_context.lookup(Id_Val("global_begin_time"))
+        global_begin_time = eval_context.global_begin_time
 
         if self.begin_time is not None:
             stl_expr_begin_time = self.begin_time.eval(eval_context)
-            local_begin_time = global_begin_time + stl_expr_begin_time
-            eval_context.add(Id_Val("local_begin_time"), local_begin_time)
+            eval_context.local_begin_time = global_begin_time + stl_expr_begin_time
 
         if self.end_time is not None:
             stl_expr_end_time = self.end_time.eval(eval_context)
-            local_end_time = global_begin_time + stl_expr_end_time
-            eval_context.add(Id_Val("local_end_time"), local_end_time)
+            eval_context.local_end_time = global_begin_time + stl_expr_end_time
 
 
 
@@ -91,6 +90,11 @@ class STL_Expr(Expr, ABC):
     def __str__(self):
         pass
 
+    def children(self) -> list:
+        # X: next operator does not have end_time, unary STL expressions do not have end_condition
+        return [child for child in (self.begin_time, self.end_time, self.begin_condition, self.end_condition)
+                if child is not None]
+
     #######################
     # getters and setters #
     #######################
@@ -164,17 +168,112 @@ class Unary_STL_Expr(STL_Expr, ABC):
 
 
 class Binary_STL_Expr(STL_Expr, ABC):
+    """super class for binary STL expressions (lhs: begin_condition, rhs: end_condition)
+
+    both conditions are evaluated once within [global_begin_time, global_begin_time + end_time], then
+    the satisfaction and robustness values are computed by the subclass (see compute) in a single pass
+    over the window. the time interval of a timestamped signal is resolved to the indices of the window
+    """
+
     def __init__(self, operator, begin_time, end_time, begin_condition, end_condition):
         super().__init__(operator, begin_time=begin_time, end_time=end_time,
                          begin_condition=begin_condition, end_condition=end_condition)
 
+    def eval(self, eval_context):
+        global_begin_time = eval_context.global_begin_time
+
+        stl_expr_end_time = self.end_time.eval(eval_context)
+        begin_time = self.begin_time.eval(eval_context).value
+        end_time = stl_expr_end_time.value
+
+        if begin_time > end_time:
+            raise error.STL_Error("begin time of the time interval must not be greater than the end time! " +
+                                  "begin time = " + str(begin_time) + ", end time = " + str(end_time))
+
+        # the lhs condition is required from the global begin time
+        eval_context.local_begin_time = global_begin_time
+        eval_context.local_end_time = global_begin_time + stl_expr_end_time
+
+        signal = eval_context.signal
+        if signal.timestamps is not None:
+            # the window holds the elements within [global_begin_time, global_begin_time + end_time]
+            window_begin_index, window_end_index = signal.index_range(global_begin_time.value,
+                                                                      eval_context.local_end_time.value)
+            begin_time = signal.index_range(global_begin_time.value + begin_time,
+                                            eval_context.local_end_time.value)[0] - window_begin_index
+            end_time = window_end_index - window_begin_index
+
+        lhs_satisfy, lhs_robustness = Binary_STL_Expr.to_py_obj_list(
+            self.begin_condition.eval(eval_context, embedded=True), end_time + 1)
+        rhs_satisfy, rhs_robustness = Binary_STL_Expr.to_py_obj_list(
+            self.end_condition.eval(eval_context, embedded=True), end_time + 1)
+
+        result_satisfy = self.compute(lhs_satisfy, rhs_satisfy, begin_time, end_time, False, True, Binary_STL_Expr.logical_not)
+        result_robustness = None
+
+        if lhs_robustness is not None and rhs_robustness is not None:
+            result_robustness = self.compute(lhs_robustness, rhs_robustness, begin_time, end_time,
+                                             float("-inf"), float("inf"), Binary_STL_Expr.negate)
+
+        return STL_Expr_Eval_Result(satisfy=result_satisfy, robustness=result_robustness)
+
+    def compute(self, lhs: list, rhs: list, begin_time: int, end_time: int, bottom, top, negate):
+        """compute the satisfaction (bool) or robustness (float) value of the expression
+
+        Args:
+            lhs, rhs: values of the conditions within the window, indexed by time - global_begin_time
+                (by the index within the window for timestamped signals, as are begin_time and end_time)
+            bottom, top: the smallest and largest value (False/True, -inf/inf)
+            negate: the negation of a single value
+        """
+        raise error.AST_Error("STL operator " + str(self.operator) + " is not supported.")
+
+    @staticmethod
+    def until(lhs: list, rhs: list, begin_time: int, end_time: int, bottom, top):
+        """max over t in [begin_time, end_time] of min(rhs[t], lhs[0], ..., lhs[t - 1])
+
+        computed in a single pass over the window, the minimum of lhs is maintained incrementally
+        """
+        result = bottom
+        lhs_minimum = top
+
+        for time in range(end_time + 1):
+            if time >= begin_time:
+                result = max(result, min(rhs[time], lhs_minimum))
+
+            lhs_minimum = min(lhs_minimum, lhs[time])
+
+        return result
+
+    @staticmethod
+    def to_py_obj_list(result, length: int) -> tuple:
+        """convert the evaluation result of a condition to lists of satisfaction and robustness values"""
+        satisfy, robustness = result if isinstance(result, tuple) else (result, None)
+
+        # conditions without identifiers evaluate to single values
+        satisfy = [val.value for val in satisfy] if isinstance(satisfy, list) else [satisfy.value] * length
+
+        if robustness is not None:
+            robustness = [val.value for val in robustness] if isinstance(robustness, list) \
+                else [robustness.value] * length
+
+        return satisfy, robustness
+
+    @staticmethod
+    def logical_not(value: bool) -> bool:
+        return not value
+
+    @staticmethod
+    def negate(value: float) -> float:
+        return -value
+
     def __str__(self):
         sb = String_Builder()
         sb.append("Binary_STL_Expr: ( ")
         sb.append("(")
         sb.append(str(self.begin_condition))
         sb.append(") ")
-        sb.append(self.op)
+        sb.append(self.operator)
         sb.append(" [")
         sb.append(str(self.begin_time))
         sb.append(", ")
@@ -206,19 +305,34 @@ class G_Expr(Unary_STL_Expr, ABC):
 
     #     return result
 
-    def weaken(self, option: str, *args):
-        """weaken the STL formula on the AST level"""
+    def weaken(self, option: str, *args) -> "G_Expr":
+        """weaken the STL formula on the AST level, return the weakened copy of the expression
+
+        the expression is not modified: only the nodes on the path to the weakened nodes are copied, the other
+        subexpressions (and their cached types, desugared expressions, etc.) are shared by the copy
+        """
+        result = copy.copy(self)
+
         if option == "ap-range":
-            self.begin_condition.weaken(option, *args)
+            result.begin_condition = self.begin_condition.weaken(option, *args)
         elif option == "time-range":
-            self.begin_time = Binary_Arith_Expr("+", "PLUS", self.begin_time.to_float(), Float_Val(py_obj=args[0]))
-            self.end_time = Binary_Arith_Expr("-", "MINUS", self.end_time.to_float(), Float_Val(py_obj=args[1]))
+            result.begin_time = Binary_Arith_Expr("+", "PLUS", self.begin_time.to_float(), Float_Val(py_obj=args[0]))
+            result.end_time = Binary_Arith_Expr("-", "MINUS", self.end_time.to_float(), Float_Val(py_obj=args[1]))
         else:
             raise RuntimeError("Not Implemented")
 
+        return result
+
     def eval(self, eval_context):
         super().eval(eval_context)
 
+        # the minimum within the window is answered by the range index of the condition, if any
+        range_index = eval_context.signal.get_range_index(self.begin_condition)
+        if range_index is not None:
+            satisfy, robustness = range_index.minimum(*eval_context.signal.resolve_range(
+                eval_context.local_begin_time.value, eval_context.local_end_time.value))
+            return STL_Expr_Eval_Result(satisfy=satisfy, robustness=robustness)
+
         # return type Tuple[Union[Boolean_Val, list[Boolean_Val]], Union[Float_Val, list[Float_Val]]]
         
         satisfy, robustness = self.begin_condition.eval(eval_context, embedded=True)
@@ -235,24 +349,31 @@ class G_Expr(Unary_STL_Expr, ABC):
         return result
 
 
-# TODO: what's robustness with respect to F?
 class F_Expr(Unary_STL_Expr, ABC):
     """support the future STL expression"""
 
     def eval(self, eval_context):
         super().eval(eval_context)
 
+        # the maximum within the window is answered by the range index of the condition, if any
+        range_index = eval_context.signal.get_range_index(self.begin_condition)
+        if range_index is not None:
+            satisfy, robustness = range_index.maximum(*eval_context.signal.resolve_range(
+                eval_context.local_begin_time.value, eval_context.local_end_time.value))
+            return STL_Expr_Eval_Result(satisfy=satisfy, robustness=robustness)
+
         # return type Tuple[Union[Boolean_Val, list[Boolean_Val]], Union[Float_Val, list[Float_Val]]]
         satisfy, robustness = self.begin_condition.eval(eval_context, embedded=True)
         result = None
 
+        # the robustness of F is the maximum robustness of the condition within the time interval
         if isinstance(satisfy, list) and isinstance(robustness, list):
             result_satisfy = Boolean_Val.logical_or_list(satisfy).value
-            # result_robustness = Float_Val.min_of_list(robustness).value
-            result = STL_Expr_Eval_Result(satisfy=result_satisfy)  #, robustness=result_robustness)
+            result_robustness = Float_Val.max_of_list(robustness).value
+            result = STL_Expr_Eval_Result(satisfy=result_satisfy, robustness=result_robustness)
 
         elif isinstance(satisfy, Boolean_Val) and isinstance(robustness, Float_Val):
-            result = STL_Expr_Eval_Result(satisfy=satisfy.value)  #, robustness=robustness.value)
+            result = STL_Expr_Eval_Result(satisfy=satisfy.value, robustness=robustness.value)
 
         return result
 
@@ -279,13 +400,13 @@ class X_Expr(Unary_STL_Expr, ABC):
 
     def eval(self, eval_context):
         """override the super() eval, to adjust the offset of time"""
-        global_begin_time = eval_context.lookup(Id_Val("global_begin_time"))
+        global_begin_time = eval_context.global_begin_time
 
         stl_expr_begin_time = self.begin_time.eval(eval_context)
         local_begin_time = global_begin_time + stl_expr_begin_time
-        eval_context.add(Id_Val("local_begin_time"), local_begin_time + Int_Val(1))  # offset by 1 for Next operator
+        eval_context.local_begin_time = local_begin_time + Int_Val.of(1)  # offset by 1 for Next operator
 
-        eval_context.add(Id_Val("local_end_time"), local_begin_time + Int_Val(1))
+        eval_context.local_end_time = local_begin_time + Int_Val.of(1)
 
         satisfy_list, robustness_list = self.begin_condition.eval(eval_context, embedded=True)
         result_satisfy = Boolean_Val.logical_and_list(satisfy_list).value
@@ -296,16 +417,42 @@ class X_Expr(Unary_STL_Expr, ABC):
 
 
 class U_Expr(Binary_STL_Expr, ABC):
-    pass
+    """support the until STL expression
+
+    (lhs) U[a, b] (rhs) holds when rhs holds at some time t within [a, b], and lhs holds before t
+    """
+
+    def compute(self, lhs: list, rhs: list, begin_time: int, end_time: int, bottom, top, negate):
+        return Binary_STL_Expr.until(lhs, rhs, begin_time, end_time, bottom, top)
 
 
 class R_Expr(Binary_STL_Expr, ABC):
-    pass
+    """support the release STL expression
+
+    (lhs) R[a, b] (rhs) is equivalent to !((!lhs) U[a, b] (!rhs))
+    """
+
+    def compute(self, lhs: list, rhs: list, begin_time: int, end_time: int, bottom, top, negate):
+        return negate(Binary_STL_Expr.until([negate(value) for value in lhs], [negate(value) for value in rhs],
+                                            begin_time, end_time, bottom, top))
 
 
 class W_Expr(Binary_STL_Expr, ABC):
-    pass
+    """support the weak until STL expression
+
+    (lhs) W[a, b] (rhs) is equivalent to ((lhs) U[a, b] (rhs)) || G[0, b](lhs)
+    """
+
+    def compute(self, lhs: list, rhs: list, begin_time: int, end_time: int, bottom, top, negate):
+        return max(Binary_STL_Expr.until(lhs, rhs, begin_time, end_time, bottom, top), min(lhs))
 
 
 class M_Expr(Binary_STL_Expr, ABC):
-    pass
+    """support the strong release STL expression
+
+    (lhs) M[a, b] (rhs) is equivalent to (rhs) U[a, b] ((lhs) && (rhs))
+    """
+
+    def compute(self, lhs: list, rhs: list, begin_time: int, end_time: int, bottom, top, negate):
+        return Binary_STL_Expr.until(rhs, [min(lhs_value, rhs_value) for lhs_value, rhs_value in zip(lhs, rhs)],
+                                     begin_time, end_time, bottom, top)
@@ -19,7 +19,13 @@ from abc import ABC
 
 
 class Primitive_Val(Val, ABC):
-    """super class for values, store primitive value types"""
+    """super class for values, store primitive value types
+
+    note that values are never modified once created, thus the common values (true, false and small
+    integers) are interned (see Boolean_Val.of and Int_Val.of)
+    """
+
+    __slots__ = ()
 
     def __eq__(self, rhs):
         # this check is necessary because the program seems to pass None sometimes for rhs
@@ -29,12 +35,12 @@ class Primitive_Val(Val, ABC):
             result = None
 
             if self.value == rhs.value:
-                result = Boolean_Val("true")
+                result = TRUE
             else:
-                result = Boolean_Val("false")
+                result = FALSE
 
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
@@ -48,13 +54,13 @@ class Primitive_Val(Val, ABC):
             result = None
 
             if self.value != rhs.value:
-                result = Boolean_Val("true")
+                result = TRUE
             else:
-                result = Boolean_Val("false")
+                result = FALSE
 
         else:
             # if rhs is None, return true since they are not equal
-            result = Boolean_Val("true")
+            result = TRUE
 
         return result
 
@@ -64,38 +70,55 @@ class Primitive_Val(Val, ABC):
 
 
 class Int_Val(Primitive_Val):
+    __slots__ = ()
+
     def __init__(self, value: Optional[str] = None, value_type: types.Type = types.Int(), py_obj: Optional[int] = None):
         if py_obj is not None:
             super().__init__(py_obj, value_type)
         else:
             super().__init__(int(value), value_type)
 
+    @staticmethod
+    def of(py_obj: int) -> "Int_Val":
+        """return the Int_Val of the Python integer, small integers are interned"""
+        if type(py_obj) is int and SMALL_INT_MIN <= py_obj <= SMALL_INT_MAX:
+            return SMALL_INT_VALS[py_obj - SMALL_INT_MIN]
+        return Int_Val(py_obj=py_obj)
+
     def __neg__(self):
         # unary minus for Int_Val
-        result = Int_Val(-self.value)
+        result = Int_Val.of(-self.value)
         return result
 
     def __add__(self, rhs):
         """return Int_Val class type. Type signature not hardcoded for future modification"""
-        # assume rhs is also a Int_Val type
-        # result = None
-        # if rhs.value_type == types.Float():
-        # result = Float_Val(self.value + rhs.value)
-        # else:
-        result = Int_Val(self.value + rhs.value)
+        # coerce to Float_Val when rhs is a Float_Val type
+        if isinstance(rhs, Float_Val):
+            return Float_Val(py_obj=self.value + rhs.value)
+
+        result = Int_Val.of(self.value + rhs.value)
         return result
 
     def __sub__(self, rhs):
-        result = Int_Val(self.value - rhs.value, self.value_type)
+        if isinstance(rhs, Float_Val):
+            return Float_Val(py_obj=self.value - rhs.value)
+
+        result = Int_Val.of(self.value - rhs.value)
         return result
 
     def __mul__(self, rhs):
-        result = Int_Val(self.value * rhs.value, self.value_type)
+        if isinstance(rhs, Float_Val):
+            return Float_Val(py_obj=self.value * rhs.value)
+
+        result = Int_Val.of(self.value * rhs.value)
         return result
 
     def __truediv__(self, rhs):
+        if isinstance(rhs, Float_Val):
+            return Float_Val(py_obj=self.value / rhs.value)
+
         # note that integer division will return integer
-        result = Int_Val(self.value // rhs.value, self.value_type)
+        result = Int_Val.of(self.value // rhs.value)
         return result
 
     def __ge__(self, rhs):
@@ -103,9 +126,9 @@ class Int_Val(Primitive_Val):
         result = None
 
         if self.value >= rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
@@ -114,9 +137,9 @@ class Int_Val(Primitive_Val):
         result = None
 
         if self.value > rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
@@ -125,9 +148,9 @@ class Int_Val(Primitive_Val):
         result = None
 
         if self.value <= rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
@@ -136,9 +159,9 @@ class Int_Val(Primitive_Val):
         result = None
 
         if self.value < rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
     
@@ -148,6 +171,8 @@ class Int_Val(Primitive_Val):
 
 
 class Float_Val(Primitive_Val):
+    __slots__ = ()
+
     def __init__(self, value: Optional[str] = None, value_type: types.Type = types.Float(),
                  py_obj: Optional[float] = None):
         if py_obj is not None:
@@ -184,9 +209,9 @@ class Float_Val(Primitive_Val):
         result = None
 
         if self.value >= rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
@@ -195,9 +220,9 @@ class Float_Val(Primitive_Val):
         result = None
 
         if self.value > rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
@@ -206,9 +231,9 @@ class Float_Val(Primitive_Val):
         result = None
 
         if self.value <= rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
@@ -217,24 +242,27 @@ class Float_Val(Primitive_Val):
         result = None
 
         if self.value < rhs.value:
-            result = Boolean_Val("true")
+            result = TRUE
         else:
-            result = Boolean_Val("false")
+            result = FALSE
 
         return result
 
     @staticmethod
     def min_of_list(float_val_list: list):  # accept list of Float_Val
-        py_obj_list = list()
-        for float_val in float_val_list:
-            py_obj_list.append(float_val.value)
-        return Float_Val(py_obj=min(py_obj_list))
+        return Float_Val(py_obj=min(float_val.value for float_val in float_val_list))
+
+    @staticmethod
+    def max_of_list(float_val_list: list):  # accept list of Float_Val
+        return Float_Val(py_obj=max(float_val.value for float_val in float_val_list))
     
     def to_float(self):
         return self
 
 
 class String_Val(Primitive_Val):
+    __slots__ = ()
+
     def __init__(self, value: str, value_type: types.Type = types.String(), py_obj: Optional[bool] = None):
         if py_obj is not None:
             super().__init__(py_obj, value_type)
@@ -258,6 +286,8 @@ class String_Val(Primitive_Val):
 
 
 class Boolean_Val(Primitive_Val):
+    __slots__ = ()
+
     def __init__(self, value: Optional[str] = None,
                  value_type: types.Type = types.Boolean(),
                  py_obj: Optional[bool] = None):
@@ -267,54 +297,58 @@ class Boolean_Val(Primitive_Val):
         else:
             super().__init__(tool.str_to_bool(value), value_type)
 
+    @staticmethod
+    def of(py_obj: bool) -> "Boolean_Val":
+        """return the interned Boolean_Val (TRUE or FALSE) of the Python object"""
+        return TRUE if py_obj else FALSE
+
     def to_str(self):
         return tool.bool_to_str(self.value)
 
     def logical_and(self, rhs):
         # short-circuit evaluation
-        return Boolean_Val(py_obj=(self.value and rhs.value))
+        return Boolean_Val.of(self.value and rhs.value)
 
     def logical_or(self, rhs):
-        return Boolean_Val(py_obj=(self.value or rhs.value))
+        return Boolean_Val.of(self.value or rhs.value)
 
     def logical_implies(self, rhs):
-        return Boolean_Val(py_obj=((not self.value) or rhs.value))
+        return Boolean_Val.of((not self.value) or rhs.value)
 
     def logical_not(self):
-        return Boolean_Val(py_obj=(not self.value))
+        return Boolean_Val.of(not self.value)
 
     def logical_equals(self, rhs):
-        return Boolean_Val(py_obj=(self.value == rhs.value))
+        return Boolean_Val.of(self.value == rhs.value)
 
     @staticmethod
     def logical_and_list(boolean_val_list):
         """support for G: Globally operator"""
-        result = Boolean_Val(py_obj=True)   # by default result is set to True
-
-        # loop through the boolean value list and calculate the logical and value
+        # short circuit for the multiple logical and connectives
         for boolean_val in boolean_val_list:
-            result = boolean_val.logical_and(result)
-
-            # short circuit for the multiple logical and connectives
-            if result.logical_equals(Boolean_Val(py_obj=False)).value:
-                return result
+            if not boolean_val.value:
+                return FALSE
 
-        return result
+        return TRUE
 
     @staticmethod
     def logical_or_list(boolean_val_list):
         """super for F: Eventually operator"""
-        result = Boolean_Val(py_obj=False)  # by default result is set to True
-
-        # loop through the boolean value list and calculate the logical and value
+        # short circuit for the multiple logical or connectives
         for boolean_val in boolean_val_list:
-            result = boolean_val.logical_or(result)
+            if boolean_val.value:
+                return TRUE
 
-            # short circuit for the multiple logical and connectives
-            if result.logical_equals(Boolean_Val(py_obj=True)).value:
-                return result
+        return FALSE
 
-        return result
+
+# interned values, note that the values are never modified once created
+TRUE = Boolean_Val(py_obj=True)
+FALSE = Boolean_Val(py_obj=False)
+
+SMALL_INT_MIN = -5
+SMALL_INT_MAX = 256
+SMALL_INT_VALS = [Int_Val(py_obj=py_obj) for py_obj in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)]
 
 
 class Id_Val(Val):
@@ -325,6 +359,8 @@ class Id_Val(Val):
             and STL formula operator
     """
 
+    __slots__ = ("cached_eval_result_val",)
+
     def __init__(self, value: str, value_type: types.Type = types.Unresolved()):
         super().__init__(value, value_type)
         self.cached_eval_result_val = None
@@ -363,15 +399,9 @@ class Id_Val(Val):
     def eval(self, eval_context, embedded = False):
         """return a list of low-level values sliced by the local_begin_time and local_end_time"""
 
-        # by default, lookup the full length of the signal
-        local_begin_time: Optional[Int_Val] = None
-        local_end_time: Optional[Int_Val] = None
-
-        if eval_context.has_id(Id_Val("local_begin_time")) and eval_context.has_id(Id_Val("local_end_time")):
-            local_begin_time = eval_context.lookup(Id_Val("local_begin_time"))
-            local_end_time = eval_context.lookup(Id_Val("local_end_time"))
-
-        result: list = eval_context.lookup_signal(self, begin_time=local_begin_time, end_time=local_end_time)
+        # by default (outside of STL expressions), lookup the full length of the signal
+        result: list = eval_context.lookup_signal(self, begin_time=eval_context.local_begin_time,
+                                                  end_time=eval_context.local_end_time)
         return result
 
     def type_check(self, type_context):
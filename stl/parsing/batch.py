@@ -0,0 +1,110 @@
+# Mon Oct 19 02:24:37 EDT 2026
+# batch evaluation of many ASTs against one signal, sharing the signal columns and the atomic predicates
+
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+import stl.parsing.ast as ast
+from stl.parsing.vectorized import Vectorized_Evaluator
+
+
+class Batch_Evaluator(Vectorized_Evaluator):
+    """vectorized evaluator shared by the ASTs of a batch (see stl.obj.spec_set.Spec_Set)
+
+    the columns of the identifiers are loaded from the signal once and sliced for the window of each formula
+    (slices of NumPy arrays are views). atomic predicates, i.e. comparisons without STL expressions, only
+    depend on the signal element at each time index, thus each distinct predicate (identified by its string
+    representation, like the range indices of the signal) is evaluated once and sliced for the windows of
+    every formula that contains it. thus the cost of a batch scales with the number of distinct columns and
+    predicates, rather than with the number of formulas.
+
+    a cached column or predicate covers the union of the index ranges requested so far. a range outside of
+    it reloads the column (or re-evaluates the predicate) over a range at least twice as large, thus each
+    entry is loaded O(log n) times at most.
+
+    Attributes:
+        columns: {identifier name: (begin index, end index, column)}
+        predicates: {str(predicate): (begin index, end index, (satisfaction, robustness))}
+        predicate_keys: {id(node): str(node) or None}, may be shared by the batches of the same ASTs (the ASTs
+            must outlive the dictionary)
+
+    Usage:
+        >>> evaluator = Batch_Evaluator(signal, global_begin_time=0)
+        >>> evaluator.interpret(parsed_expr_1)
+        >>> evaluator.interpret(parsed_expr_2)   # reuses the columns and predicates of parsed_expr_1
+    """
+
+    def __init__(self, signal, global_begin_time: int, predicate_keys: Optional[dict] = None):
+        super().__init__(signal, global_begin_time)
+        self.length = len(signal)
+        self.columns: dict[str, tuple] = dict()
+        self.predicates: dict[str, tuple] = dict()
+        self.predicate_keys: dict[int, Optional[str]] = dict() if predicate_keys is None else predicate_keys
+
+    def eval(self, node, begin_index: int, end_index: int) -> Any:
+        # ranges out of the signal are left to the vectorized evaluator, which reports the error
+        if 0 <= begin_index <= end_index < self.length:
+            if isinstance(node, ast.Id_Val):
+                return self.lookup(self.columns, node.name, begin_index, end_index,
+                                   lambda load_begin, load_end: self.signal.column(node.name, load_begin, load_end))
+
+            key = self.predicate_key(node)
+            if key is not None:
+                return self.lookup(self.predicates, key, begin_index, end_index,
+                                   lambda load_begin, load_end: super(Batch_Evaluator, self).eval(
+                                       node, load_begin, load_end))
+
+        return super().eval(node, begin_index, end_index)
+
+    def eval_plain(self, node) -> Any:
+        if isinstance(node, ast.Id_Val) and self.length > 0:
+            return self.eval(node, 0, self.length - 1)
+
+        return super().eval_plain(node)
+
+    def lookup(self, cache: dict, key: str, begin_index: int, end_index: int,
+               load: Callable[[int, int], Any]) -> Any:
+        """return the cached result sliced to [begin_index, end_index], load it over a larger range on a miss"""
+        load_begin, load_end = begin_index, end_index
+        entry = cache.get(key)
+
+        if entry is not None:
+            cached_begin, cached_end, result = entry
+
+            if cached_begin <= begin_index and end_index <= cached_end:
+                return Batch_Evaluator.slice(result, begin_index - cached_begin, end_index - cached_begin)
+
+            # cover both ranges, extended to twice the size of the cached range
+            size = 2 * (cached_end - cached_begin + 1)
+            load_begin, load_end = min(begin_index, cached_begin), max(end_index, cached_end)
+            load_end = min(self.length - 1, max(load_end, load_begin + size - 1))
+            load_begin = max(0, min(load_begin, load_end - size + 1))
+
+        result = load(load_begin, load_end)
+        cache[key] = (load_begin, load_end, result)
+
+        return Batch_Evaluator.slice(result, begin_index - load_begin, end_index - load_begin)
+
+    def predicate_key(self, node) -> Optional[str]:
+        """the key of an atomic predicate, None for the other nodes (computed once per node)"""
+        node_id = id(node)
+
+        if node_id not in self.predicate_keys:
+            is_predicate = isinstance(node, (ast.Binary_Comp_Expr, ast.Chain_Comp_Expr)) and \
+                not Vectorized_Evaluator.has_stl_expr(node)
+            self.predicate_keys[node_id] = str(node) if is_predicate else None
+
+        return self.predicate_keys[node_id]
+
+    @staticmethod
+    def slice(result: Any, begin_index: int, end_index: int) -> Any:
+        """slice the arrays of a (satisfaction, robustness) pair, scalars (predicates without identifiers)
+        are kept as is"""
+        if isinstance(result, tuple):
+            return tuple(Batch_Evaluator.slice(value, begin_index, end_index) for value in result)
+
+        if isinstance(result, np.ndarray) and result.ndim == 1:
+            return result[begin_index:end_index + 1]
+
+        return result
@@ -0,0 +1,130 @@
+# Sun Oct 18 19:24:36 EDT 2026
+# process-wide cache of parsed (and type checked) STL expressions
+
+import re
+import threading
+from collections import OrderedDict
+
+import stl.error as error
+
+
+class Parse_Cache:
+    """size-bounded LRU cache of ASTs keyed by the normalized text of STL expressions (see normalize)
+
+    the cached ASTs are shared by all the STL objects created from the same text, thus they must never
+    be modified in place (STL.weaken copies the modified path of the AST). the cache is safe to use from
+    multiple threads.
+
+    Attributes:
+        maxsize: maximum number of cached ASTs, the least recently used AST is evicted first. 0 disables
+            the cache
+        hits: number of lookups that found a cached AST
+        misses: number of lookups that did not find a cached AST
+
+    Usage:
+        >>> cache = Parse_Cache(maxsize=2)
+        >>> cache.lookup("G[0, 1](x > 0)")     # None when not cached
+        >>> cache.add("G[0, 1](x > 0)", parsed_expr)
+        >>> cache.lookup("G[0, 1]( x > 0 )") is parsed_expr   # the text is normalized
+        True
+        >>> cache.hits, cache.misses
+        (1, 1)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.maxsize_val = 0
+        self.hits_val = 0
+        self.misses_val = 0
+
+        self.maxsize = maxsize
+
+    # string literals of a line, from the first to the last double quote (see the STRING rule of the lexer)
+    string_pattern = re.compile(r"(\".*\")")
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """normalize the whitespaces of the text, which are ignored by the lexer, except within string literals
+
+        a string literal spans the first to the last double quote of a line, thus the string literals and the
+        line breaks are kept as is
+        """
+        lines = list()
+
+        for line in text.split("\n"):
+            # the odd parts are the string literals
+            parts = Parse_Cache.string_pattern.split(line)
+            line = "".join(part if index % 2 == 1 else re.sub(r"\s+", " ", part)
+                           for index, part in enumerate(parts)).strip()
+
+            if line:
+                lines.append(line)
+
+        return "\n".join(lines)
+
+    def lookup(self, text: str):
+        """return the cached AST of the text, or None if the AST is not cached"""
+        key = Parse_Cache.normalize(text)
+
+        with self.lock:
+            parsed_expr = self.entries.get(key)
+
+            if parsed_expr is None:
+                self.misses_val += 1
+            else:
+                self.hits_val += 1
+                self.entries.move_to_end(key)
+
+        return parsed_expr
+
+    def add(self, text: str, parsed_expr) -> None:
+        """cache the AST of the text, evict the least recently used ASTs beyond the maximum size"""
+        key = Parse_Cache.normalize(text)
+
+        with self.lock:
+            if self.maxsize_val == 0:
+                return
+
+            self.entries[key] = parsed_expr
+            self.entries.move_to_end(key)
+            self.evict()
+
+    def clear(self) -> None:
+        """remove all the cached ASTs and reset the counters"""
+        with self.lock:
+            self.entries.clear()
+            self.hits_val = 0
+            self.misses_val = 0
+
+    def evict(self) -> None:
+        # note that the lock must be held by the caller
+        while len(self.entries) > self.maxsize_val:
+            self.entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, text: str) -> bool:
+        return Parse_Cache.normalize(text) in self.entries
+
+    @property
+    def maxsize(self) -> int:
+        return self.maxsize_val
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int):
+        if maxsize < 0:
+            raise error.STL_Error("maximum size of the parse cache must not be negative, it is now " + str(maxsize))
+
+        with self.lock:
+            self.maxsize_val = maxsize
+            self.evict()
+
+    @property
+    def hits(self) -> int:
+        return self.hits_val
+
+    @property
+    def misses(self) -> int:
+        return self.misses_val
@@ -0,0 +1,377 @@
+# Sun Oct 18 18:02:41 EDT 2026
+# compiles the AST of STL expressions to Python closures, all the dispatch on the node and operator types
+# is resolved once at compile time
+
+import operator as py_operator
+from itertools import repeat
+from typing import Any, Callable, Optional
+
+import stl.parsing.ast as ast
+import stl.parsing.online as online
+from stl.obj.result import STL_Expr_Eval_Result
+
+
+class Unsupported_Expr(Exception):
+    """raised by the compiler for AST nodes that are left to the reference interpreter
+
+    note that stl.error classes print their message upon creation, thus they are not used for
+    unsupported nodes, which are not an error of the user
+    """
+    pass
+
+
+class Compiled_Expr:
+    """STL expression compiled to a tree of closures
+
+    the closures of the conditions map the signal columns within the time window of the expression
+    to lists of satisfaction and robustness values, constant sub-expressions are folded at compile time
+
+    Usage:
+        >>> compiled_expr = compile_expr(STL("G[0, 1](x > 0)").parsed_expr)
+        >>> compiled_expr.eval(0, Signal(py_dict={"0": {"content": {"x": 1}}, "1": {"content": {"x": 2}}}))
+        satisfy: True
+        robustness: 1.0
+    """
+
+    def __init__(self, names: list, window_begin: int, window_end: int, evaluate: Callable,
+                 fixed_window: bool = False):
+        self.names = names                 # identifier of each column, indexed by slot
+        self.window_begin = window_begin   # time window of the expression, relative to the global begin time
+        self.window_end = window_end
+        self.evaluate = evaluate           # (columns, length) -> STL_Expr_Eval_Result
+        self.fixed_window = fixed_window   # whether evaluate relies on one element per time unit
+
+    def eval(self, global_begin_time: int, signal) -> STL_Expr_Eval_Result:
+        begin_time = global_begin_time + self.window_begin
+        end_time = global_begin_time + self.window_end
+
+        columns = [Compiled_Expr.column(signal, name, begin_time, end_time) for name in self.names]
+
+        if signal.timestamps is None:
+            return self.evaluate(columns, end_time - begin_time + 1)
+
+        # the times of timestamped signals are resolved by binary search
+        begin_index, end_index = signal.index_range(begin_time, end_time)
+        return self.evaluate(columns, end_index - begin_index + 1)
+
+    @staticmethod
+    def column(signal, name: str, begin_time: int, end_time: int) -> list:
+        # integers are converted to floating-point numbers, like the ll flag of Signal.lookup
+        return [float(value) if type(value) is int else value
+                for value in signal.lookup(name, begin_time=begin_time, end_time=end_time)]
+
+
+def compile_expr(parsed_expr) -> Optional[Compiled_Expr]:
+    """compile the (type checked) AST, return None if the AST is left to the reference interpreter"""
+    try:
+        return Compiler().compile(parsed_expr)
+    except Unsupported_Expr:
+        return None
+
+
+class Compiler:
+    """lower the AST to closures, identifiers are resolved to the slots of the signal columns"""
+
+    comp_ops = {"GREATER": py_operator.gt,
+                "GREATER_EQUAL": py_operator.ge,
+                "LESS": py_operator.lt,
+                "LESS_EQUAL": py_operator.le,
+                "EQUAL_EQUAL": py_operator.eq,
+                "NOT_EQUAL": py_operator.ne}
+
+    arith_ops = {"PLUS": py_operator.add,
+                 "MINUS": py_operator.sub,
+                 "MULTIPLY": py_operator.mul,
+                 "DIVIDE": py_operator.truediv}  # columns are of floating-point numbers
+
+    def __init__(self):
+        self.names: list = list()
+
+    def compile(self, parsed_expr) -> Compiled_Expr:
+        # only STL expressions are compiled, other expressions are evaluated over the entire signal
+        if isinstance(parsed_expr, (ast.G_Expr, ast.F_Expr)):
+            begin_time, end_time = self.interval(parsed_expr)
+            condition = self.condition(parsed_expr.begin_condition)
+            evaluate = Compiler.window(condition, isinstance(parsed_expr, ast.G_Expr))
+
+        elif isinstance(parsed_expr, ast.X_Expr):
+            begin_time = end_time = self.time(parsed_expr.begin_time) + 1  # offset by 1 for Next operator
+            evaluate = Compiler.window(self.condition(parsed_expr.begin_condition), True)
+
+        elif isinstance(parsed_expr, ast.Binary_STL_Expr):
+            # the lhs condition is required from the global begin time
+            until_begin_time, end_time = self.interval(parsed_expr)
+            begin_time = 0
+            evaluate = Compiler.until(parsed_expr.compute, until_begin_time, end_time,
+                                      self.condition(parsed_expr.begin_condition, quantifiable=False),
+                                      self.condition(parsed_expr.end_condition, quantifiable=False))
+
+        else:
+            raise Unsupported_Expr()
+
+        return Compiled_Expr(self.names, begin_time, end_time, evaluate,
+                             fixed_window=isinstance(parsed_expr, ast.Binary_STL_Expr))
+
+    #################
+    # STL operators #
+    #################
+
+    @staticmethod
+    def window(condition: Callable, minimum: bool) -> Callable:
+        """G (minimum) and F (maximum) of the condition over the time window"""
+        if minimum:
+            def evaluate(columns: list, length: int) -> STL_Expr_Eval_Result:
+                satisfy, robustness = condition(columns, length)
+                return STL_Expr_Eval_Result(satisfy=all(satisfy), robustness=float(min(robustness)))
+        else:
+            def evaluate(columns: list, length: int) -> STL_Expr_Eval_Result:
+                satisfy, robustness = condition(columns, length)
+                return STL_Expr_Eval_Result(satisfy=any(satisfy), robustness=float(max(robustness)))
+
+        return evaluate
+
+    @staticmethod
+    def until(compute: Callable, begin_time: int, end_time: int, lhs: Callable, rhs: Callable) -> Callable:
+        """U, R, W and M, computed by the AST node (see Binary_STL_Expr.compute)"""
+        logical_not = ast.Binary_STL_Expr.logical_not
+        negate = ast.Binary_STL_Expr.negate
+
+        def evaluate(columns: list, length: int) -> STL_Expr_Eval_Result:
+            lhs_satisfy, lhs_robustness = lhs(columns, length)
+            rhs_satisfy, rhs_robustness = rhs(columns, length)
+
+            satisfy = compute(lhs_satisfy, rhs_satisfy, begin_time, end_time, False, True, logical_not)
+            robustness = None
+
+            if lhs_robustness is not None and rhs_robustness is not None:
+                robustness = float(compute(lhs_robustness, rhs_robustness, begin_time, end_time,
+                                           float("-inf"), float("inf"), negate))
+
+            return STL_Expr_Eval_Result(satisfy=bool(satisfy), robustness=robustness)
+
+        return evaluate
+
+    ##############
+    # conditions #
+    ##############
+
+    def condition(self, node, quantifiable: bool = True) -> Callable:
+        """return a closure (columns, length) -> (satisfaction list, robustness list or None)
+
+        quantifiable: whether the robustness is required (G, F and X are not defined without it)
+        """
+        if isinstance(node, ast.Shared_Expr):
+            return self.condition(node.expr, quantifiable)
+
+        if isinstance(node, ast.Binary_Comp_Expr):
+            condition = self.comparison(node.op_type, self.value(node.lhs), self.value(node.rhs))
+
+        elif isinstance(node, ast.Chain_Comp_Expr):
+            condition = self.chain_comparison(node)
+
+        elif isinstance(node, ast.Binary_Logic_Expr):
+            condition = Compiler.logic(node.op_type, self.condition(node.lhs, quantifiable),
+                                       self.condition(node.rhs, quantifiable))
+
+        elif isinstance(node, ast.Unary_Logic_Expr) and node.op_type == "LOGICAL_NOT":
+            condition = Compiler.logical_not(self.condition(node.rhs, quantifiable))
+
+        else:
+            # boolean values, implications and equivalences are left to the reference interpreter
+            raise Unsupported_Expr()
+
+        if quantifiable and condition.robustness is None:
+            raise Unsupported_Expr()
+
+        return condition
+
+    def comparison(self, op_type: str, lhs: Any, rhs: Any) -> Callable:
+        comp_op, robustness_op = Compiler.comparison_ops(op_type, lhs, rhs)
+        lhs, rhs = Compiler.as_list(lhs), Compiler.as_list(rhs)
+
+        if robustness_op is None:
+            def condition(columns: list, length: int) -> tuple:
+                return list(map(comp_op, lhs(columns, length), rhs(columns, length))), None
+        else:
+            def condition(columns: list, length: int) -> tuple:
+                lhs_values = lhs(columns, length)
+                rhs_values = rhs(columns, length)
+                return (list(map(comp_op, lhs_values, rhs_values)),
+                        list(map(robustness_op, lhs_values, rhs_values)))
+
+        condition.robustness = robustness_op
+        return condition
+
+    def chain_comparison(self, node) -> Callable:
+        # desugar the chain comparison expression to two binary comparison expressions joined by
+        # LOGICAL_AND, the operand in the middle is evaluated once
+        opd1, opd2, opd3 = self.value(node.opd1), self.value(node.opd2), self.value(node.opd3)
+        comp1_op, robustness1_op = Compiler.comparison_ops(node.op1_type, opd1, opd2)
+        comp2_op, robustness2_op = Compiler.comparison_ops(node.op2_type, opd2, opd3)
+        opd1, opd2, opd3 = Compiler.as_list(opd1), Compiler.as_list(opd2), Compiler.as_list(opd3)
+        quantifiable = robustness1_op is not None and robustness2_op is not None
+
+        def condition(columns: list, length: int) -> tuple:
+            opd1_values = opd1(columns, length)
+            opd2_values = opd2(columns, length)
+            opd3_values = opd3(columns, length)
+
+            satisfy = list(map(py_operator.and_, map(comp1_op, opd1_values, opd2_values),
+                               map(comp2_op, opd2_values, opd3_values)))
+
+            if not quantifiable:
+                return satisfy, None
+
+            return satisfy, list(map(min, map(robustness1_op, opd1_values, opd2_values),
+                                     map(robustness2_op, opd2_values, opd3_values)))
+
+        condition.robustness = min if quantifiable else None
+        return condition
+
+    @staticmethod
+    def comparison_ops(op_type: str, lhs: Any, rhs: Any) -> tuple:
+        """return the satisfaction and robustness functions (see Binary_Comp_Expr) of (lhs, rhs) values"""
+        comp_op = Compiler.comp_ops[op_type]
+
+        if op_type == "GREATER" or op_type == "GREATER_EQUAL":
+            robustness_op = py_operator.sub
+        elif op_type == "LESS" or op_type == "LESS_EQUAL":
+            robustness_op = Compiler.reversed_sub
+        elif isinstance(lhs, bool) or isinstance(rhs, bool):
+            robustness_op = None  # robustness is not defined for Boolean values
+        elif op_type == "EQUAL_EQUAL":
+            robustness_op = Compiler.negative_distance
+        else:
+            robustness_op = Compiler.distance
+
+        return comp_op, robustness_op
+
+    @staticmethod
+    def reversed_sub(lhs: float, rhs: float) -> float:
+        return rhs - lhs
+
+    @staticmethod
+    def distance(lhs: float, rhs: float) -> float:
+        return abs(lhs - rhs)
+
+    @staticmethod
+    def negative_distance(lhs: float, rhs: float) -> float:
+        return -abs(lhs - rhs)
+
+    @staticmethod
+    def logic(op_type: str, lhs: Callable, rhs: Callable) -> Callable:
+        if op_type == "LOGICAL_AND":
+            satisfy_op, robustness_op = py_operator.and_, min
+        elif op_type == "LOGICAL_OR":
+            satisfy_op, robustness_op = py_operator.or_, max
+        else:
+            raise Unsupported_Expr()
+
+        quantifiable = lhs.robustness is not None and rhs.robustness is not None
+
+        def condition(columns: list, length: int) -> tuple:
+            lhs_satisfy, lhs_robustness = lhs(columns, length)
+            rhs_satisfy, rhs_robustness = rhs(columns, length)
+
+            return (list(map(satisfy_op, lhs_satisfy, rhs_satisfy)),
+                    list(map(robustness_op, lhs_robustness, rhs_robustness)) if quantifiable else None)
+
+        condition.robustness = robustness_op if quantifiable else None
+        return condition
+
+    @staticmethod
+    def logical_not(rhs: Callable) -> Callable:
+        def condition(columns: list, length: int) -> tuple:
+            satisfy, robustness = rhs(columns, length)
+            return ([not value for value in satisfy],
+                    None if robustness is None else [-value for value in robustness])
+
+        condition.robustness = rhs.robustness
+        return condition
+
+    ##########
+    # values #
+    ##########
+
+    def value(self, node) -> Any:
+        """return a closure columns -> list of values, or the value of a constant expression"""
+        if isinstance(node, ast.Shared_Expr):
+            return self.value(node.expr)
+
+        if isinstance(node, ast.Id_Val):
+            slot = self.slot(node.name)
+            return lambda columns: columns[slot]
+
+        elif isinstance(node, ast.Val):
+            return node.value
+
+        elif isinstance(node, ast.Binary_Arith_Expr):
+            return Compiler.arith(node.op_type, self.value(node.lhs), self.value(node.rhs))
+
+        elif isinstance(node, ast.Unary_Arith_Expr):
+            rhs = self.value(node.rhs)
+
+            if node.op_type == "PLUS":
+                return rhs
+            elif node.op_type != "MINUS":
+                raise Unsupported_Expr()
+            elif callable(rhs):
+                return lambda columns: list(map(py_operator.neg, rhs(columns)))
+            else:
+                return -rhs
+
+        else:
+            raise Unsupported_Expr()
+
+    @staticmethod
+    def arith(op_type: str, lhs: Any, rhs: Any) -> Any:
+        if op_type not in Compiler.arith_ops:
+            raise Unsupported_Expr()
+
+        # constant expressions are folded, note that integer division will return integer (see Int_Val)
+        if not callable(lhs) and not callable(rhs):
+            return online.arith(op_type, lhs, rhs)
+
+        arith_op = Compiler.arith_ops[op_type]
+
+        if not callable(rhs):
+            return lambda columns: list(map(arith_op, lhs(columns), repeat(rhs)))
+        elif not callable(lhs):
+            return lambda columns: list(map(arith_op, repeat(lhs), rhs(columns)))
+        else:
+            return lambda columns: list(map(arith_op, lhs(columns), rhs(columns)))
+
+    def slot(self, name: str) -> int:
+        """resolve the identifier to the slot of its signal column"""
+        if name not in self.names:
+            self.names.append(name)
+        return self.names.index(name)
+
+    @staticmethod
+    def as_list(value: Any) -> Callable:
+        """return a closure (columns, length) -> list of values of the given length"""
+        if callable(value):
+            return lambda columns, length: value(columns)
+        return lambda columns, length: [value] * length
+
+    ##################
+    # time intervals #
+    ##################
+
+    def interval(self, node) -> tuple:
+        begin_time, end_time = self.time(node.begin_time), self.time(node.end_time)
+
+        # invalid time intervals are reported by the reference interpreter
+        if begin_time < 0 or begin_time > end_time:
+            raise Unsupported_Expr()
+
+        return begin_time, end_time
+
+    def time(self, node) -> int:
+        # time intervals are constant expressions
+        time = self.value(node)
+
+        if callable(time) or int(time) != time:
+            raise Unsupported_Expr()
+
+        return int(time)
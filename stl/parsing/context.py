@@ -14,9 +14,10 @@ class Eval_Context:
         use id string for the key of the dictionary to boost the look up speed and efficiency
     """
 
-    def __init__(self, context=dict(), outer_context=None):
+    def __init__(self, context=None, outer_context=None):
         # by default, no outer_context (assume that it is top-level)
-        self.context = context
+        # note that a default dict() would be shared by all the contexts
+        self.context = dict() if context is None else context
         self.outer_context = outer_context
 
     def add(self, id_expr, id_value, attr=list()):
@@ -73,9 +74,10 @@ class Type_Context:
         context: {"id_name": evaluated_id_type, ...}
     """
 
-    def __init__(self, context=dict(), outer_context=None):
+    def __init__(self, context=None, outer_context=None):
         # by default, no outer_context (assume that it is top-level)
-        self.context = context
+        # note that a default dict() would be shared by all the contexts
+        self.context = dict() if context is None else context
         self.outer_context = outer_context
 
     def add(self, id_expr, id_value, attr=list()):
@@ -117,3 +119,45 @@ class Type_Context:
     def __len__(self):
         return len(self.context)
 
+
+
+class Frame:
+    """evaluation context of the reference interpreter, allocated for each evaluation
+
+    the identifiers of the context are resolved to fixed slots (see __slots__) instead of dictionary
+    entries keyed by Id_Val, thus a lookup is an attribute access at a fixed offset. a fresh frame is
+    allocated by the interpreter for every evaluation, thus the local time interval set by an STL
+    expression never leaks to other evaluations.
+
+    Attributes:
+        global_begin_time: begin time of the evaluation (Int_Val)
+        signal: signal to be evaluated
+        local_begin_time, local_end_time: time interval of the signal accessed by the conditions of
+            STL expressions (Int_Val), None outside of STL expressions (the full length of the signal)
+        memo: results of the shared subexpressions (see Shared_Expr), allocated on first use
+
+    Usage:
+        >>> frame = Frame(Int_Val(py_obj=0), signal)
+        >>> frame.local_begin_time = Int_Val(py_obj=1)
+        >>> frame.local_end_time = Int_Val(py_obj=2)
+        >>> frame.lookup_signal(Id_Val("x"), frame.local_begin_time, frame.local_end_time)
+    """
+
+    __slots__ = ("global_begin_time", "signal", "local_begin_time", "local_end_time", "memo")
+
+    def __init__(self, global_begin_time: Int_Val, signal):
+        self.global_begin_time = global_begin_time
+        self.signal = signal
+        self.local_begin_time: Optional[Int_Val] = None
+        self.local_end_time: Optional[Int_Val] = None
+        self.memo: Optional[dict] = None
+
+    def lookup_signal(self, id_expr, begin_time: Optional[Int_Val] = None, end_time: Optional[Int_Val] = None):
+        """look up the value for the corresponding identifier for the signal"""
+        if begin_time is not None and end_time is not None:
+            return self.signal.lookup(id_expr.name, begin_time=begin_time.value, end_time=end_time.value, ll=True)
+        else:
+            return self.signal.lookup(id_expr.name, ll=True)
+
+    def __str__(self):
+        return str({name: str(getattr(self, name)) for name in Frame.__slots__})
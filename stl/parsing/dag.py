@@ -0,0 +1,129 @@
+# Mon Oct 19 03:20:12 EDT 2026
+# common subexpression elimination: hash-consing of the AST into a DAG of shared subexpressions
+
+import copy
+from typing import Any
+
+from stl.parsing.ast_collection.core import Node, Val
+from stl.parsing.ast_collection.shared_expr import Shared_Expr
+
+# cached attributes of the nodes, not part of their structure
+CACHED_ATTRIBUTES = frozenset(("checked_type_val", "cached_eval_result_val", "desugared_val"))
+
+
+def share(parsed_expr: Node) -> Node:
+    """merge the structurally identical subexpressions of the AST, wrap those with several parents into
+    Shared_Expr nodes (computed once per time window during an evaluation), return the root of the DAG
+
+    the AST is modified in place (the child attributes of the nodes point to the merged nodes). values (leaf
+    nodes) are compared by their type and value, but not merged, since their evaluation costs nothing. the
+    pass is idempotent, the existing Shared_Expr nodes are unwrapped and shared again.
+
+    Usage:
+        >>> parsed_expr = share(parser.parse(lexer.lex("(x > 0) U[0, 5] ((x > 0) && (y < 3))")))
+        >>> # the two (x > 0) subexpressions are merged into one Shared_Expr node
+    """
+    table: dict[tuple, Node] = dict()          # {structural key: merged node}
+    keys: dict[int, tuple] = dict()            # {id(merged node): structural key}
+    parsed_expr = hash_cons(parsed_expr, table, keys)
+
+    # count the parents of the merged nodes (a node referenced twice by the same parent counts twice)
+    parent_counts: dict[int, int] = dict()
+    for node in unique_nodes(parsed_expr):
+        for _, child in child_attributes(node):
+            if not isinstance(child, Val):
+                parent_counts[id(child)] = parent_counts.get(id(child), 0) + 1
+
+    # one wrapper per shared node, referenced by all of its parents
+    wrappers: dict[int, Shared_Expr] = dict()
+    for node in unique_nodes(parsed_expr):
+        for name, child in child_attributes(node):
+            if parent_counts.get(id(child), 0) > 1:
+                if id(child) not in wrappers:
+                    wrappers[id(child)] = Shared_Expr(child)
+                setattr(node, name, wrappers[id(child)])
+
+    return parsed_expr
+
+
+def unshare(parsed_expr: Node) -> Node:
+    """return a copy of the AST as a tree, i.e. without Shared_Expr nodes and with a distinct copy of every
+    occurrence of a subexpression (e.g. to modify one occurrence without modifying the others). the given
+    AST is not modified."""
+    while isinstance(parsed_expr, Shared_Expr):
+        parsed_expr = parsed_expr.expr
+
+    if isinstance(parsed_expr, Val):
+        return copy.copy(parsed_expr)
+
+    result = copy.copy(parsed_expr)
+    for name, child in child_attributes(parsed_expr):
+        setattr(result, name, unshare(child))
+
+    return result
+
+
+def hash_cons(node: Node, table: dict, keys: dict) -> Node:
+    """return the merged node structurally identical to the node (the node itself if it is the first one)"""
+    while isinstance(node, Shared_Expr):
+        node = node.expr
+
+    if id(node) in keys:   # already merged (e.g. a DAG given to share)
+        return node
+
+    if isinstance(node, Val):
+        keys[id(node)] = (type(node), node.value_val, str(node.value_type_val))
+        return node
+
+    structure = list()
+    for name, value in sorted(vars(node).items()):
+        if name in CACHED_ATTRIBUTES:
+            continue
+
+        if isinstance(value, Node):
+            value = hash_cons(value, table, keys)
+            setattr(node, name, value)
+            structure.append((name, keys[id(value)] if isinstance(value, Val) else id(value)))
+        else:
+            structure.append((name, hashable(value)))
+
+    key = (type(node), tuple(structure))
+    merged_node = table.setdefault(key, node)
+    keys[id(merged_node)] = key
+
+    return merged_node
+
+
+def child_attributes(node: Node) -> list[tuple[str, Node]]:
+    """return the (attribute name, child node) pairs of the node"""
+    if isinstance(node, Val):
+        return list()
+
+    return [(name, value) for name, value in vars(node).items()
+            if name not in CACHED_ATTRIBUTES and isinstance(value, Node)]
+
+
+def unique_nodes(parsed_expr: Node) -> list[Node]:
+    """return the distinct nodes of the DAG, parents before children"""
+    result = list()
+    visited = set()
+    stack = [parsed_expr]
+
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+
+        visited.add(id(node))
+        result.append(node)
+        stack.extend(child for _, child in reversed(child_attributes(node)))
+
+    return result
+
+
+def hashable(value: Any) -> Any:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
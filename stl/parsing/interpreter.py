@@ -7,14 +7,16 @@ from stl.parsing.parser import Parser
 
 import stl.parsing.ast as ast
 import stl.parsing.context as ctx
-from stl.parsing.ast_collection.val import Int_Val
+from stl.parsing.profiler import Profiler, Profiling_Frame
+import stl.obj.util as util
 
 import stl.tool as tool
+import stl.error as error
 from stl import Signal
 import stl.parsing.type as types
 
 from typing import Optional
-from stl.obj.result import Eval_Result, Eval_Result_Transformer
+from stl.obj.result import Eval_Result, Eval_Result_Transformer, Trace_Eval_Result
 
 """
 Usage:
@@ -24,43 +26,129 @@ Usage:
 
 
 class Interpreter:
+    """evaluate the AST with respect to a signal, starting from the global begin time
+
+    Attributes:
+        engine: the evaluation engine
+            "reference" : evaluate the AST nodes (Node.eval) element by element
+            "numpy"     : evaluate each AST node once per window with NumPy arrays (see vectorized.py)
+        profile: record the evaluation statistics of each AST node (reference engine only), the report is
+            attached to the evaluation result (see Eval_Result.profile and profiler.py)
+    """
+
+    engines = ("reference", "numpy")
 
     def __init__(self, global_begin_time: int, signal: Signal,
                 #  lexer: Optional[Lexer] = Lexer(), parser: Optional[Parser] = Parser(),
                 # parsed_expr, 
-                  debug: bool = False):
+                  debug: bool = False, engine: str = "reference", profile: bool = False):
         self.global_begin_time = global_begin_time
         self.signal = signal
         # self.lexer = lexer
         # self.parser = parser
         self.debug = debug
 
+        if engine not in Interpreter.engines:
+            raise error.STL_Error("Evaluation engine \"" + str(engine) + "\" is not recognized. " +
+                                  "Supported engines are " + ", ".join(Interpreter.engines))
+        self.engine = engine
+
+        if profile and engine != "reference":
+            raise error.STL_Error("Profiling is only supported by the reference engine.")
+        self.profile = profile
+
     def interpret(self, parsed_expr) -> Eval_Result:
         """start the evaluation process, and return the evaluation result"""
         # token_stream = self.lexer.lex(expr)
         # parsed_expr = self.parser.parse(token_stream)
 
-        # initialize type context, type check the AST
-        type_ctx = ctx.Type_Context.get_empty_context()
-        type_ctx.add(ast.Id_Val("global_begin_time"), types.Int())
-        type_ctx.add(ast.Id_Val("signal"), types.Signal())
+        self.type_check(parsed_expr)
 
-        parsed_expr.type_check(type_ctx)
+        if self.engine == "numpy":
+            # numpy is only required by the vectorized engine
+            from stl.parsing.vectorized import Vectorized_Evaluator
+            low_level_eval_result = Vectorized_Evaluator(self.signal, self.global_begin_time).interpret(parsed_expr)
 
-        # initialize the evaluation context, evaluate the AST
-        eval_ctx = ctx.Eval_Context.get_empty_context()
-        eval_ctx.add(ast.Id_Val("global_begin_time"), Int_Val(py_obj=self.global_begin_time))
-        eval_ctx.add(ast.Id_Val("signal"), self.signal)
+        elif self.profile:
+            profiler = Profiler(parsed_expr)
+            eval_frame = Profiling_Frame(util.py_obj_to_ll_obj(self.global_begin_time), self.signal, profiler)
 
-        low_level_eval_result = parsed_expr.eval(eval_ctx)
+            with profiler:
+                low_level_eval_result = parsed_expr.eval(eval_frame)
+
+        else:
+            # initialize the evaluation context (allocated for each evaluation), evaluate the AST
+            # note that the global begin time of a timestamped signal may be a floating-point number
+            eval_frame = ctx.Frame(util.py_obj_to_ll_obj(self.global_begin_time), self.signal)
+
+            low_level_eval_result = parsed_expr.eval(eval_frame)
 
         if self.debug:  # debug mode will print low-level result (parser-level AST representation)
             return low_level_eval_result
 
         else:  # non-debug mode will transform the result to high-level result (api)
             high_level_eval_result = Eval_Result_Transformer(low_level_eval_result).transform()
+
+            if self.profile:
+                high_level_eval_result.profile = profiler.report()
+
             return high_level_eval_result
 
+    def interpret_trace(self, parsed_expr, end_time: Optional[int] = None) -> Trace_Eval_Result:
+        """evaluate the AST for every begin time from the global begin time to the end time (inclusive)
+
+        the AST is type checked once, then evaluated by the vectorized engine for all begin times at once
+        (regardless of the engine of the interpreter). by default, the end time is the last begin time
+        for which the signal covers the time horizon of the AST.
+        """
+        self.type_check(parsed_expr)
+
+        # numpy is only required by the vectorized engine
+        from stl.parsing.vectorized import Vectorized_Evaluator
+        satisfy, robustness = Vectorized_Evaluator(self.signal, self.global_begin_time).interpret_trace(
+            parsed_expr, end_time)
+
+        return Trace_Eval_Result(self.global_begin_time, satisfy, robustness)
+
+    def interpret_batch(self, parsed_exprs: list, predicate_keys: Optional[dict] = None) -> list:
+        """evaluate many ASTs with respect to the signal, return the evaluation results in the same order
+
+        the ASTs are evaluated by the vectorized engine (regardless of the engine of the interpreter) with a
+        batch evaluator shared by all ASTs, thus each identifier is loaded from the signal and each distinct
+        atomic predicate is evaluated once for the whole batch (see batch.py). timestamped signals are
+        evaluated for each AST by the interpreter instead.
+
+        Args:
+            predicate_keys: keys of the atomic predicates of the ASTs, kept by the caller to be reused by
+                the batches of the same ASTs (see Batch_Evaluator)
+        """
+        for parsed_expr in parsed_exprs:
+            self.type_check(parsed_expr)
+
+        if self.signal.timestamps is not None:
+            return [self.interpret(parsed_expr) for parsed_expr in parsed_exprs]
+
+        # numpy is only required by the vectorized engine
+        from stl.parsing.batch import Batch_Evaluator
+        evaluator = Batch_Evaluator(self.signal, self.global_begin_time, predicate_keys)
+
+        return [Eval_Result_Transformer(evaluator.interpret(parsed_expr)).transform()
+                for parsed_expr in parsed_exprs]
+
+    @staticmethod
+    def type_check(parsed_expr):
+        """type check the AST, the result is cached on the root node, thus an AST is only type checked once"""
+        if parsed_expr.checked_type is not None:
+            return parsed_expr.checked_type
+
+        # initialize type context, type check the AST
+        type_ctx = ctx.Type_Context.get_empty_context()
+        type_ctx.add(ast.Id_Val("global_begin_time"), types.Int())
+        type_ctx.add(ast.Id_Val("signal"), types.Signal())
+
+        parsed_expr.checked_type = parsed_expr.type_check(type_ctx)
+        return parsed_expr.checked_type
+
 
 def main():
     global_begin_time = 0
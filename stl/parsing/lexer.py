@@ -8,7 +8,6 @@
 # reference:
 # https://rply.readthedocs.io/en/latest/
 
-from rply import LexerGenerator
 import stl.tool as tool
 
 
@@ -21,6 +20,8 @@ class Lexer:
 
     def __init__(self):
         """Initialize Lexical Analyzer"""
+        # rply is imported once a lexer is built (see get_lexer)
+        from rply import LexerGenerator
 
         lg = LexerGenerator()
         # lg.ignore(r"(\t|\ |\v|\r)+")  # ignore all whitespaces except newline
@@ -85,6 +86,20 @@ class Lexer:
         return self._lexer.lex(stl_expr)
 
 
+# the lexer shared by all STL objects, built on first use
+shared_lexer = None
+
+
+def get_lexer() -> Lexer:
+    """return the shared lexer, build it on first use"""
+    global shared_lexer
+
+    if shared_lexer is None:
+        shared_lexer = Lexer()
+
+    return shared_lexer
+
+
 def main():
     # create lexer
     lexer = Lexer()
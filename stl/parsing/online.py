@@ -0,0 +1,566 @@
+# Sun Oct 18 16:10:52 EDT 2026
+# online evaluation engine, evaluates the AST incrementally, one signal element at a time
+
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from typing import Any, Optional
+
+import stl.error as error
+import stl.parsing.ast as ast
+
+
+class Sliding_Window:
+    """minimum (or maximum) of the last width values pushed, amortized O(1) per push
+
+    the values that can no longer be selected (an equal or better value was pushed after them) are
+    dropped from a monotonic deque, thus the selected value is always at the front of the deque
+
+    Usage:
+        >>> window = Sliding_Window(3)
+        >>> for value in [3, 1, 4, 1, 5]:
+        ...     window.push(value)
+        >>> window.value
+        1
+    """
+
+    def __init__(self, width: int, minimum: bool = True):
+        self.width = width
+        self.minimum = minimum
+        self.values: deque = deque()  # (index, value)
+        self.count = 0
+
+    def push(self, value: Any) -> None:
+        if self.minimum:
+            while self.values and self.values[-1][1] >= value:
+                self.values.pop()
+        else:
+            while self.values and self.values[-1][1] <= value:
+                self.values.pop()
+
+        self.values.append((self.count, value))
+        self.count += 1
+
+        # drop the value leaving the window
+        if self.values[0][0] <= self.count - 1 - self.width:
+            self.values.popleft()
+
+    @property
+    def value(self) -> Any:
+        return self.values[0][1]
+
+
+class Until_Window:
+    """(lhs U[0, width - 1] rhs) over the last width (lhs, rhs) pairs pushed, amortized O(1) per push
+
+    every pair is the function x -> max(rhs, min(lhs, x)), the until over the window is the
+    composition of the functions (oldest first) applied to the bottom value. the functions are closed
+    under composition, which is associative but not invertible, thus the window is kept as a queue
+    made of two stacks: the back stack only keeps the composition of its elements, the front stack
+    keeps the composition from each of its elements to the newest one. an element is moved from the
+    back to the front stack at most once.
+
+    Usage:
+        >>> window = Until_Window(2, float("-inf"), float("inf"))
+        >>> for lhs, rhs in [(1., -2.), (2., 0.), (-1., -3.)]:
+        ...     window.push(lhs, rhs)
+        >>> window.value
+        -1.0
+    """
+
+    def __init__(self, width: int, bottom: Any, top: Any):
+        self.width = width
+        self.bottom = bottom
+        self.top = top
+
+        # function x -> max(a, min(b, x)) is stored as (a, b), (bottom, top) is the identity
+        self.front: list = list()
+        self.back: list = list()
+        self.back_a = bottom
+        self.back_b = top
+
+    def push(self, lhs: Any, rhs: Any) -> None:
+        self.back.append((rhs, lhs))
+
+        # compose the back stack with the new function
+        self.back_a = max(self.back_a, min(self.back_b, rhs))
+        self.back_b = min(self.back_b, lhs)
+
+        if len(self.front) + len(self.back) > self.width:
+            self.pop()
+
+    def pop(self) -> None:
+        """drop the oldest pair"""
+        if not self.front:
+            a, b = self.bottom, self.top
+
+            for element_a, element_b in reversed(self.back):
+                a, b = max(element_a, min(element_b, a)), min(element_b, b)
+                self.front.append((a, b))
+
+            self.back.clear()
+            self.back_a, self.back_b = self.bottom, self.top
+
+        self.front.pop()
+
+    @property
+    def value(self) -> Any:
+        if not self.front:
+            return self.back_a
+
+        a, b = self.front[-1]
+        return max(a, min(b, self.back_a))
+
+
+class Bounded_Until:
+    """(lhs U[begin, end] rhs) for consecutive begin times, given the (lhs, rhs) pairs one at a time
+
+    (lhs U[begin, end] rhs)(t) = min(G[0, begin - 1](lhs)(t), (lhs U[0, end - begin] rhs)(t + begin)),
+    the value for the begin time t is available once the pair at t + end is pushed
+    """
+
+    def __init__(self, begin: int, end: int, bottom: Any, top: Any):
+        self.begin = begin
+        self.end = end
+        self.count = 0
+
+        self.until_window = Until_Window(end - begin + 1, bottom, top)
+
+        # G[0, begin - 1](lhs)(t) is required when the pair at t + end is pushed,
+        # lhs is delayed until it leaves [t + begin, t + end]
+        self.delayed_lhs: deque = deque()
+        self.globally_window = Sliding_Window(begin) if begin > 0 else None
+
+    def push(self, lhs: Any, rhs: Any) -> Optional[Any]:
+        """push the pair at the next time, return the value for the begin time (time - end) if available"""
+        self.until_window.push(lhs, rhs)
+        self.count += 1
+
+        if self.globally_window is not None:
+            self.delayed_lhs.append(lhs)
+            if len(self.delayed_lhs) > self.end - self.begin + 1:
+                self.globally_window.push(self.delayed_lhs.popleft())
+
+        if self.count <= self.end:
+            return None
+
+        result = self.until_window.value
+        if self.globally_window is not None:
+            result = min(result, self.globally_window.value)
+
+        return result
+
+
+##########
+# values #
+##########
+
+class Online_Value(metaclass=ABCMeta):
+    """super class for the nodes evaluating to values (constants, identifiers and arithmetic expressions)"""
+
+    @abstractmethod
+    def value(self, content: dict) -> Any:
+        """evaluate the node for the content of a single signal element"""
+        pass
+
+
+class Constant_Value(Online_Value):
+    def __init__(self, constant: Any):
+        self.constant = constant
+
+    def value(self, content: dict) -> Any:
+        return self.constant
+
+
+class Identifier_Value(Online_Value):
+    def __init__(self, name: str):
+        self.name = name
+        self.keys = name.split(".")
+
+    def value(self, content: dict) -> Any:
+        try:
+            for key in self.keys:
+                content = content[key]
+        except (KeyError, TypeError):
+            raise error.Signal_Error("Identifier \"" + self.name + "\" does not exist in the signal element.")
+
+        # signal entries are converted to floating-point numbers (see Signal.lookup)
+        if isinstance(content, int) and not isinstance(content, bool):
+            return float(content)
+
+        return content
+
+
+class Arith_Value(Online_Value):
+    def __init__(self, op_type: str, lhs: Online_Value, rhs: Online_Value):
+        self.op_type = op_type
+        self.lhs = lhs
+        self.rhs = rhs
+
+    def value(self, content: dict) -> Any:
+        return arith(self.op_type, self.lhs.value(content), self.rhs.value(content))
+
+
+class Unary_Arith_Value(Online_Value):
+    def __init__(self, op_type: str, rhs: Online_Value):
+        self.op_type = op_type
+        self.rhs = rhs
+
+    def value(self, content: dict) -> Any:
+        rhs = self.rhs.value(content)
+
+        if self.op_type == "PLUS":
+            return rhs
+        elif self.op_type == "MINUS":
+            return -rhs
+        else:
+            raise error.AST_Error(
+                "Operator \"" + str(self.op_type) + "\" for Unary Arithmetic Expression is invalid.")
+
+
+###########
+# streams #
+###########
+
+class Online_Stream(metaclass=ABCMeta):
+    """super class for the nodes evaluating to (satisfaction, robustness) pairs
+
+    update consumes the next signal element and returns the pairs that became available, in the
+    order of their begin times (starting from 0). temporal operators return their pairs with a delay.
+    """
+
+    @abstractmethod
+    def update(self, content: dict) -> list:
+        pass
+
+
+class Value_Stream(Online_Stream):
+    """boolean values used as conditions have no robustness"""
+
+    def __init__(self, value: Online_Value):
+        self.value = value
+
+    def update(self, content: dict) -> list:
+        return [(self.value.value(content), None)]
+
+
+class Comparison_Stream(Online_Stream):
+    def __init__(self, op_type: str, lhs: Online_Value, rhs: Online_Value):
+        self.op_type = op_type
+        self.lhs = lhs
+        self.rhs = rhs
+
+    def update(self, content: dict) -> list:
+        return [compare(self.op_type, self.lhs.value(content), self.rhs.value(content))]
+
+
+class Chain_Comparison_Stream(Online_Stream):
+    def __init__(self, op1_type: str, op2_type: str, opd1: Online_Value, opd2: Online_Value, opd3: Online_Value):
+        self.op1_type = op1_type
+        self.op2_type = op2_type
+        self.opd1 = opd1
+        self.opd2 = opd2
+        self.opd3 = opd3
+
+    def update(self, content: dict) -> list:
+        # desugar the chain comparison expression to two binary comparison expressions
+        opd2 = self.opd2.value(content)
+        return [logic("LOGICAL_AND",
+                      compare(self.op1_type, self.opd1.value(content), opd2),
+                      compare(self.op2_type, opd2, self.opd3.value(content)))]
+
+
+class Not_Stream(Online_Stream):
+    def __init__(self, rhs: Online_Stream):
+        self.rhs = rhs
+
+    def update(self, content: dict) -> list:
+        return [negate(pair) for pair in self.rhs.update(content)]
+
+
+class Logic_Stream(Online_Stream):
+    """the operands may be delayed differently, pairs are buffered until both operands are available"""
+
+    def __init__(self, op_type: str, lhs: Online_Stream, rhs: Online_Stream):
+        self.op_type = op_type
+        self.lhs = lhs
+        self.rhs = rhs
+        self.lhs_pairs: deque = deque()
+        self.rhs_pairs: deque = deque()
+
+    def update(self, content: dict) -> list:
+        return [logic(self.op_type, lhs, rhs) for lhs, rhs in
+                align(self.lhs_pairs, self.lhs.update(content), self.rhs_pairs, self.rhs.update(content))]
+
+
+class Window_Stream(Online_Stream):
+    """G (minimum) and F (maximum) over [begin, end], the pair for the begin time t is available at t + end"""
+
+    def __init__(self, begin: int, end: int, condition: Online_Stream, minimum: bool):
+        self.end = end
+        self.condition = condition
+        self.count = 0
+        self.satisfy_window = Sliding_Window(end - begin + 1, minimum)
+        self.robustness_window = Sliding_Window(end - begin + 1, minimum)
+
+    def update(self, content: dict) -> list:
+        result = list()
+
+        for satisfy, robustness in self.condition.update(content):
+            self.satisfy_window.push(satisfy)
+            if robustness is not None:
+                self.robustness_window.push(robustness)
+
+            self.count += 1
+
+            if self.count > self.end:
+                result.append((self.satisfy_window.value,
+                               None if robustness is None else self.robustness_window.value))
+
+        return result
+
+
+class Next_Stream(Online_Stream):
+    """X[begin], the pair for the begin time t is the pair of the condition at t + begin + 1"""
+
+    def __init__(self, begin: int, condition: Online_Stream):
+        self.skip = begin + 1
+        self.condition = condition
+
+    def update(self, content: dict) -> list:
+        result = self.condition.update(content)
+
+        if self.skip > 0:
+            skipped = min(self.skip, len(result))
+            self.skip -= skipped
+            result = result[skipped:]
+
+        return result
+
+
+class Until_Stream(Online_Stream):
+    """U, R, W and M over [begin, end], the pair for the begin time t is available at t + end
+
+    R, W and M are rewritten to U:
+        lhs R rhs = !((!lhs) U (!rhs))
+        lhs W rhs = (lhs U rhs) || G[0, end](lhs)
+        lhs M rhs = rhs U (lhs && rhs)
+    """
+
+    def __init__(self, operator: str, begin: int, end: int, lhs: Online_Stream, rhs: Online_Stream):
+        self.operator = operator
+        self.lhs = lhs
+        self.rhs = rhs
+        self.lhs_pairs: deque = deque()
+        self.rhs_pairs: deque = deque()
+
+        self.satisfy_until = Bounded_Until(begin, end, False, True)
+        self.robustness_until = Bounded_Until(begin, end, float("-inf"), float("inf"))
+
+        if operator == "W":
+            self.satisfy_globally = Sliding_Window(end + 1)
+            self.robustness_globally = Sliding_Window(end + 1)
+
+    def update(self, content: dict) -> list:
+        result = list()
+
+        for lhs, rhs in align(self.lhs_pairs, self.lhs.update(content), self.rhs_pairs, self.rhs.update(content)):
+            if self.operator == "R":
+                lhs, rhs = negate(lhs), negate(rhs)
+            elif self.operator == "M":
+                lhs, rhs = rhs, logic("LOGICAL_AND", lhs, rhs)
+
+            satisfy = self.satisfy_until.push(lhs[0], rhs[0])
+            robustness = None
+            if lhs[1] is not None and rhs[1] is not None:
+                robustness = self.robustness_until.push(lhs[1], rhs[1])
+
+            if self.operator == "W":
+                self.satisfy_globally.push(lhs[0])
+                if lhs[1] is not None:
+                    self.robustness_globally.push(lhs[1])
+
+            # the pair for the begin time is not available yet
+            if self.satisfy_until.count <= self.satisfy_until.end:
+                continue
+
+            pair = (satisfy, robustness)
+
+            if self.operator == "R":
+                pair = negate(pair)
+            elif self.operator == "W":
+                pair = logic("LOGICAL_OR", pair, (self.satisfy_globally.value,
+                                                  None if robustness is None else self.robustness_globally.value))
+
+            result.append(pair)
+
+        return result
+
+
+###########
+# builder #
+###########
+
+def build_value(node) -> Online_Value:
+    """build the online node of an AST node evaluating to values"""
+    if isinstance(node, ast.Shared_Expr):
+        return build_value(node.expr)
+    elif isinstance(node, ast.Id_Val):
+        return Identifier_Value(node.name)
+    elif isinstance(node, ast.Val):
+        return Constant_Value(node.value)
+    elif isinstance(node, ast.Binary_Arith_Expr):
+        return Arith_Value(node.op_type, build_value(node.lhs), build_value(node.rhs))
+    elif isinstance(node, ast.Unary_Arith_Expr):
+        return Unary_Arith_Value(node.op_type, build_value(node.rhs))
+    else:
+        raise error.AST_Error("AST node " + type(node).__name__ + " is not supported by the online monitor.")
+
+
+def build_stream(node) -> Online_Stream:
+    """build the online node of an AST node evaluating to (satisfaction, robustness) pairs"""
+    if isinstance(node, ast.Shared_Expr):
+        return build_stream(node.expr)
+
+    elif isinstance(node, ast.Binary_Comp_Expr):
+        return Comparison_Stream(node.op_type, build_value(node.lhs), build_value(node.rhs))
+
+    elif isinstance(node, ast.Chain_Comp_Expr):
+        return Chain_Comparison_Stream(node.op1_type, node.op2_type,
+                                       build_value(node.opd1), build_value(node.opd2), build_value(node.opd3))
+
+    elif isinstance(node, ast.Binary_Logic_Expr):
+        return Logic_Stream(node.op_type, build_stream(node.lhs), build_stream(node.rhs))
+
+    elif isinstance(node, ast.Unary_Logic_Expr):
+        if node.op_type != "LOGICAL_NOT":
+            raise error.AST_Error("operator " + str(node.op_type) + " is not quantifiable!")
+        return Not_Stream(build_stream(node.rhs))
+
+    elif isinstance(node, ast.G_Expr):
+        return Window_Stream(*interval(node), build_stream(node.begin_condition), minimum=True)
+
+    elif isinstance(node, ast.F_Expr):
+        return Window_Stream(*interval(node), build_stream(node.begin_condition), minimum=False)
+
+    elif isinstance(node, ast.X_Expr):
+        return Next_Stream(eval_time(node.begin_time), build_stream(node.begin_condition))
+
+    elif isinstance(node, (ast.U_Expr, ast.R_Expr, ast.W_Expr, ast.M_Expr)):
+        operator = {ast.U_Expr: "U", ast.R_Expr: "R", ast.W_Expr: "W", ast.M_Expr: "M"}[type(node)]
+        return Until_Stream(operator, *interval(node),
+                            build_stream(node.begin_condition), build_stream(node.end_condition))
+
+    else:
+        return Value_Stream(build_value(node))
+
+
+def interval(node) -> tuple[int, int]:
+    """evaluate the time interval of an STL expression"""
+    begin_time, end_time = eval_time(node.begin_time), eval_time(node.end_time)
+
+    if begin_time < 0 or begin_time > end_time:
+        raise error.STL_Error("invalid time interval [" + str(begin_time) + ", " + str(end_time) +
+                              "] for the online monitor.")
+
+    return begin_time, end_time
+
+
+def eval_time(node) -> int:
+    # time intervals are constant expressions
+    time = build_value(node).value(dict())
+
+    if int(time) != time:
+        raise error.Type_Error("Time interval for STL expression must be of type Int. It is now " + str(time))
+
+    return int(time)
+
+
+####################
+# atomic operators #
+####################
+
+def align(lhs_pairs: deque, lhs_new_pairs: list, rhs_pairs: deque, rhs_new_pairs: list) -> list:
+    """buffer the new pairs of both operands, return the (lhs, rhs) pairs available for both"""
+    lhs_pairs.extend(lhs_new_pairs)
+    rhs_pairs.extend(rhs_new_pairs)
+
+    result = list()
+    while lhs_pairs and rhs_pairs:
+        result.append((lhs_pairs.popleft(), rhs_pairs.popleft()))
+
+    return result
+
+
+def compare(op_type: str, lhs: Any, rhs: Any) -> tuple:
+    """return the satisfaction and robustness of a binary comparison (see Binary_Comp_Expr)"""
+    if op_type == "GREATER":
+        return lhs > rhs, lhs - rhs
+    elif op_type == "GREATER_EQUAL":
+        return lhs >= rhs, lhs - rhs
+    elif op_type == "LESS":
+        return lhs < rhs, rhs - lhs
+    elif op_type == "LESS_EQUAL":
+        return lhs <= rhs, rhs - lhs
+    elif op_type == "EQUAL_EQUAL":
+        return lhs == rhs, None if isinstance(lhs, bool) or isinstance(rhs, bool) else -abs(lhs - rhs)
+    elif op_type == "NOT_EQUAL":
+        return lhs != rhs, None if isinstance(lhs, bool) or isinstance(rhs, bool) else abs(lhs - rhs)
+    else:
+        raise error.AST_Error(
+            "Operator \"" + str(op_type) + "\" for Binary Comparison Expression is invalid.")
+
+
+def logic(op_type: str, lhs: tuple, rhs: tuple) -> tuple:
+    """return the satisfaction and robustness of a binary logic expression given (satisfaction, robustness) pairs"""
+    lhs_satisfy, lhs_robustness = lhs
+    rhs_satisfy, rhs_robustness = rhs
+    quantifiable = lhs_robustness is not None and rhs_robustness is not None
+    robustness = None
+
+    if op_type == "LOGICAL_AND":
+        satisfy = lhs_satisfy and rhs_satisfy
+        if quantifiable:
+            robustness = min(lhs_robustness, rhs_robustness)
+
+    elif op_type == "LOGICAL_OR":
+        satisfy = lhs_satisfy or rhs_satisfy
+        if quantifiable:
+            robustness = max(lhs_robustness, rhs_robustness)
+
+    elif op_type == "LOGICAL_IMPLIES":
+        satisfy = (not lhs_satisfy) or rhs_satisfy
+        if quantifiable:
+            robustness = max(-lhs_robustness, rhs_robustness)
+
+    elif op_type == "LOGICAL_EQUALS":
+        satisfy = lhs_satisfy == rhs_satisfy
+        if quantifiable:
+            robustness = min(max(-lhs_robustness, rhs_robustness), max(-rhs_robustness, lhs_robustness))
+
+    else:
+        raise error.AST_Error(
+            "Operator \"" + str(op_type) + "\" for Binary Comparison Expression is invalid.")
+
+    return satisfy, robustness
+
+
+def negate(pair: tuple) -> tuple:
+    satisfy, robustness = pair
+    return not satisfy, None if robustness is None else -robustness
+
+
+def arith(op_type: str, lhs: Any, rhs: Any) -> Any:
+    if op_type == "PLUS":
+        return lhs + rhs
+    elif op_type == "MINUS":
+        return lhs - rhs
+    elif op_type == "MULTIPLY":
+        return lhs * rhs
+    elif op_type == "DIVIDE":
+        # note that integer division will return integer (see Int_Val)
+        if isinstance(lhs, int) and isinstance(rhs, int):
+            return lhs // rhs
+        return lhs / rhs
+    else:
+        raise error.AST_Error(
+            "Operator \"" + str(op_type) + "\" for Binary Arithmetic Expression is invalid.")
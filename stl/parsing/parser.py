@@ -1,4 +1,3 @@
-from rply import ParserGenerator
 from stl.parsing.lexer import Lexer
 import stl.parsing.ast as AST
 import stl.tool as tool
@@ -15,9 +14,19 @@ class Parser:
 
     Attributes:
         self._parser: the parser that is built
+
+    Note:
+        the LR tables generated by rply are cached on disk (in the user cache directory of rply), keyed by
+        the hash of the grammar, thus they are only generated again when the grammar changes
     """
 
+    # identifier of the LR tables cached by rply
+    cache_id = "stl-api"
+
     def __init__(self):
+        # rply is imported once a parser is built (see get_parser)
+        from rply import ParserGenerator
+
         # define the reserved words for the parser
         # list of all token names accepted by the parser.
         pg = ParserGenerator([
@@ -87,7 +96,10 @@ class Parser:
                 ('left', ['LOGICAL_IMPLIES']),
                 ('left', ['LOGICAL_EQUALS']),
                 ('right', ['EQUAL']),
-            ])
+            ],
+
+            # the LR tables are only generated when they are not cached on disk yet
+            cache_id=Parser.cache_id)
 
         # section to define the parser
 
@@ -123,7 +135,7 @@ class Parser:
         @pg.production("comp_op : LESS_EQUAL")
         @pg.production("comp_op : EQUAL_EQUAL")
         @pg.production("comp_op : EQUAL")  # "=" equivalent to "==" for comparison
-        @pg.production("comp_op : NOT_EQUAL expr")
+        @pg.production("comp_op : NOT_EQUAL")
         def binary_comp_op(s):
             """binary comparison operators"""
             return s[0]
@@ -254,6 +266,20 @@ class Parser:
         return self._parser.parse(token_stream)
 
 
+# the parser shared by all STL objects, built on first use
+shared_parser = None
+
+
+def get_parser() -> Parser:
+    """return the shared parser, build it on first use"""
+    global shared_parser
+
+    if shared_parser is None:
+        shared_parser = Parser()
+
+    return shared_parser
+
+
 def main():
     lexer = Lexer()
     parser = Parser()
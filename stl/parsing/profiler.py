@@ -0,0 +1,247 @@
+# Mon Oct 19 00:31:05 EDT 2026
+# per AST node profiling of the evaluation of STL expressions
+
+import threading
+import time
+from typing import Optional
+
+from stl.parsing.ast_collection.core import Val
+from stl.parsing.context import Frame
+from stl.tool import String_Builder
+
+
+class Node_Profile:
+    """evaluation statistics of a single AST node
+
+    Attributes:
+        node: the AST node
+        depth: depth of the node in the AST (0 for the root)
+        calls: number of evaluations of the node
+        time: wall time of the evaluations in seconds, including the evaluations of the child nodes
+        self_time: wall time of the evaluations in seconds, excluding the evaluations of the child nodes
+        elements_read: number of signal elements read by the node (identifiers)
+        vals_allocated: number of Val objects allocated by the node (excluding the child nodes)
+    """
+
+    def __init__(self, node, depth: int):
+        self.node = node
+        self.depth = depth
+        self.calls = 0
+        self.time = 0.0
+        self.self_time = 0.0
+        self.elements_read = 0
+        self.vals_allocated = 0
+
+    @property
+    def name(self) -> str:
+        """class name of the node, followed by its identifier name, value or operator (if any)"""
+        node = self.node
+        label = getattr(node, "name", None)
+
+        if label is None and isinstance(node, Val):
+            label = node.value
+        if label is None:
+            label = getattr(node, "operator", None) or getattr(node, "op", None)
+
+        return type(node).__name__ + ("" if label is None else " (" + str(label) + ")")
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "depth": self.depth, "calls": self.calls, "time": self.time,
+                "self_time": self.self_time, "elements_read": self.elements_read,
+                "vals_allocated": self.vals_allocated}
+
+
+class Profile_Report:
+    """evaluation statistics of every node of an AST, in the pre-order of the AST
+
+    Usage:
+        >>> result = STL("G[0, 1](x > 0)").eval(0, signal, profile=True)
+        >>> print(result.profile)
+        node                      calls    time (ms)    self (ms)   elements       vals
+        G_Expr (G)                    1        0.062        0.015          0          0
+          Val (0)                     1        0.001        0.001          0          0
+          ...
+        >>> result.profile.by_type()["Id_Val"]["elements_read"]
+        2
+    """
+
+    def __init__(self, profiles: list):
+        self.profiles: list[Node_Profile] = profiles
+
+    @property
+    def time(self) -> float:
+        """wall time of the evaluation of the AST in seconds"""
+        return sum(profile.time for profile in self.profiles if profile.depth == 0)
+
+    def by_type(self) -> dict:
+        """aggregate the statistics by the class of the nodes
+
+        Returns:
+            {"G_Expr": {"calls": ..., "time": ..., "self_time": ..., "elements_read": ..., "vals_allocated": ...}, ...}
+        """
+        result = dict()
+
+        for profile in self.profiles:
+            type_result = result.setdefault(type(profile.node).__name__, {
+                "calls": 0, "time": 0.0, "self_time": 0.0, "elements_read": 0, "vals_allocated": 0})
+
+            type_result["calls"] += profile.calls
+            type_result["time"] += profile.time
+            type_result["self_time"] += profile.self_time
+            type_result["elements_read"] += profile.elements_read
+            type_result["vals_allocated"] += profile.vals_allocated
+
+        return result
+
+    def to_list(self) -> list:
+        """return the statistics of the nodes as a list of dictionaries (e.g. to be dumped to JSON)"""
+        return [profile.to_dict() for profile in self.profiles]
+
+    def __str__(self):
+        sb = String_Builder()
+        sb.append("{:<28} {:>7} {:>12} {:>12} {:>10} {:>10}".format(
+            "node", "calls", "time (ms)", "self (ms)", "elements", "vals"))
+
+        for profile in self.profiles:
+            sb.append("\n")
+            sb.append("{:<28} {:>7} {:>12.3f} {:>12.3f} {:>10} {:>10}".format(
+                "  " * profile.depth + profile.name, profile.calls, 1000 * profile.time,
+                1000 * profile.self_time, profile.elements_read, profile.vals_allocated))
+
+        return str(sb)
+
+
+class Profiler:
+    """record the evaluation statistics of the nodes of an AST
+
+    the reference interpreter evaluates the child nodes by calling their eval method directly, thus the
+    eval methods of the node classes of the AST (and Val.__init__) are wrapped while profiling. note that
+    only one evaluation is profiled at a time (see lock), evaluations by other threads are not recorded.
+    nodes that are not part of the AST (e.g. created during the evaluation) are attributed to the node
+    evaluating them.
+
+    Usage:
+        >>> profiler = Profiler(parsed_expr)
+        >>> with profiler:
+        ...     parsed_expr.eval(Profiling_Frame(global_begin_time, signal, profiler))
+        >>> print(profiler.report())
+    """
+
+    lock = threading.Lock()
+
+    def __init__(self, parsed_expr):
+        self.profiles: dict[int, Node_Profile] = dict()   # {id(node): Node_Profile, ...}
+        self.order: list[Node_Profile] = list()
+        self.stack: list[Node_Profile] = list()            # profiles of the nodes being evaluated
+        self.child_time: list[float] = list()               # time of the child nodes, for each entry of stack
+        self.thread_id: Optional[int] = None
+        self.patched: list = list()                         # [(cls, attribute name, original), ...]
+
+        self.add(parsed_expr, 0)
+
+    def add(self, node, depth: int) -> None:
+        """add the nodes of the AST in pre-order, the shared subexpressions (see Shared_Expr) once"""
+        if id(node) in self.profiles:
+            return
+
+        profile = Node_Profile(node, depth)
+        self.profiles[id(node)] = profile
+        self.order.append(profile)
+
+        for child in node.children():
+            self.add(child, depth + 1)
+
+    def report(self) -> Profile_Report:
+        return Profile_Report(self.order)
+
+    def read(self, element_count: int) -> None:
+        """record the signal elements read by the node being evaluated"""
+        if self.stack:
+            self.stack[-1].elements_read += element_count
+
+    ###################
+    # instrumentation #
+    ###################
+
+    def __enter__(self) -> "Profiler":
+        Profiler.lock.acquire()
+        self.thread_id = threading.get_ident()
+
+        for cls in {type(profile.node) for profile in self.order}:
+            self.patch(cls, "eval", self.wrap_eval(cls.eval))
+
+        self.patch(Val, "__init__", self.wrap_init(Val.__init__))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # restore in reverse order, the class attributes that were inherited are removed
+        for cls, attribute_name, original in reversed(self.patched):
+            if original is None:
+                delattr(cls, attribute_name)
+            else:
+                setattr(cls, attribute_name, original)
+
+        self.patched.clear()
+        self.thread_id = None
+        Profiler.lock.release()
+
+    def patch(self, cls, attribute_name: str, wrapper) -> None:
+        self.patched.append((cls, attribute_name, cls.__dict__.get(attribute_name)))
+        setattr(cls, attribute_name, wrapper)
+
+    def wrap_eval(self, eval_method):
+        profiler = self
+
+        def eval(node, eval_context, *args, **kwargs):
+            profile = profiler.profiles.get(id(node))
+
+            # nodes out of the AST, other threads, and super().eval of a node being evaluated
+            if profile is None or profile.node is not node or threading.get_ident() != profiler.thread_id or \
+                    (profiler.stack and profiler.stack[-1] is profile):
+                return eval_method(node, eval_context, *args, **kwargs)
+
+            profiler.stack.append(profile)
+            profiler.child_time.append(0.0)
+            begin_time = time.perf_counter()
+
+            try:
+                return eval_method(node, eval_context, *args, **kwargs)
+            finally:
+                elapsed_time = time.perf_counter() - begin_time
+                profiler.stack.pop()
+                child_time = profiler.child_time.pop()
+
+                profile.calls += 1
+                profile.time += elapsed_time
+                profile.self_time += elapsed_time - child_time
+
+                if profiler.child_time:
+                    profiler.child_time[-1] += elapsed_time
+
+        return eval
+
+    def wrap_init(self, init_method):
+        profiler = self
+
+        def __init__(val, *args, **kwargs):
+            if profiler.stack and threading.get_ident() == profiler.thread_id:
+                profiler.stack[-1].vals_allocated += 1
+
+            init_method(val, *args, **kwargs)
+
+        return __init__
+
+
+class Profiling_Frame(Frame):
+    """evaluation context of the reference interpreter that records the signal elements read"""
+
+    __slots__ = ("profiler",)
+
+    def __init__(self, global_begin_time, signal, profiler: Profiler):
+        super().__init__(global_begin_time, signal)
+        self.profiler = profiler
+
+    def lookup_signal(self, id_expr, begin_time=None, end_time=None):
+        result = super().lookup_signal(id_expr, begin_time, end_time)
+        self.profiler.read(len(result))
+        return result
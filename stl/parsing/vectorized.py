@@ -0,0 +1,495 @@
+# Sun Oct 18 11:02:15 EDT 2026
+# vectorized evaluation engine, evaluates the AST over whole windows of the signal as NumPy arrays
+
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+import stl.error as error
+import stl.obj.util as util
+import stl.parsing.ast as ast
+import stl.parsing.window as window
+from stl.obj.result import STL_Expr_Eval_Result
+
+
+class Vectorized_Evaluator:
+    """evaluate the AST over whole windows of the signal as NumPy arrays
+
+    The reference interpreter (Node.eval) constructs new AST nodes and Val objects for every signal
+    element. The vectorized evaluator visits each AST node once per window instead:
+
+        identifiers              -> array of the signal entries within the window
+        constants                -> Python scalar (broadcast by NumPy)
+        arithmetic expressions   -> array of values
+        comparison/logic/STL     -> (satisfaction, robustness) pair of boolean and float arrays
+
+    An STL expression evaluated for the (inclusive) range of begin times [begin_index, end_index]
+    evaluates its condition once over the shifted range covering all of its windows, then aggregates
+    each window. Expressions without STL operators are evaluated like the reference interpreter
+    evaluates them outside of STL expressions (comparisons over the whole signal are reduced with
+    logical and).
+
+    Usage:
+        >>> evaluator = Vectorized_Evaluator(signal, global_begin_time=0)
+        >>> evaluator.interpret(parsed_expr)
+        satisfy     : False
+        robustness  : -1.0
+    """
+
+    def __init__(self, signal, global_begin_time: int):
+        self.signal = signal
+        self.global_begin_time = global_begin_time
+        self.shared_results: dict = dict()  # {(id(Shared_Expr), begin_index, end_index): result}
+
+    def check_signal(self) -> None:
+        # the windows of timestamped signals vary in length, which the sliding windows do not support
+        if self.signal.timestamps is not None:
+            raise error.STL_Error("Timestamped signals are only evaluated by the reference engine.")
+
+    def interpret(self, parsed_expr) -> Union[ast.Val, list, STL_Expr_Eval_Result]:
+        """evaluate the AST, return the low-level evaluation result of the reference interpreter"""
+        self.check_signal()
+
+        if Vectorized_Evaluator.has_stl_expr(parsed_expr):
+            satisfy, robustness = Vectorized_Evaluator.as_pair(
+                self.eval(parsed_expr, self.global_begin_time, self.global_begin_time))
+
+            return STL_Expr_Eval_Result(
+                satisfy=bool(np.asarray(satisfy).flat[0]),
+                robustness=None if robustness is None else float(np.asarray(robustness).flat[0]))
+
+        result = self.eval_plain(parsed_expr)
+
+        if isinstance(result, np.ndarray):
+            return [util.py_obj_to_ll_obj(value, int_to_float=True) for value in result.tolist()]
+        elif isinstance(result, np.generic):
+            result = result.item()
+
+        return util.py_obj_to_ll_obj(result)
+
+    def interpret_trace(self, parsed_expr, end_index: Optional[int] = None) -> tuple:
+        """evaluate the AST for every begin time within [global_begin_time, end_index]
+
+        by default, end_index is the last begin time for which the signal covers the horizon of the
+        expression. return a pair of satisfaction (boolean) and robustness (float or None) arrays
+        """
+        self.check_signal()
+
+        if end_index is None:
+            end_index = len(self.signal) - 1 - self.horizon(parsed_expr)
+
+        if self.global_begin_time > end_index:
+            raise error.Signal_Error("the signal (length = " + str(len(self.signal)) + ") is too short to evaluate " +
+                                     "the expression from begin time " + str(self.global_begin_time) +
+                                     " to end time " + str(end_index))
+
+        satisfy, robustness = Vectorized_Evaluator.as_pair(self.eval(parsed_expr, self.global_begin_time, end_index))
+        length = end_index - self.global_begin_time + 1
+
+        if np.asarray(satisfy).dtype.kind != "b":
+            raise error.STL_Error("only expressions of type Boolean can be evaluated for every begin time.")
+
+        # expressions without identifiers evaluate to scalars
+        satisfy = np.array(np.broadcast_to(satisfy, (length,)))
+        if robustness is not None:
+            robustness = np.array(np.broadcast_to(robustness, (length,)), dtype=np.float64)
+
+        return satisfy, robustness
+
+    def horizon(self, node) -> int:
+        """return the number of signal elements after a begin time required to evaluate the node"""
+        if isinstance(node, ast.X_Expr):
+            # offset by 1 for Next operator
+            return self.eval_time(node.begin_time) + 1 + self.horizon(node.begin_condition)
+
+        elif isinstance(node, ast.STL_Expr):
+            return self.eval_time(node.end_time) + max(self.horizon(condition) for condition in
+                                                       (node.begin_condition, node.end_condition)
+                                                       if condition is not None)
+
+        else:
+            return max((self.horizon(child) for child in node.children()), default=0)
+
+    ######################################
+    # evaluation embedded in STL windows #
+    ######################################
+
+    def eval(self, node, begin_index: int, end_index: int) -> Any:
+        """evaluate the node for all the time indices within [begin_index, end_index]"""
+        return Vectorized_Evaluator.select(Vectorized_Evaluator.eval_methods, node)(self, node, begin_index, end_index)
+
+    def eval_val(self, node, begin_index: int, end_index: int) -> Any:
+        return node.value
+
+    def eval_shared_expr(self, node, begin_index: int, end_index: int) -> Any:
+        # the shared subexpressions are evaluated once per range of time indices
+        key = (id(node), begin_index, end_index)
+
+        if key not in self.shared_results:
+            self.shared_results[key] = self.eval(node.expr, begin_index, end_index)
+
+        return self.shared_results[key]
+
+    def eval_id_val(self, node, begin_index: int, end_index: int) -> np.ndarray:
+        return self.signal.column(node.name, begin_index, end_index)
+
+    def eval_binary_comp_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        lhs = Vectorized_Evaluator.as_value(self.eval(node.lhs, begin_index, end_index))
+        rhs = Vectorized_Evaluator.as_value(self.eval(node.rhs, begin_index, end_index))
+        return Vectorized_Evaluator.compare(node.op_type, lhs, rhs)
+
+    def eval_chain_comp_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        # desugar the chain comparison expression to two binary comparison expressions
+        opd2 = Vectorized_Evaluator.as_value(self.eval(node.opd2, begin_index, end_index))
+
+        satisfy_1, robustness_1 = Vectorized_Evaluator.compare(
+            node.op1_type, Vectorized_Evaluator.as_value(self.eval(node.opd1, begin_index, end_index)), opd2)
+        satisfy_2, robustness_2 = Vectorized_Evaluator.compare(
+            node.op2_type, opd2, Vectorized_Evaluator.as_value(self.eval(node.opd3, begin_index, end_index)))
+
+        return Vectorized_Evaluator.logic("LOGICAL_AND", (satisfy_1, robustness_1), (satisfy_2, robustness_2))
+
+    def eval_binary_logic_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        lhs = Vectorized_Evaluator.as_pair(self.eval(node.lhs, begin_index, end_index))
+        rhs = Vectorized_Evaluator.as_pair(self.eval(node.rhs, begin_index, end_index))
+        return Vectorized_Evaluator.logic(node.op_type, lhs, rhs)
+
+    def eval_unary_logic_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        satisfy, robustness = Vectorized_Evaluator.as_pair(self.eval(node.rhs, begin_index, end_index))
+
+        if node.op_type != "LOGICAL_NOT":
+            raise error.AST_Error("operator " + str(node.op_type) + " is not quantifiable!")
+
+        return np.logical_not(satisfy), None if robustness is None else np.negative(robustness)
+
+    def eval_binary_arith_expr(self, node, begin_index: int, end_index: int) -> Any:
+        lhs = Vectorized_Evaluator.as_value(self.eval(node.lhs, begin_index, end_index))
+        rhs = Vectorized_Evaluator.as_value(self.eval(node.rhs, begin_index, end_index))
+        return Vectorized_Evaluator.arith(node.op_type, lhs, rhs)
+
+    def eval_unary_arith_expr(self, node, begin_index: int, end_index: int) -> Any:
+        rhs = Vectorized_Evaluator.as_value(self.eval(node.rhs, begin_index, end_index))
+        return Vectorized_Evaluator.unary_arith(node.op_type, rhs)
+
+    def eval_g_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        begin_time, end_time = self.interval(node)
+        satisfy, robustness = self.eval_window_condition(
+            node.begin_condition, begin_index + begin_time, end_index + end_time)
+        width = end_time - begin_time + 1
+
+        # G is satisfied when all the windows are satisfied (minimum of boolean values)
+        return window.sliding_min(satisfy, width), \
+            None if robustness is None else window.sliding_min(robustness, width)
+
+    def eval_f_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        begin_time, end_time = self.interval(node)
+        satisfy, robustness = self.eval_window_condition(
+            node.begin_condition, begin_index + begin_time, end_index + end_time)
+        width = end_time - begin_time + 1
+
+        # F is satisfied when any of the windows is satisfied (maximum of boolean values)
+        return window.sliding_max(satisfy, width), \
+            None if robustness is None else window.sliding_max(robustness, width)
+
+    def eval_x_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        begin_time = self.eval_time(node.begin_time)
+
+        # offset by 1 for Next operator
+        return self.eval_window_condition(node.begin_condition, begin_index + begin_time + 1, end_index + begin_time + 1)
+
+    def eval_u_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        begin_time, end_time = self.interval(node)
+        lhs, rhs = self.eval_binary_window_conditions(node, begin_index, end_index + end_time)
+        return Vectorized_Evaluator.until(lhs, rhs, begin_time, end_time)
+
+    def eval_r_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        # lhs R rhs = !((!lhs) U (!rhs))
+        begin_time, end_time = self.interval(node)
+        lhs, rhs = self.eval_binary_window_conditions(node, begin_index, end_index + end_time)
+        return Vectorized_Evaluator.negate(Vectorized_Evaluator.until(
+            Vectorized_Evaluator.negate(lhs), Vectorized_Evaluator.negate(rhs), begin_time, end_time))
+
+    def eval_w_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        # lhs W rhs = (lhs U rhs) || G[0, end_time](lhs)
+        begin_time, end_time = self.interval(node)
+        lhs, rhs = self.eval_binary_window_conditions(node, begin_index, end_index + end_time)
+        lhs_satisfy, lhs_robustness = lhs
+
+        globally = window.sliding_min(lhs_satisfy, end_time + 1), \
+            None if lhs_robustness is None else window.sliding_min(lhs_robustness, end_time + 1)
+
+        return Vectorized_Evaluator.logic(
+            "LOGICAL_OR", Vectorized_Evaluator.until(lhs, rhs, begin_time, end_time), globally)
+
+    def eval_m_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        # lhs M rhs = rhs U (lhs && rhs)
+        begin_time, end_time = self.interval(node)
+        lhs, rhs = self.eval_binary_window_conditions(node, begin_index, end_index + end_time)
+        return Vectorized_Evaluator.until(rhs, Vectorized_Evaluator.logic("LOGICAL_AND", lhs, rhs),
+                                          begin_time, end_time)
+
+    def eval_binary_stl_expr(self, node, begin_index: int, end_index: int) -> tuple:
+        raise error.AST_Error("STL operator " + str(node.operator) + " is not supported by the vectorized interpreter.")
+
+    def eval_binary_window_conditions(self, node, begin_index: int, end_index: int) -> tuple:
+        """evaluate both conditions of a binary STL expression for all the time indices within the windows"""
+        return self.eval_window_condition(node.begin_condition, begin_index, end_index), \
+            self.eval_window_condition(node.end_condition, begin_index, end_index)
+
+    def eval_window_condition(self, condition, begin_index: int, end_index: int) -> tuple:
+        """evaluate the condition of an STL expression for all the time indices within the windows"""
+        if begin_index > end_index:
+            raise error.Signal_Error("begin_range of signal must be smaller than end_range of signal! " +
+                                     "begin_range = " + str(begin_index) + "end_range = " + str(end_index))
+
+        satisfy, robustness = Vectorized_Evaluator.as_pair(self.eval(condition, begin_index, end_index))
+        length = end_index - begin_index + 1
+
+        # conditions without identifiers evaluate to scalars
+        satisfy = np.broadcast_to(satisfy, (length,))
+        if robustness is not None:
+            robustness = np.broadcast_to(robustness, (length,))
+
+        return satisfy, robustness
+
+    def interval(self, node) -> tuple[int, int]:
+        """evaluate the time interval of an STL expression"""
+        return self.eval_time(node.begin_time), self.eval_time(node.end_time)
+
+    def eval_time(self, node) -> int:
+        time = self.eval_plain(node)
+
+        if int(time) != time:
+            raise error.Type_Error("Time interval for STL expression must be of type Int. It is now " + str(time))
+
+        return int(time)
+
+    #########################################
+    # evaluation outside of STL expressions #
+    #########################################
+
+    def eval_plain(self, node) -> Any:
+        """evaluate the node outside of STL expressions, identifiers span the entire signal"""
+        return Vectorized_Evaluator.select(Vectorized_Evaluator.eval_plain_methods, node)(self, node)
+
+    def eval_plain_val(self, node) -> Any:
+        return node.value
+
+    def eval_plain_shared_expr(self, node) -> Any:
+        key = (id(node), None, None)
+
+        if key not in self.shared_results:
+            self.shared_results[key] = self.eval_plain(node.expr)
+
+        return self.shared_results[key]
+
+    def eval_plain_id_val(self, node) -> np.ndarray:
+        return self.signal.column(node.name)
+
+    def eval_plain_binary_comp_expr(self, node) -> bool:
+        satisfy, _ = Vectorized_Evaluator.compare(node.op_type, self.eval_plain(node.lhs), self.eval_plain(node.rhs))
+        return bool(np.all(satisfy))
+
+    def eval_plain_chain_comp_expr(self, node) -> bool:
+        opd2 = self.eval_plain(node.opd2)
+        satisfy_1, _ = Vectorized_Evaluator.compare(node.op1_type, self.eval_plain(node.opd1), opd2)
+        satisfy_2, _ = Vectorized_Evaluator.compare(node.op2_type, opd2, self.eval_plain(node.opd3))
+        return bool(np.all(satisfy_1)) and bool(np.all(satisfy_2))
+
+    def eval_plain_binary_logic_expr(self, node) -> bool:
+        satisfy, _ = Vectorized_Evaluator.logic(
+            node.op_type, (self.eval_plain(node.lhs), None), (self.eval_plain(node.rhs), None))
+        return bool(np.all(satisfy))
+
+    def eval_plain_unary_logic_expr(self, node) -> bool:
+        if node.op_type != "LOGICAL_NOT":
+            raise error.AST_Error("operator " + str(node.op_type) + " is not quantifiable!")
+
+        return bool(np.all(np.logical_not(self.eval_plain(node.rhs))))
+
+    def eval_plain_binary_arith_expr(self, node) -> Any:
+        return Vectorized_Evaluator.arith(node.op_type, self.eval_plain(node.lhs), self.eval_plain(node.rhs))
+
+    def eval_plain_unary_arith_expr(self, node) -> Any:
+        return Vectorized_Evaluator.unary_arith(node.op_type, self.eval_plain(node.rhs))
+
+    ####################
+    # atomic operators #
+    ####################
+
+    @staticmethod
+    def compare(op_type: str, lhs: Any, rhs: Any) -> tuple:
+        """return the satisfaction and robustness of a binary comparison"""
+        if op_type == "GREATER":
+            return np.greater(lhs, rhs), np.subtract(lhs, rhs)
+        elif op_type == "GREATER_EQUAL":
+            return np.greater_equal(lhs, rhs), np.subtract(lhs, rhs)
+        elif op_type == "LESS":
+            return np.less(lhs, rhs), np.subtract(rhs, lhs)
+        elif op_type == "LESS_EQUAL":
+            return np.less_equal(lhs, rhs), np.subtract(rhs, lhs)
+        elif op_type == "EQUAL_EQUAL":
+            robustness = None if Vectorized_Evaluator.is_boolean(lhs, rhs) else -np.abs(np.subtract(lhs, rhs))
+            return np.equal(lhs, rhs), robustness
+        elif op_type == "NOT_EQUAL":
+            robustness = None if Vectorized_Evaluator.is_boolean(lhs, rhs) else np.abs(np.subtract(lhs, rhs))
+            return np.not_equal(lhs, rhs), robustness
+        else:
+            raise error.AST_Error(
+                "Operator \"" + str(op_type) + "\" for Binary Comparison Expression is invalid.")
+
+    @staticmethod
+    def logic(op_type: str, lhs: tuple, rhs: tuple) -> tuple:
+        """return the satisfaction and robustness of a binary logic expression given (satisfaction, robustness) pairs"""
+        lhs_satisfy, lhs_robustness = lhs
+        rhs_satisfy, rhs_robustness = rhs
+        quantifiable = lhs_robustness is not None and rhs_robustness is not None
+        robustness = None
+
+        if op_type == "LOGICAL_AND":
+            satisfy = np.logical_and(lhs_satisfy, rhs_satisfy)
+            if quantifiable:
+                robustness = np.minimum(lhs_robustness, rhs_robustness)
+
+        elif op_type == "LOGICAL_OR":
+            satisfy = np.logical_or(lhs_satisfy, rhs_satisfy)
+            if quantifiable:
+                robustness = np.maximum(lhs_robustness, rhs_robustness)
+
+        elif op_type == "LOGICAL_IMPLIES":
+            satisfy = np.logical_or(np.logical_not(lhs_satisfy), rhs_satisfy)
+            if quantifiable:
+                robustness = np.maximum(np.negative(lhs_robustness), rhs_robustness)
+
+        elif op_type == "LOGICAL_EQUALS":
+            satisfy = np.equal(lhs_satisfy, rhs_satisfy)
+            if quantifiable:
+                robustness = np.minimum(np.maximum(np.negative(lhs_robustness), rhs_robustness),
+                                        np.maximum(np.negative(rhs_robustness), lhs_robustness))
+
+        else:
+            raise error.AST_Error(
+                "Operator \"" + str(op_type) + "\" for Binary Comparison Expression is invalid.")
+
+        return satisfy, robustness
+
+    @staticmethod
+    def arith(op_type: str, lhs: Any, rhs: Any) -> Any:
+        if op_type == "PLUS":
+            return np.add(lhs, rhs)
+        elif op_type == "MINUS":
+            return np.subtract(lhs, rhs)
+        elif op_type == "MULTIPLY":
+            return np.multiply(lhs, rhs)
+        elif op_type == "DIVIDE":
+            # note that integer division will return integer (see Int_Val)
+            if isinstance(lhs, int) and isinstance(rhs, int):
+                return np.floor_divide(lhs, rhs)
+            return np.true_divide(lhs, rhs)
+        else:
+            raise error.AST_Error(
+                "Operator \"" + str(op_type) + "\" for Binary Comparison Expression is invalid.")
+
+    @staticmethod
+    def unary_arith(op_type: str, rhs: Any) -> Any:
+        if op_type == "PLUS":
+            return rhs
+        elif op_type == "MINUS":
+            return np.negative(rhs)
+        else:
+            raise error.AST_Error(
+                "Operator \"" + str(op_type) + "\" for Binary Comparison Expression is invalid.")
+
+    @staticmethod
+    def until(lhs: tuple, rhs: tuple, begin_time: int, end_time: int) -> tuple:
+        """return the satisfaction and robustness of lhs U[begin_time, end_time] rhs for every window"""
+        lhs_satisfy, lhs_robustness = lhs
+        rhs_satisfy, rhs_robustness = rhs
+        robustness = None
+
+        if lhs_robustness is not None and rhs_robustness is not None:
+            robustness = window.bounded_until(lhs_robustness, rhs_robustness, begin_time, end_time)
+
+        return window.bounded_until(lhs_satisfy, rhs_satisfy, begin_time, end_time), robustness
+
+    @staticmethod
+    def negate(pair: tuple) -> tuple:
+        satisfy, robustness = pair
+        return np.logical_not(satisfy), None if robustness is None else np.negative(robustness)
+
+    ###########
+    # helpers #
+    ###########
+
+    @staticmethod
+    def as_pair(result: Any) -> tuple:
+        """convert the result of a node to a (satisfaction, robustness) pair"""
+        if isinstance(result, tuple):
+            return result
+        else:
+            # boolean values and identifiers have no robustness
+            return result, None
+
+    @staticmethod
+    def as_value(result: Any) -> Any:
+        """convert the result of a node to values, (satisfaction, robustness) pairs yield the satisfaction"""
+        if isinstance(result, tuple):
+            return result[0]
+        else:
+            return result
+
+    @staticmethod
+    def is_boolean(*values: Any) -> bool:
+        return any(isinstance(value, (bool, np.bool_)) or
+                   (isinstance(value, np.ndarray) and value.dtype.kind == "b") for value in values)
+
+    @staticmethod
+    def has_stl_expr(node) -> bool:
+        """check whether the AST contains an STL expression"""
+        return isinstance(node, ast.STL_Expr) or any(Vectorized_Evaluator.has_stl_expr(child)
+                                                     for child in node.children())
+
+    @staticmethod
+    def select(methods: dict, node) -> Callable:
+        """select the evaluation method registered for the class of the node (or its closest super class)"""
+        for node_class in type(node).__mro__:
+            if node_class in methods:
+                return methods[node_class]
+
+        raise error.AST_Error("AST node " + type(node).__name__ + " is not supported by the vectorized interpreter.")
+
+    eval_methods: dict = dict()
+    eval_plain_methods: dict = dict()
+
+
+Vectorized_Evaluator.eval_methods = {
+    ast.Id_Val: Vectorized_Evaluator.eval_id_val,
+    ast.Val: Vectorized_Evaluator.eval_val,
+    ast.Binary_Comp_Expr: Vectorized_Evaluator.eval_binary_comp_expr,
+    ast.Chain_Comp_Expr: Vectorized_Evaluator.eval_chain_comp_expr,
+    ast.Binary_Logic_Expr: Vectorized_Evaluator.eval_binary_logic_expr,
+    ast.Unary_Logic_Expr: Vectorized_Evaluator.eval_unary_logic_expr,
+    ast.Binary_Arith_Expr: Vectorized_Evaluator.eval_binary_arith_expr,
+    ast.Unary_Arith_Expr: Vectorized_Evaluator.eval_unary_arith_expr,
+    ast.G_Expr: Vectorized_Evaluator.eval_g_expr,
+    ast.F_Expr: Vectorized_Evaluator.eval_f_expr,
+    ast.X_Expr: Vectorized_Evaluator.eval_x_expr,
+    ast.U_Expr: Vectorized_Evaluator.eval_u_expr,
+    ast.R_Expr: Vectorized_Evaluator.eval_r_expr,
+    ast.W_Expr: Vectorized_Evaluator.eval_w_expr,
+    ast.M_Expr: Vectorized_Evaluator.eval_m_expr,
+    ast.Binary_STL_Expr: Vectorized_Evaluator.eval_binary_stl_expr,
+    ast.Shared_Expr: Vectorized_Evaluator.eval_shared_expr,
+}
+
+Vectorized_Evaluator.eval_plain_methods = {
+    ast.Id_Val: Vectorized_Evaluator.eval_plain_id_val,
+    ast.Val: Vectorized_Evaluator.eval_plain_val,
+    ast.Binary_Comp_Expr: Vectorized_Evaluator.eval_plain_binary_comp_expr,
+    ast.Chain_Comp_Expr: Vectorized_Evaluator.eval_plain_chain_comp_expr,
+    ast.Binary_Logic_Expr: Vectorized_Evaluator.eval_plain_binary_logic_expr,
+    ast.Unary_Logic_Expr: Vectorized_Evaluator.eval_plain_unary_logic_expr,
+    ast.Binary_Arith_Expr: Vectorized_Evaluator.eval_plain_binary_arith_expr,
+    ast.Unary_Arith_Expr: Vectorized_Evaluator.eval_plain_unary_arith_expr,
+    ast.Shared_Expr: Vectorized_Evaluator.eval_plain_shared_expr,
+}
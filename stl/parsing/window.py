@@ -0,0 +1,244 @@
+# Sun Oct 18 13:05:48 EDT 2026
+# sliding window algorithms used by the vectorized interpreter
+
+import numpy as np
+
+
+def sliding_min(values: np.ndarray, width: int) -> np.ndarray:
+    """return the minimum of every window of the given width over the values
+
+    van Herk/Gil-Werman algorithm: the values are split into blocks of the given width, every window
+    spans the suffix of one block and the prefix of the next block. Computing the prefix and suffix
+    minimums of all the blocks takes O(n) regardless of the width of the window.
+
+    Usage:
+        >>> sliding_min(np.array([3, 1, 4, 1, 5, 9, 2, 6]), 3)
+        array([1, 1, 1, 1, 2, 2])
+    """
+    return _sliding(values, width, np.minimum)
+
+
+def sliding_max(values: np.ndarray, width: int) -> np.ndarray:
+    """return the maximum of every window of the given width over the values
+
+    Usage:
+        >>> sliding_max(np.array([3, 1, 4, 1, 5, 9, 2, 6]), 3)
+        array([4, 4, 5, 9, 9, 9])
+    """
+    return _sliding(values, width, np.maximum)
+
+
+def _sliding(values: np.ndarray, width: int, ufunc: np.ufunc) -> np.ndarray:
+    values = np.asarray(values)
+    length = len(values)
+
+    if width < 1 or width > length:
+        raise ValueError("window width must be between 1 and the number of values (" + str(length) +
+                         "), it is now " + str(width))
+
+    if width == 1:
+        return values.copy()
+
+    # pad the values to a multiple of the width, the padding is never part of a window
+    block_count = -(-length // width)
+    padded = np.empty(block_count * width, dtype=values.dtype)
+    padded[:length] = values
+    padded[length:] = values[-1]
+    blocks = padded.reshape(block_count, width)
+
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    # the window starting at index i spans suffix[i] (up to the end of its block) and prefix[i + width - 1]
+    window_count = length - width + 1
+    return ufunc(suffix[:window_count], prefix[width - 1:width - 1 + window_count])
+
+
+def unbounded_until(lhs: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """return the values of (lhs U rhs) for every index, the until is bounded by the end of the values
+
+    (lhs U rhs)[i] = max over j >= i of min(rhs[j], lhs[i], ..., lhs[j - 1])
+
+    works for both satisfaction (boolean) and robustness (float) values. The recurrence
+    U[i] = max(rhs[i], min(lhs[i], U[i + 1])) composes functions of the form x -> max(a, min(b, x)),
+    which are closed under composition, thus the suffix compositions are computed by an associative
+    scan with O(log n) vectorized passes instead of a sequential loop.
+
+    Usage:
+        >>> unbounded_until(np.array([1., 2., -1., 3.]), np.array([-2., 0., -3., 1.]))
+        array([ 0.,  0., -1.,  1.])
+    """
+    # x -> max(a, min(b, x)), the value at index i is the composition of the functions i, i + 1, ...
+    a = np.array(rhs, copy=True)
+    b = np.array(lhs, copy=True)
+    length = len(a)
+
+    step = 1
+    while step < length:
+        # compose the function at index i with the composition starting at index i + step
+        a_next = a[step:]
+        b_next = b[step:]
+        a[:-step] = np.maximum(a[:-step], np.minimum(b[:-step], a_next))
+        b[:-step] = np.minimum(b[:-step], b_next)
+        step *= 2
+
+    # the composition is applied to the bottom value (false/-inf) past the end of the values
+    return a
+
+
+def bounded_until(lhs: np.ndarray, rhs: np.ndarray, begin: int, end: int) -> np.ndarray:
+    """return the values of (lhs U[begin, end] rhs) for every index i such that i + end is within the values
+
+    (lhs U[begin, end] rhs)[i] = max over j in [i + begin, i + end] of min(rhs[j], lhs[i], ..., lhs[j - 1])
+
+    the bounded until is decomposed into
+        G[0, begin - 1] lhs  and  F[begin, end] rhs  and  (lhs U rhs) shifted by begin
+    an rhs found after i + end (counted by the unbounded until) only matters when lhs holds up to it,
+    it is then dominated by the rhs found within [i + begin, i + end]. The cost is O(n log n) regardless
+    of the time interval.
+
+    Usage:
+        >>> bounded_until(np.array([True, True, False, True]), np.array([False, False, True, False]), 0, 2)
+        array([ True,  True])
+    """
+    length = len(lhs) - end
+
+    if length < 1 or begin < 0 or begin > end:
+        raise ValueError("invalid interval [" + str(begin) + ", " + str(end) + "] for " + str(len(lhs)) + " values")
+
+    result = np.minimum(sliding_max(rhs[begin:], end - begin + 1)[:length],
+                        unbounded_until(lhs[begin:], rhs[begin:])[:length])
+
+    if begin > 0:
+        result = np.minimum(result, sliding_min(lhs[:length + begin - 1], begin))
+
+    return result
+
+
+class Sparse_Table:
+    """range minimum/maximum query structure over static values
+
+    level k holds the minimum (or maximum) of every window of 2^k values, built in O(n log n). any
+    window [begin, end] is covered by the two (overlapping) windows of the largest power of 2 that fits,
+    thus a query takes O(1) regardless of the width of the window.
+
+    Usage:
+        >>> table = Sparse_Table(np.array([3, 1, 4, 1, 5, 9, 2, 6]), np.minimum)
+        >>> table.query(2, 6)
+        1
+        >>> Sparse_Table(np.array([3, 1, 4, 1, 5, 9, 2, 6]), np.maximum).query(6, 7)
+        6
+    """
+
+    def __init__(self, values: np.ndarray, ufunc: np.ufunc):
+        self.ufunc = ufunc
+        self.levels = [np.asarray(values)]
+
+        width = 1
+        while 2 * width <= len(values):
+            previous_level = self.levels[-1]
+            self.levels.append(ufunc(previous_level[:len(previous_level) - width], previous_level[width:]))
+            width *= 2
+
+    def query(self, begin: int, end: int):
+        """return the minimum (or maximum) of the values within [begin, end] (inclusive)"""
+        level = (end - begin + 1).bit_length() - 1
+        values = self.levels[level]
+
+        return self.ufunc(values[begin], values[end - (1 << level) + 1]).item()
+
+    @property
+    def nbytes(self) -> int:
+        """number of bytes allocated by the levels"""
+        return sum(level.nbytes for level in self.levels)
+
+
+class Segment_Tree:
+    """range minimum/maximum query structure over values that change, backed by a binary tree in an array
+
+    the leaves hold the values, every inner node holds the minimum (or maximum) of its children. appending
+    a value and updating a value take O(log n) (amortized for appending, the tree doubles its capacity
+    when full), so does the query of any window [begin, end].
+
+    Usage:
+        >>> tree = Segment_Tree([3, 1, 4, 1, 5], min, float("inf"))
+        >>> tree.query(2, 4)
+        1
+        >>> tree.update(3, 7)
+        >>> tree.append(0)
+        >>> tree.query(2, 4), tree.query(2, 5)
+        (4, 0)
+    """
+
+    def __init__(self, values: list, function, identity):
+        self.function = function   # min or max
+        self.identity = identity   # value of an empty window, e.g. inf for min
+        self.length = len(values)
+        self.capacity = 1
+
+        while self.capacity < self.length:
+            self.capacity *= 2
+
+        self.tree: list = list()
+        self.build(values)
+
+    def build(self, values: list) -> None:
+        """build the tree of the given capacity bottom-up in O(n)"""
+        capacity = self.capacity
+        function = self.function
+
+        tree = [self.identity] * (2 * capacity)
+        tree[capacity:capacity + len(values)] = values
+
+        for node in range(capacity - 1, 0, -1):
+            tree[node] = function(tree[2 * node], tree[2 * node + 1])
+
+        self.tree = tree
+
+    def append(self, value) -> None:
+        if self.length == self.capacity:
+            # double the capacity, rebuild the inner nodes from the leaves
+            leaves = self.tree[self.capacity:self.capacity + self.length]
+            self.capacity *= 2
+            self.build(leaves)
+
+        self.length += 1
+        self.update(self.length - 1, value)
+
+    def update(self, index: int, value) -> None:
+        """replace the value at the index, update the nodes on the path to the root"""
+        tree = self.tree
+        function = self.function
+
+        node = index + self.capacity
+        tree[node] = value
+        node //= 2
+
+        while node > 0:
+            tree[node] = function(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+    def query(self, begin: int, end: int):
+        """return the minimum (or maximum) of the values within [begin, end] (inclusive)"""
+        tree = self.tree
+        function = self.function
+        result = self.identity
+
+        # walk up from both ends of the (half-open) range [begin, end + 1)
+        low = begin + self.capacity
+        high = end + 1 + self.capacity
+
+        while low < high:
+            if low & 1:
+                result = function(result, tree[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                result = function(result, tree[high])
+            low //= 2
+            high //= 2
+
+        return result
+
+    def __len__(self) -> int:
+        return self.length
@@ -2,17 +2,22 @@
 # tools.py
 # Mon 2020-11-02 13:42:26 EST
 
-from termcolor import colored
 from sys import stdout
 from io import StringIO
 from typing import Optional
 
-import logging  # for logging error messages
+# import logging  # for logging error messages (imported on demand, it is slow to import)
 from signal import signal, SIGINT  # for gracefully start a new line when ctrl-C happens
 
 
 
 # ========= PRINT TOOLS (TO STDOUT) =========
+def colored(text: str, color: str, attrs: Optional[list] = None) -> str:
+    """color the text for the terminal, termcolor is only imported when a message is printed"""
+    from termcolor import colored as termcolor_colored
+    return termcolor_colored(text, color, attrs=attrs)
+
+
 def print_error(error_msg: str, end: str = "\n") -> None:
     """print error message, this will prepend Error: to the string given in bolded red"""
     error_msg += end
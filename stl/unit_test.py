@@ -16,14 +16,82 @@ class Test_Example_Files(unittest.TestCase):
         import stl.example.api.signal.main
         tool.print_success("SIGNAL TEST PASSED")
 
+    def test_columnar_signal(self):
+        import stl.example.api.signal.columnar
+        tool.print_success("COLUMNAR SIGNAL TEST PASSED")
+
+    def test_signal_file(self):
+        import stl.example.api.signal.signal_file
+        tool.print_success("SIGNAL FILE TEST PASSED")
+
+    def test_signal_stream(self):
+        import stl.example.api.signal.stream
+        tool.print_success("SIGNAL STREAM TEST PASSED")
+
+    def test_signal_arrays(self):
+        import stl.example.api.signal.arrays
+        tool.print_success("SIGNAL ARRAYS TEST PASSED")
+
+    def test_timestamped_signal(self):
+        import stl.example.api.signal.timestamp
+        tool.print_success("TIMESTAMPED SIGNAL TEST PASSED")
+
     def test_stl(self):
         import stl.example.api.stl.main
         tool.print_success("STL TEST PASSED")
 
+    def test_engine(self):
+        import stl.example.api.stl.engine
+        tool.print_success("ENGINE TEST PASSED")
+
+    def test_trace(self):
+        import stl.example.api.stl.trace
+        tool.print_success("TRACE TEST PASSED")
+
+    def test_until(self):
+        import stl.example.api.stl.until
+        tool.print_success("UNTIL TEST PASSED")
+
+    def test_monitor(self):
+        import stl.example.api.stl.monitor
+        tool.print_success("MONITOR TEST PASSED")
+
+    def test_compile(self):
+        import stl.example.api.stl.compile
+        tool.print_success("COMPILE TEST PASSED")
+
+    def test_parse_cache(self):
+        import stl.example.api.stl.cache
+        tool.print_success("PARSE CACHE TEST PASSED")
+
+    def test_range_index(self):
+        import stl.example.api.stl.range_index
+        tool.print_success("RANGE INDEX TEST PASSED")
+
+    def test_spec_set(self):
+        import stl.example.api.stl.spec_set
+        tool.print_success("SPEC SET TEST PASSED")
+
+    def test_dag(self):
+        import stl.example.api.stl.dag
+        tool.print_success("DAG TEST PASSED")
+
+    def test_parallel(self):
+        import stl.example.api.stl.parallel
+        tool.print_success("PARALLEL EVALUATION TEST PASSED")
+
+    def test_profile(self):
+        import stl.example.api.stl.profile
+        tool.print_success("PROFILE TEST PASSED")
+
     def test_weakening(self):
         import stl.example.api.stl.weaken
         tool.print_success("WEAKENING TEST PASSED")
 
+    def test_bench(self):
+        import stl.example.tools.bench
+        tool.print_success("BENCHMARK TEST PASSED")
+
     def test_lexer(self):
         subprocess.call(stl_path + "/stl/example/parsing/lex.sh")
         tool.print_success("LEXER TEST PASSED")